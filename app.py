@@ -8,6 +8,11 @@ import os
 import signal
 import sys
 from src.brandon_bot.chat_interface_simple import create_interface
+from src.brandon_bot.bot import get_resume_bot, warm_up
+from src.brandon_bot.config import config
+from src.brandon_bot.document_processor import close_document_processor
+from src.brandon_bot.metrics import start_metrics_server
+from src.brandon_bot.openai_client import close_openai_clients
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully"""
@@ -19,23 +24,34 @@ def main():
     
     print("🚀 Starting Brandon-Bot...")
     
+    # Load documents and build the agent while Gradio binds its port;
+    # the warm-up also starts hot reload of resume/document updates
+    warm_up()
+    
+    # Latency, token, cache and load metrics for Prometheus
+    if config.ENABLE_METRICS:
+        start_metrics_server(config.METRICS_PORT, config.METRICS_HOST)
+    
     # Create the Gradio interface
     demo = create_interface()
     
     # Detect if running on Hugging Face or locally
     is_huggingface = os.getenv("SPACE_ID") is not None
     
-    if is_huggingface:
-        # Hugging Face Spaces settings
-        demo.launch(
-            share=True,              # Required for HF when localhost not accessible
-            show_error=True,
-            show_api=False
-        )
-    else:
-        # Local development settings
-        signal.signal(signal.SIGINT, signal_handler)
-        try:
+    # Hugging Face stops the Space with SIGTERM; exit through the cleanup below
+    signal.signal(signal.SIGTERM, signal_handler)
+    
+    try:
+        if is_huggingface:
+            # Hugging Face Spaces settings
+            demo.launch(
+                share=True,              # Required for HF when localhost not accessible
+                show_error=True,
+                show_api=False
+            )
+        else:
+            # Local development settings
+            signal.signal(signal.SIGINT, signal_handler)
             demo.launch(
                 server_name="127.0.0.1",
                 server_port=7862,
@@ -43,14 +59,21 @@ def main():
                 show_error=True,
                 show_api=False
             )
-        except KeyboardInterrupt:
-            print("\n👋 Received interrupt signal...")
-        finally:
-            print("🔚 Cleaning up...")
-            try:
-                demo.close()
-            except:
-                pass
+    except KeyboardInterrupt:
+        print("\n👋 Received interrupt signal...")
+    finally:
+        print("🔚 Cleaning up...")
+        # Close the pooled API connections first: Gradio's event loop stops with the server
+        close_openai_clients()
+        close_document_processor()
+        try:
+            demo.close()
+        except:
+            pass
+        # The answer cache writes from a daemon thread; commit what is still queued
+        persistent_cache = get_resume_bot().persistent_cache
+        if persistent_cache is not None:
+            persistent_cache.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Document extraction benchmark for Brandon Resume Bot
+
+Runs in a fresh interpreter with app.py as the entry module, the way the
+Space runs, so spawned extraction workers pay the real cost of
+re-importing it (Gradio and the Agents SDK). Cases:
+    small_files     - 4 one-line .txt files with EXTRACTION_WORKERS=4
+    pdf_sequential  - the PDFs parsed in-process
+    pdf_first_scan  - the PDFs over the worker pool, including its start-up
+    pdf_reload      - the same PDFs again, reusing the pool
+
+Usage:
+    poetry run python benchmarks/bench_extraction.py [--pdfs 8] [--lines 3000] [--workers 4] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Loads app.py as __main__ would be, then times each case on the same processor
+CHILD_TEMPLATE = """
+import os, sys, tempfile, time
+import __main__
+sys.path[:0] = [{root!r}]
+__main__.__file__ = os.path.join({root!r}, "app.py")  # spawned workers re-import this
+import app
+from src.brandon_bot.config import config
+from src.brandon_bot.document_processor import DocumentProcessor
+from tests.test_document_processor import make_pdf
+
+config.ENABLE_EXTRACTION_CACHE = False
+config.EXTRACTION_WORKERS = {workers}
+
+def timed(processor, directory):
+    start = time.perf_counter()
+    processor._scan_directory(directory)
+    return (time.perf_counter() - start) * 1000
+
+with tempfile.TemporaryDirectory() as small, tempfile.TemporaryDirectory() as pdfs:
+    for i in range(4):
+        with open(os.path.join(small, f"note{{i}}.txt"), "w") as file:
+            file.write(f"Brandon note {{i}}.")
+    lines = [f"Line {{n}} of Brandon's project history with Python and SQL." for n in range({lines})]
+    for i in range({pdfs}):
+        with open(os.path.join(pdfs, f"doc{{i}}.pdf"), "wb") as file:
+            file.write(make_pdf(lines))
+
+    processor = DocumentProcessor()
+    print("__CASE__ small_files", timed(processor, small))
+    config.PARALLEL_EXTRACTION_MIN_PDF_BYTES = 2 ** 62
+    print("__CASE__ pdf_sequential", timed(processor, pdfs))
+    config.PARALLEL_EXTRACTION_MIN_PDF_BYTES = 1
+    print("__CASE__ pdf_first_scan", timed(processor, pdfs))
+    print("__CASE__ pdf_reload", timed(processor, pdfs))
+    processor.close()
+"""
+
+
+def run_cases(pdfs: int, lines: int, workers: int) -> dict:
+    """Run every case in one child interpreter and return {case: ms}"""
+    code = CHILD_TEMPLATE.format(root=ROOT_DIR, pdfs=pdfs, lines=lines, workers=workers)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=ROOT_DIR,
+    ).stdout
+    results = {}
+    for line in output.splitlines():
+        if line.startswith("__CASE__"):
+            _, name, elapsed = line.split()
+            results[name] = float(elapsed)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure document extraction under the app entry point")
+    parser.add_argument("--pdfs", type=int, default=8, help="number of generated PDFs")
+    parser.add_argument("--lines", type=int, default=3000, help="text lines per PDF")
+    parser.add_argument("--workers", type=int, default=4, help="EXTRACTION_WORKERS")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    print(f"⏱️  Extraction benchmark under app.py ({args.pdfs} PDFs x {args.lines} lines, {args.workers} workers)")
+    print("-" * 60)
+    results = run_cases(args.pdfs, args.lines, args.workers)
+    for name, elapsed in results.items():
+        print(f"  {name:<16} {elapsed:10.1f}ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version.split()[0], "cpus": os.cpu_count(), "pdfs": args.pdfs,
+                       "lines": args.lines, "workers": args.workers, "cases_ms": results}, file, indent=2)
+        print(f"\n📝 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Privacy filter throughput benchmark for Brandon Resume Bot
+
+Measures the compiled filter on answer-sized texts, both in one pass and
+streamed in token-sized chunks the way chat_function feeds it. Cases:
+    clean        - an ordinary answer with nothing to redact
+    sensitive    - the same answer with an email, phone number, address and confidential term
+    long         - 20 clean answers back to back (~16 KB)
+
+Usage:
+    poetry run python benchmarks/bench_privacy.py [--iterations 2000] [--terms 50] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from brandon_bot.privacy import DEFAULT_CONFIDENTIAL_TERMS, PrivacyFilter  # noqa: E402
+
+CLEAN = (
+    "Brandon has over eight years of experience in manufacturing test engineering and automation. "
+    "At his current role he leads a team of 6 engineers building Python and SQL tooling for "
+    "production line data, and he previously shipped dashboards that cut triage time by 40% in 2021. "
+    "His core skills include Python, SQL, data pipelines, statistical process control, and "
+    "cross-functional program management. He is comfortable presenting to executives and mentoring "
+    "junior engineers, and he enjoys turning messy operational data into decisions. "
+    "Outside of work he builds small machine learning side projects, including this chat bot. "
+)
+SENSITIVE = CLEAN + (
+    "You can reach him at brandon.tom@example.com or (555) 123-4567, and his office is at "
+    "1 Infinite Loop. He also contributed to Project Codename 7 under apple confidential rules. "
+)
+CASES = {"clean": CLEAN, "sensitive": SENSITIVE, "long": CLEAN * 20}
+
+# Roughly one model token per chunk
+CHUNK = re.compile(r"\S+\s*")
+
+
+def run(func, iterations: int) -> float:
+    """Median microseconds per call, over five batches"""
+    batches = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        batches.append((time.perf_counter() - start) / iterations * 1e6)
+    return statistics.median(batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure privacy filter throughput")
+    parser.add_argument("--iterations", type=int, default=2000, help="calls per timed batch")
+    parser.add_argument("--terms", type=int, default=50, help="extra confidential terms to compile in")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    terms = DEFAULT_CONFIDENTIAL_TERMS + tuple(f"Project Codename {i}" for i in range(args.terms))
+    start = time.perf_counter()
+    privacy_filter = PrivacyFilter(terms)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🔒 Privacy filter benchmark ({len(terms)} terms, compiled in {compile_ms:.2f}ms)")
+    print("-" * 72)
+    results = {}
+    for name, text in CASES.items():
+        chunks = CHUNK.findall(text)
+
+        def stream():
+            redactor = privacy_filter.stream()
+            for chunk in chunks:
+                redactor.feed(chunk)
+            redactor.finish()
+
+        one_pass_us = run(lambda: privacy_filter.redact(text), args.iterations)
+        stream_us = run(stream, max(1, args.iterations // 10))
+        results[name] = {
+            "chars": len(text),
+            "chunks": len(chunks),
+            "one_pass_us": one_pass_us,
+            "one_pass_mb_per_s": len(text) / one_pass_us,
+            "stream_us": stream_us,
+            "stream_us_per_chunk": stream_us / len(chunks),
+        }
+        print(f"  {name:<10} {len(text):6d} chars   one pass {one_pass_us:8.1f}µs "
+              f"({results[name]['one_pass_mb_per_s']:6.1f} MB/s)   "
+              f"streamed {stream_us:8.1f}µs ({results[name]['stream_us_per_chunk']:.2f}µs/chunk)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version.split()[0], "terms": len(terms), "compile_ms": compile_ms,
+                       "cases": results}, file, indent=2)
+        print(f"\n📝 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
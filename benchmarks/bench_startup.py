@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for Brandon Resume Bot
+
+Each stage is measured in a fresh interpreter so module caches don't hide
+import costs. Stages:
+    import_config     - `import brandon_bot.config`
+    import_package    - `import brandon_bot`
+    import_interface  - `import brandon_bot.chat_interface_simple` (pulls in gradio)
+    first_bot         - get_resume_bot(): load documents and build the agent
+    create_interface  - build the Gradio Blocks
+
+Usage:
+    poetry run python benchmarks/bench_startup.py [--runs 5] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+STAGES = {
+    "import_config": "import brandon_bot.config",
+    "import_package": "import brandon_bot",
+    "import_interface": "import brandon_bot.chat_interface_simple",
+    "first_bot": "from brandon_bot.bot import get_resume_bot; get_resume_bot()",
+    "create_interface": "from brandon_bot.chat_interface_simple import create_interface; create_interface()",
+}
+
+# Runs the stage in a child process and prints its wall time in milliseconds
+CHILD_TEMPLATE = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+{statement}
+print("__ELAPSED_MS__", (time.perf_counter() - start) * 1000)
+"""
+
+
+def time_stage(statement: str) -> float:
+    """Run one statement in a fresh interpreter and return its duration in ms"""
+    code = CHILD_TEMPLATE.format(src=SRC_DIR, statement=statement)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith("__ELAPSED_MS__"):
+            return float(line.split()[1])
+    raise RuntimeError(f"No timing reported for: {statement}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Brandon-Bot startup time")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per stage")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"⏱️  Startup benchmark ({args.runs} runs per stage)")
+    print("-" * 60)
+    for name, statement in STAGES.items():
+        timings = [time_stage(statement) for _ in range(args.runs)]
+        results[name] = {
+            "median_ms": statistics.median(timings),
+            "min_ms": min(timings),
+            "max_ms": max(timings),
+        }
+        print(f"  {name:<18} median {results[name]['median_ms']:8.1f}ms   "
+              f"min {results[name]['min_ms']:8.1f}ms   max {results[name]['max_ms']:8.1f}ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "stages": results}, file, indent=2)
+        print(f"\n📝 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Concurrent-session load test for Brandon Resume Bot
+
+Simulates N recruiter sessions talking to the bot at the same time. Each
+session runs a short multi-turn script built from the suggested questions,
+and every turn is timed end to end and to its first visible token.
+
+Modes:
+    inprocess - drive chat_function directly (Gradio handler -> bot -> filter)
+    http      - drive a running app through Gradio's HTTP API (/chat endpoint)
+
+By default the in-process mode uses the offline mock backend
+(MODEL_BACKEND=mock), so it runs without an API key or network access.
+Answer caches start cold and suggested-question warm-up is off unless
+--warm is given.
+
+Reports throughput, p50/p95/p99 latency and time to first token, error,
+fallback (answered without the model) and rejection rates and peak RSS. In-process turns are classified from the
+outcome the bot recorded for them; over HTTP only the reply text is
+available.
+
+Usage:
+    poetry run python benchmarks/load_test.py --sessions 50 --turns 3 --json results.json
+    poetry run python benchmarks/load_test.py --mode http --url http://127.0.0.1:7860 --sessions 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Follow-ups that only make sense with conversation memory
+FOLLOW_UPS = [
+    "Can you tell me more about that?",
+    "Which of those is he strongest in?",
+    "How recent is that experience?",
+]
+
+# Bot replies that mean the turn failed or was shed by admission control (HTTP mode)
+ERROR_PREFIXES = ("Error:", "I apologize, but I encountered an error", "I'm sorry, but I'm having trouble",
+                  "I'm having trouble reaching my AI service")
+REJECTION_MARKERS = ("Please try again in a few seconds", "faster than I can keep up")
+
+# Turn outcomes recorded by the bot (spans) that mean the turn failed or was shed
+ERROR_OUTCOMES = ("degraded", "truncated", "error")
+FALLBACK_OUTCOMES = ("fallback",)
+REJECTED_OUTCOMES = ("shed",)
+
+
+class TurnResult:
+    """Timing and outcome of one question"""
+
+    __slots__ = ("session", "latency_ms", "ttft_ms", "outcome")
+
+    def __init__(self, session: int, latency_ms: float, ttft_ms: Optional[float], outcome: str):
+        self.session = session
+        self.latency_ms = latency_ms
+        self.ttft_ms = ttft_ms
+        self.outcome = outcome
+
+
+def classify(response: str) -> str:
+    """ok, error, fallback or rejected, judged from the reply text"""
+    from brandon_bot.bot import TRUNCATED_NOTICE
+    from brandon_bot.fallback import FALLBACK_HEADER, NO_MATCH_ANSWER
+
+    if any(response.startswith(prefix) for prefix in ERROR_PREFIXES) or response.endswith(TRUNCATED_NOTICE.strip()):
+        return "error"
+    if response.startswith(FALLBACK_HEADER) or response == NO_MATCH_ANSWER:
+        return "fallback"
+    if any(marker in response for marker in REJECTION_MARKERS):
+        return "rejected"
+    return "ok"
+
+
+def classify_outcome(outcome: str) -> str:
+    """ok, error, fallback or rejected, judged from the outcome the bot recorded for the turn"""
+    if outcome in ERROR_OUTCOMES:
+        return "error"
+    if outcome in FALLBACK_OUTCOMES:
+        return "fallback"
+    if outcome in REJECTED_OUTCOMES:
+        return "rejected"
+    return "ok"
+
+
+def last_turn_outcome(session_id: str) -> Optional[str]:
+    """Outcome of the session's latest finished turn (a session asks one question at a time)"""
+    from brandon_bot import spans
+
+    for turn in spans.TURN_LOG.recent():
+        if turn.session_id == session_id:
+            return turn.outcome if turn.outcome != "unknown" else None
+    return None
+
+
+def build_script(rng: random.Random, questions: List[str], turns: int) -> List[str]:
+    """Opening suggested question, then a mix of suggestions and follow-ups"""
+    script = [rng.choice(questions)]
+    while len(script) < turns:
+        script.append(rng.choice(FOLLOW_UPS) if rng.random() < 0.3 else rng.choice(questions))
+    return script
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "max": max(values) if values else 0.0,
+    }
+
+
+def peak_rss_mb(server_pid: Optional[int] = None) -> float:
+    """Peak resident memory of this process, or of server_pid when given (Linux)"""
+    if server_pid:
+        try:
+            with open(f"/proc/{server_pid}/status", encoding="utf-8") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def fake_request(index: int) -> SimpleNamespace:
+    """Stand-in for gr.Request: one session hash and client IP per simulated visitor"""
+    return SimpleNamespace(
+        session_hash=f"load-{index}",
+        headers={"x-forwarded-for": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"},
+        client=None,
+    )
+
+
+async def run_session_inprocess(index: int, script: List[str], think_time: float, results: List[TurnResult]):
+    """One simulated visitor calling chat_function like the Gradio frontend does"""
+    from brandon_bot.chat_interface_simple import GREETING, chat_function
+
+    request = fake_request(index)
+    history = [{"role": "assistant", "content": GREETING}]
+    for question in script:
+        start = time.perf_counter()
+        first_token = None
+        async for history, _ in chat_function(question, history, request):
+            if first_token is None and history[-1]["role"] == "assistant" and history[-1]["content"]:
+                first_token = time.perf_counter()
+        end = time.perf_counter()
+        outcome = last_turn_outcome(request.session_hash)
+        results.append(TurnResult(
+            index, (end - start) * 1000,
+            (first_token - start) * 1000 if first_token else None,
+            classify_outcome(outcome) if outcome is not None else classify(history[-1]["content"]),
+        ))
+        await asyncio.sleep(think_time)
+
+
+def _last_assistant_text(chat) -> str:
+    """Latest assistant message from a Chatbot value returned over HTTP"""
+    if not chat:
+        return ""
+    last = chat[-1]
+    if isinstance(last, dict):
+        return last.get("content") or "" if last.get("role") == "assistant" else ""
+    return last[1] or ""
+
+
+def run_session_http(index: int, url: str, script: List[str], think_time: float, results: List[TurnResult]):
+    """One simulated visitor using its own Gradio client (and so its own session hash)"""
+    from brandon_bot.chat_interface_simple import GREETING
+    from gradio_client import Client
+
+    client = Client(url, verbose=False)
+    history = [{"role": "assistant", "content": GREETING}]
+    for question in script:
+        start = time.perf_counter()
+        first_token = None
+        try:
+            job = client.submit(question, history, api_name="/chat")
+            for chat, _ in job:
+                if first_token is None and _last_assistant_text(chat):
+                    first_token = time.perf_counter()
+            history = job.outputs()[-1][0]
+            outcome = classify(_last_assistant_text(history))
+        except Exception as e:
+            print(f"  session {index}: {e}")
+            outcome = "error"
+        end = time.perf_counter()
+        results.append(TurnResult(
+            index, (end - start) * 1000,
+            (first_token - start) * 1000 if first_token else None,
+            outcome,
+        ))
+        time.sleep(think_time)
+
+
+async def run_load(args, scripts: List[List[str]]) -> List[TurnResult]:
+    """Start every session (spread over the ramp-up period) and wait for all of them"""
+    results: List[TurnResult] = []
+    delay = args.ramp / len(scripts) if args.ramp > 0 else 0.0
+    # HTTP sessions block on their client, so each needs its own thread
+    executor = ThreadPoolExecutor(max_workers=len(scripts)) if args.mode == "http" else None
+    loop = asyncio.get_running_loop()
+
+    async def launch(index: int, script: List[str]):
+        await asyncio.sleep(index * delay)
+        if executor is not None:
+            await loop.run_in_executor(executor, run_session_http, index, args.url, script, args.think_time, results)
+        else:
+            await run_session_inprocess(index, script, args.think_time, results)
+
+    try:
+        await asyncio.gather(*(launch(index, script) for index, script in enumerate(scripts)))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return results
+
+
+def configure_environment(args):
+    """Environment for the in-process bot; must run before brandon_bot is imported"""
+    if args.mode != "inprocess":
+        return
+    os.environ["MODEL_BACKEND"] = args.backend
+    os.environ["MOCK_LATENCY_MS"] = str(args.mock_latency_ms)
+    os.environ["MOCK_TOKEN_LATENCY_MS"] = str(args.mock_token_latency_ms)
+    os.environ["MOCK_ERROR_RATE"] = str(args.mock_error_rate)
+    os.environ["MOCK_SEED"] = str(args.seed)
+    os.environ["ENABLE_HOT_RELOAD"] = "false"
+    os.environ["ENABLE_TRACING"] = "true" if args.verbose else "false"
+    os.environ["ENABLE_SUGGESTION_WARMUP"] = "true" if args.warm else "false"
+    # Turn outcomes classify the in-process results; keep every turn of the run
+    os.environ["ENABLE_TURN_TIMINGS"] = "true"
+    os.environ["TURN_LOG_SIZE"] = str(max(500, args.sessions * args.turns))
+    # Start from cold caches so runs are comparable
+    os.environ["ENABLE_PERSISTENT_CACHE"] = "false"
+    if args.no_cache:
+        os.environ["ENABLE_ANSWER_CACHE"] = "false"
+    os.environ.setdefault("CACHE_DIR", os.path.join(tempfile.gettempdir(), "brandon-bot-load-test"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test Brandon-Bot with concurrent sessions")
+    parser.add_argument("--mode", choices=["inprocess", "http"], default="inprocess")
+    parser.add_argument("--url", default="http://127.0.0.1:7860", help="app URL for --mode http")
+    parser.add_argument("--server-pid", type=int, help="report peak RSS of this server process (http mode)")
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent simulated sessions")
+    parser.add_argument("--turns", type=int, default=3, help="questions per session")
+    parser.add_argument("--ramp", type=float, default=0.0, help="seconds over which sessions start")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds between a session's questions")
+    parser.add_argument("--seed", type=int, default=42, help="seed for scripts and mock latencies")
+    parser.add_argument("--backend", choices=["mock", "openai"], default="mock", help="model backend (in-process)")
+    parser.add_argument("--mock-latency-ms", type=float, default=300.0)
+    parser.add_argument("--mock-token-latency-ms", type=float, default=15.0)
+    parser.add_argument("--mock-error-rate", type=float, default=0.0)
+    parser.add_argument("--no-cache", action="store_true", help="disable the answer cache")
+    parser.add_argument("--warm", action="store_true", help="pre-answer suggested questions before the run")
+    parser.add_argument("--verbose", action="store_true", help="keep the bot's per-turn trace output")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    sys.path.insert(0, SRC_DIR)
+    from brandon_bot.bot import SUGGESTED_QUESTIONS, get_resume_bot
+
+    rng = random.Random(args.seed)
+    scripts = [build_script(rng, list(SUGGESTED_QUESTIONS), args.turns) for _ in range(args.sessions)]
+
+    if args.mode == "inprocess":
+        bot = get_resume_bot()
+        if args.warm and bot._warmup_future is not None:
+            bot._warmup_future.result()
+
+    print(f"🚦 Load test: {args.sessions} sessions x {args.turns} turns ({args.mode}, "
+          f"{args.backend if args.mode == 'inprocess' else args.url})")
+    start = time.perf_counter()
+    results = asyncio.run(run_load(args, scripts))
+    duration = time.perf_counter() - start
+
+    latencies = [r.latency_ms for r in results]
+    first_tokens = [r.ttft_ms for r in results if r.ttft_ms is not None]
+    outcomes = {outcome: sum(1 for r in results if r.outcome == outcome) for outcome in ("ok", "error", "fallback", "rejected")}
+    report = {
+        "mode": args.mode,
+        "backend": args.backend if args.mode == "inprocess" else "remote",
+        "sessions": args.sessions,
+        "turns_per_session": args.turns,
+        "seed": args.seed,
+        "python": sys.version.split()[0],
+        "duration_s": duration,
+        "requests": len(results),
+        "throughput_rps": len(results) / duration if duration else 0.0,
+        "latency_ms": summarize(latencies),
+        "ttft_ms": summarize(first_tokens),
+        "outcomes": outcomes,
+        "error_rate": outcomes["error"] / len(results) if results else 0.0,
+        "fallback_rate": outcomes["fallback"] / len(results) if results else 0.0,
+        "rejection_rate": outcomes["rejected"] / len(results) if results else 0.0,
+        "peak_rss_mb": peak_rss_mb(args.server_pid if args.mode == "http" else None),
+    }
+    if args.mode == "inprocess":
+        report["answer_cache"] = get_resume_bot().answer_cache.stats()
+        report["admission"] = get_resume_bot().admission.stats()
+
+    print("-" * 60)
+    print(f"  requests     {report['requests']} in {duration:.2f}s ({report['throughput_rps']:.1f} req/s)")
+    for name in ("latency_ms", "ttft_ms"):
+        stats = report[name]
+        print(f"  {name:<12} p50 {stats['p50']:8.1f}   p95 {stats['p95']:8.1f}   p99 {stats['p99']:8.1f}")
+    print(f"  outcomes     {outcomes}")
+    print(f"  peak RSS     {report['peak_rss_mb']:.1f} MB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"\n📝 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
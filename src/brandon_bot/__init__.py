@@ -4,10 +4,24 @@ brandon-bot: AI chat interface for interviews using OpenAI and Gradio
 
 __version__ = "0.1.0"
 
-from .bot import resume_bot
-from .document_processor import document_processor
-from .chat_interface_simple import create_interface
+import importlib
+
 from .config import config
 # All analytics handled by OpenAI natively
 
+# Heavy objects are imported on first access so `import brandon_bot` stays cheap
+_LAZY_ATTRIBUTES = {
+    "resume_bot": ".bot",
+    "document_processor": ".document_processor",
+    "create_interface": ".chat_interface_simple",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["resume_bot", "document_processor", "create_interface", "config"]
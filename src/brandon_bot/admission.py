@@ -0,0 +1,197 @@
+"""
+Admission control for Brandon Resume Bot
+
+Keeps a burst of visitors from exhausting the OpenAI rate limits:
+
+- a global limit on concurrent model calls, with a bounded wait queue and a
+  deadline for queued requests
+- token buckets per session and per client IP
+- fast rejection when overloaded, so the caller can fall back to a cached
+  answer instead of everyone getting the generic error string
+
+The concurrency limiter uses a thread lock plus per-waiter futures instead
+of asyncio.Semaphore, so one limit holds across the Gradio event loop and
+the bot's background loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from . import spans
+
+
+class Overloaded(Exception):
+    """Raised when a request is not admitted; reason is a short metrics label"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class TokenBucket:
+    """Classic token bucket: rate tokens per second, up to capacity"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, now: Optional[float] = None) -> bool:
+        """Take one token if available"""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class RateLimiter:
+    """One token bucket per key (session id or IP), bounded in number of keys"""
+
+    def __init__(self, per_minute: float, burst: int, max_keys: int = 10000):
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key: Optional[str]) -> bool:
+        """True if key may make another request now (unknown keys and disabled limits always pass)"""
+        if not key or self.rate <= 0:
+            return True
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                # Buckets of idle keys are full anyway - forgetting them is free
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket.try_acquire()
+
+
+class ConcurrencyLimiter:
+    """Cross-event-loop counting semaphore with a bounded FIFO wait queue"""
+
+    def __init__(self, limit: int, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float):
+        """Wait for a slot; raises Overloaded if the queue is full or the deadline passes"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            if len(self._waiters) >= self.max_queue:
+                raise Overloaded("queue_full")
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    granted = False
+                else:
+                    granted = waiter[1].done() and not waiter[1].cancelled()
+            # A slot handed over just as we gave up must be passed on
+            if granted:
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise Overloaded("queue_timeout") from None
+            raise
+
+    def release(self):
+        """Free a slot, handing it directly to the oldest waiter if any"""
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            loop, future = self._waiters.popleft()
+        loop.call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future):
+        if future.done():
+            # The waiter timed out or was cancelled in the meantime
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class AdmissionController:
+    """Rate limits plus the global concurrency limit, with counters for metrics"""
+
+    def __init__(self, max_concurrent: int = 8, max_queue: int = 32, queue_timeout: float = 10.0,
+                 session_per_minute: float = 10, session_burst: int = 5,
+                 ip_per_minute: float = 30, ip_burst: int = 10):
+        self.queue_timeout = queue_timeout
+        self.limiter = ConcurrencyLimiter(max_concurrent, max_queue)
+        self.session_limits = RateLimiter(session_per_minute, session_burst)
+        self.ip_limits = RateLimiter(ip_per_minute, ip_burst)
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {}
+        self.peak_active = 0
+        self.peak_queued = 0
+
+    def check_rate(self, session_id: Optional[str], client_ip: Optional[str]):
+        """Raise Overloaded if the session or client IP is over its rate"""
+        if not self.session_limits.allow(session_id):
+            self._reject("session_rate")
+        if not self.ip_limits.allow(client_ip):
+            self._reject("ip_rate")
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the global model-call slots for the duration of the block"""
+        if self.limiter.active >= self.limiter.limit:
+            self.peak_queued = max(self.peak_queued, self.limiter.queued + 1)
+        try:
+            with spans.span("queue"):
+                await self.limiter.acquire(self.queue_timeout)
+        except Overloaded as e:
+            self._reject(e.reason)
+        self.admitted += 1
+        self.peak_active = max(self.peak_active, self.limiter.active)
+        try:
+            yield
+        finally:
+            self.limiter.release()
+
+    def _reject(self, reason: str):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        raise Overloaded(reason)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and gauges for metrics"""
+        stats = {
+            "active": self.limiter.active,
+            "queued": self.limiter.queued,
+            "limit": self.limiter.limit,
+            "admitted": self.admitted,
+            "peak_active": self.peak_active,
+            "peak_queued": self.peak_queued,
+        }
+        for reason, count in self.rejected.items():
+            stats[f"rejected_{reason}"] = count
+        return stats
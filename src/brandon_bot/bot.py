@@ -10,71 +10,363 @@ This module contains the main ResumeBot class that:
 """
 
 import asyncio
+import contextlib
+import os
+import threading
 import time
-import uuid
-from typing import List, Dict, Optional
-from agents import Agent, Runner, trace
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Optional
+from .admission import AdmissionController, Overloaded
+from .cache import AnswerCache, make_cache_key
 from .config import config
-from .document_processor import document_processor
+from .document_processor import get_document_processor
+from .fallback import get_fallback_responder
+from .intents import get_intent_classifier
+from .knowledge import KnowledgeSnapshot, compute_fingerprint
+from . import metrics
+from .resilience import CIRCUIT_STATES, ModelTimeout, ModelUnavailable, ResiliencePolicy
+from .sessions import SessionManager, SessionState
+from .singleflight import SingleFlight
+from . import spans
+from .watcher import DataWatcher
+
+if TYPE_CHECKING:
+    from agents import Agent, RunConfig, RunResultStreaming
+
+# Appended when a streamed answer stalls part-way and can't be retried
+TRUNCATED_NOTICE = "\n\n_[This answer was cut off because my AI service stopped responding. Please ask again for the rest.]_"
+
+# Opening questions offered to visitors (and pre-answered for every snapshot)
+SUGGESTED_QUESTIONS = (
+    "What is Brandon's professional background?",
+    "What programming languages does Brandon know?",
+    "Tell me about Brandon's work experience",
+    "What projects has Brandon worked on?",
+    "What are Brandon's technical skills?",
+    "What education does Brandon have?",
+    "Has Brandon worked with machine learning?",
+    "What frameworks and tools does Brandon use?",
+)
 
 
 class ResumeBot:
     """Main bot class for handling conversations about Brandon's resume using OpenAI Agents SDK"""
     
     def __init__(self):
-        self.agent = None
-        self.conversation_history = []
+        # Documents, indexes and agent are swapped in as one immutable snapshot
+        self.snapshot = KnowledgeSnapshot.empty()
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[DataWatcher] = None
+        # Answers to context-free first turns, keyed by question + knowledge fingerprint
+        self.answer_cache = AnswerCache(
+            max_entries=config.ANSWER_CACHE_SIZE,
+            ttl_seconds=config.ANSWER_CACHE_TTL_SECONDS,
+        )
+        # Second tier that also serves paraphrases of cached questions
+        self.semantic_cache = None
+        if config.ENABLE_SEMANTIC_CACHE:
+            from .semantic_cache import SemanticCache
+            self.semantic_cache = SemanticCache(
+                capacity=config.SEMANTIC_CACHE_SIZE,
+                threshold=config.SEMANTIC_CACHE_THRESHOLD,
+                ttl_seconds=config.ANSWER_CACHE_TTL_SECONDS,
+                dim=config.EMBEDDING_DIM,
+            )
+        # SQLite-backed tier shared with other workers and kept across restarts
+        self.persistent_cache = None
+        if config.ENABLE_PERSISTENT_CACHE and config.CACHE_DIR:
+            from .persistent_cache import PersistentAnswerCache
+            try:
+                self.persistent_cache = PersistentAnswerCache(
+                    os.path.join(config.CACHE_DIR, "answers.sqlite3"),
+                    max_entries=config.PERSISTENT_CACHE_SIZE,
+                    ttl_seconds=config.ANSWER_CACHE_TTL_SECONDS,
+                )
+            except Exception as e:
+                print(f"⚠️  Persistent answer cache unavailable: {e}")
+        # One shared agent and corpus; conversation state lives per session
+        self.sessions = SessionManager(
+            max_sessions=config.MAX_SESSIONS,
+            ttl_seconds=config.SESSION_TTL_SECONDS,
+            max_exchanges=config.MAX_CONVERSATION_LENGTH,
+            max_session_bytes=config.MAX_SESSION_BYTES,
+        )
+        # Default session used by the CLI and scripts that don't pass a session id
         self.session_id = None
-        self.conversation_trace = None
-        self.trace_context = None
-        self._load_documents()
-        self._initialize_agent()
+        # Background event loop for the synchronous wrapper (created lazily)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        # Limits on concurrent model calls and per-session / per-IP request rates
+        self.admission = AdmissionController(
+            max_concurrent=config.MAX_CONCURRENT_REQUESTS,
+            max_queue=config.MAX_QUEUED_REQUESTS,
+            queue_timeout=config.QUEUE_TIMEOUT_SECONDS,
+            session_per_minute=config.SESSION_RATE_PER_MINUTE,
+            session_burst=config.SESSION_BURST,
+            ip_per_minute=config.IP_RATE_PER_MINUTE,
+            ip_burst=config.IP_BURST,
+        )
+        # Deadlines, retries, hedging and a circuit breaker around every model call
+        self.resilience = ResiliencePolicy(
+            attempt_timeout=config.MODEL_ATTEMPT_TIMEOUT_SECONDS,
+            idle_timeout=config.MODEL_STREAM_IDLE_SECONDS,
+            deadline=config.MODEL_DEADLINE_SECONDS,
+            max_retries=config.MODEL_MAX_RETRIES,
+            retry_base=config.MODEL_RETRY_BASE_SECONDS,
+            retry_max=config.MODEL_RETRY_MAX_SECONDS,
+            hedge=config.ENABLE_HEDGING,
+            hedge_quantile=config.HEDGE_QUANTILE,
+            hedge_min_samples=config.HEDGE_MIN_SAMPLES,
+            hedge_min_delay=config.HEDGE_MIN_DELAY_SECONDS,
+            failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+            reset_seconds=config.CIRCUIT_RESET_SECONDS,
+        )
+        # Identical first-turn questions in flight at once share one model call
+        self.flights = SingleFlight()
+        # Background task answering the suggested questions for the current snapshot
+        self._warmup_future = None
+        self._register_metrics()
+        self.reload_knowledge()
+    
+    def _register_metrics(self):
+        """Expose cache, admission and session state through scrape-time callbacks"""
+        def cache_stats(field):
+            def collect():
+                tiers = {"exact": self.answer_cache, "semantic": self.semantic_cache,
+                         "persistent": self.persistent_cache}
+                return {(tier,): cache.stats()[field] for tier, cache in tiers.items()
+                        if cache is not None and (tier != "persistent" or field != "entries")}
+            return collect
+        
+        registry = metrics.REGISTRY
+        registry.callback("brandon_bot_cache_hits_total", "Answer cache hits by tier", "counter",
+                          cache_stats("hits"), ["tier"])
+        registry.callback("brandon_bot_cache_misses_total", "Answer cache misses by tier", "counter",
+                          cache_stats("misses"), ["tier"])
+        registry.callback("brandon_bot_cache_entries", "Answers held in memory by tier", "gauge",
+                          cache_stats("entries"), ["tier"])
+        registry.callback("brandon_bot_in_flight_requests", "Model calls currently running", "gauge",
+                          lambda: {(): self.admission.limiter.active})
+        registry.callback("brandon_bot_queued_requests", "Requests waiting for a model slot", "gauge",
+                          lambda: {(): self.admission.limiter.queued})
+        registry.callback("brandon_bot_rejected_requests_total", "Requests shed by admission control", "counter",
+                          lambda: {(reason,): count for reason, count in self.admission.rejected.items()}, ["reason"])
+        registry.callback("brandon_bot_coalesced_requests_total", "Requests that joined an identical in-flight call",
+                          "counter", lambda: {(): self.flights.coalesced})
+        registry.callback("brandon_bot_active_sessions", "Conversation sessions held in memory", "gauge",
+                          lambda: {(): len(self.sessions)})
+        registry.callback("brandon_bot_model_retries_total", "Retried model-call attempts by failure", "counter",
+                          lambda: {(reason,): count for reason, count in self.resilience.retries.items()}, ["reason"])
+        registry.callback("brandon_bot_hedged_requests_total", "Hedged model calls fired, and won by the hedge",
+                          "counter", lambda: {(outcome,): count for outcome, count in self.resilience.hedges.items()},
+                          ["outcome"])
+        registry.callback("brandon_bot_circuit_state", "Model API circuit breaker state (1 = current)", "gauge",
+                          lambda: {(state,): int(self.resilience.breaker.state == state) for state in CIRCUIT_STATES},
+                          ["state"])
+    
+    @property
+    def agent(self) -> Optional["Agent"]:
+        """Agent of the current knowledge snapshot"""
+        return self.snapshot.agent
+    
+    @property
+    def conversation_history(self) -> List[Dict[str, str]]:
+        """Conversation history of the default session"""
+        return self._get_session(None).conversation_history
     
-    def _initialize_agent(self):
-        """Initialize OpenAI Agent"""
+    @conversation_history.setter
+    def conversation_history(self, history: List[Dict[str, str]]):
+        self._get_session(None).conversation_history = history
+    
+    def _get_session(self, session_id: Optional[str]) -> SessionState:
+        """Return the state for session_id, falling back to the default session"""
+        if session_id is None:
+            if self.session_id is None:
+                self.session_id = self.sessions.start().session_id
+            session_id = self.session_id
+        return self.sessions.get_or_create(session_id)
+    
+    def _create_agent(self, instructions: str) -> Optional["Agent"]:
+        """Create the OpenAI Agent for a set of instructions"""
         try:
             config.validate()
             
-            # Build the system instructions with document context
-            instructions = self._build_system_instructions()
+            # The Agents SDK is only imported once an agent is actually needed
+            from agents import Agent
+            
+            model = config.MODEL_NAME
+            if config.MODEL_BACKEND == "mock":
+                # Offline backend: local answers, and no trace export without an API key
+                from agents import set_tracing_disabled
+                from .mock_model import get_mock_provider
+                set_tracing_disabled(True)
+                model = get_mock_provider().get_model(config.MODEL_NAME)
             
             # Create the agent with OpenAI Agents SDK
-            self.agent = Agent(
+            return Agent(
                 name=config.BOT_NAME,
                 instructions=instructions,
-                model=config.MODEL_NAME,
+                model=model,
                 # SDK handles API key automatically from OPENAI_API_KEY env var
             )
             
         except Exception as e:
             print(f"Error initializing OpenAI Agent: {e}")
-            self.agent = None
+            return None
+    
+    def reload_knowledge(self) -> KnowledgeSnapshot:
+        """
+        Load documents and atomically swap in a new knowledge snapshot
+        
+        Only new or modified files are re-extracted and re-indexed. Requests
+        already in flight keep using the snapshot they started with.
+        """
+        start_time = time.perf_counter()
+        with self._reload_lock:
+            self._load_documents()
+            processor = get_document_processor()
+            documents = processor.documents
+            instructions = self._build_system_instructions(documents)
+            snapshot = KnowledgeSnapshot(
+                documents=documents,
+                chunks=processor.chunks,
+                index=processor.index,
+                vector_index=processor.vector_index,
+                instructions=instructions,
+                agent=self._create_agent(instructions),
+                fingerprint=compute_fingerprint(documents, config.SYSTEM_PROMPT, config.MODEL_NAME, config.MODEL_BACKEND),
+            )
+            previous, self.snapshot = self.snapshot, snapshot
+            
+            # Cached answers for the old knowledge can never be hit again
+            if snapshot.fingerprint != previous.fingerprint:
+                self.answer_cache.clear()
+                if self.semantic_cache is not None:
+                    self.semantic_cache.clear()
+                if self.persistent_cache is not None:
+                    if previous.fingerprint:
+                        self.persistent_cache.discard_fingerprint(previous.fingerprint)
+                    self._seed_semantic_cache(snapshot)
+        
+        metrics.KNOWLEDGE_RELOAD.observe(time.perf_counter() - start_time)
+        metrics.DOCUMENTS_LOADED.set(len(snapshot.documents))
+        if previous.documents:
+            print(f"♻️  Swapped knowledge snapshot v{previous.version} -> v{snapshot.version}")
+        if snapshot.fingerprint != previous.fingerprint:
+            self._schedule_suggestion_warmup(snapshot)
+        return snapshot
+    
+    def _schedule_suggestion_warmup(self, snapshot: KnowledgeSnapshot):
+        """Answer the suggested questions for a new snapshot in the background"""
+        if not config.ENABLE_SUGGESTION_WARMUP or not config.ENABLE_ANSWER_CACHE or not snapshot.agent:
+            return
+        if self._warmup_future is not None:
+            self._warmup_future.cancel()
+        self._warmup_future = asyncio.run_coroutine_threadsafe(
+            self.warm_suggested_answers(snapshot), self._get_background_loop()
+        )
+    
+    async def warm_suggested_answers(self, snapshot: KnowledgeSnapshot) -> int:
+        """
+        Precompute cached answers to the suggested questions for a snapshot
+        
+        Questions already answered for this knowledge (e.g. by another worker
+        through the persistent cache) are skipped. Stops early once a newer
+        snapshot has been swapped in.
+        
+        Returns:
+            Number of questions answered by the model
+        """
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, config.SUGGESTION_WARMUP_CONCURRENCY))
+        
+        async def warm(question: str) -> bool:
+            cache_key = make_cache_key(question, snapshot.fingerprint)
+            async with semaphore:
+                if self.snapshot is not snapshot or cache_key in self.answer_cache:
+                    return False
+                if self.persistent_cache is not None:
+                    stored = self.persistent_cache.get(cache_key)
+                    if stored is not None:
+                        self.answer_cache.put(cache_key, stored)
+                        return False
+                # A throwaway session keeps the answer context-free, like a first turn
+                session = SessionState(f"warmup-v{snapshot.version}", max_exchanges=1, max_bytes=config.MAX_SESSION_BYTES)
+                try:
+                    answer = await self._run_agent(snapshot, session, question, "Suggested question warm-up")
+                except Exception as e:
+                    print(f"Error warming suggested question {question!r}: {e}")
+                    return False
+                if self.snapshot is not snapshot:
+                    return False
+                self._store_cached_answer(snapshot, question, cache_key, answer)
+                return True
+        
+        results = await asyncio.gather(*(warm(question) for question in self.get_suggested_questions()))
+        answered = sum(results)
+        if answered:
+            print(f"🔥 Warmed {answered} suggested answers for snapshot v{snapshot.version} "
+                  f"in {time.perf_counter() - start_time:.1f}s")
+        return answered
+    
+    def _seed_semantic_cache(self, snapshot: KnowledgeSnapshot):
+        """Load answers other workers (or earlier runs) stored for this knowledge"""
+        if self.semantic_cache is None or not snapshot.fingerprint:
+            return
+        stored = self.persistent_cache.recent(snapshot.fingerprint, self.semantic_cache.capacity)
+        # Oldest first, so the most recently used answers are evicted last
+        for question, answer in reversed(stored):
+            self.semantic_cache.put(question, snapshot.fingerprint, answer)
+        if stored:
+            print(f"💾 Warmed semantic cache with {len(stored)} stored answers")
+    
+    def start_watching(self):
+        """Start the background watcher that hot-reloads changed documents"""
+        if not config.ENABLE_HOT_RELOAD:
+            return
+        if self._watcher is None:
+            self._watcher = DataWatcher(config.DATA_DIR, self.reload_knowledge, config.RELOAD_INTERVAL_SECONDS)
+        self._watcher.start()
+    
+    def stop_watching(self):
+        """Stop the background document watcher"""
+        if self._watcher is not None:
+            self._watcher.stop()
     
     def _load_documents(self):
         """Load all resume documents"""
         try:
-            documents = document_processor.load_all_documents()
+            documents = get_document_processor().load_all_documents()
             print(f"Loaded documents: {list(documents.keys())}")
         except Exception as e:
             print(f"Error loading documents: {e}")
     
-    def _build_system_instructions(self) -> str:
-        """Build the system instructions with structured document context"""
+    def _build_system_instructions(self, documents: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build the system instructions
+        
+        With retrieval enabled this is a compact static block - the relevant
+        document excerpts are sent with each question by _build_turn_input.
+        Otherwise every document is embedded in the instructions.
+        """
         base_instructions = config.SYSTEM_PROMPT
         
         # Get individual documents for better structure
-        documents = document_processor.documents
-        if documents:
+        if documents is None:
+            documents = get_document_processor().documents
+        if documents and config.ENABLE_RETRIEVAL:
+            base_instructions += "\n\n=== BRANDON'S PROFESSIONAL INFORMATION ===\n"
+            base_instructions += f"Available documents: {', '.join(documents.keys())}\n"
+            base_instructions += "With each question you will receive the most relevant excerpts from these documents. "
+            base_instructions += "Answer from those excerpts and reference specific details. Be specific about Brandon's experience, skills, and achievements. "
+            base_instructions += "If the excerpts don't cover the question, say so rather than guessing."
+            
+            print(f"📄 Indexed {len(documents)} documents for retrieval ({len(get_document_processor().chunks)} chunks)")
+        elif documents:
             base_instructions += "\n\n=== BRANDON'S PROFESSIONAL INFORMATION ===\n"
             
             # Add each document with clear labeling
             for doc_name, content in documents.items():
-                if "resume" in doc_name.lower() or "cv" in doc_name.lower():
-                    base_instructions += f"\n📄 RESUME CONTENT:\n{content}\n"
-                elif "context" in doc_name.lower():
-                    base_instructions += f"\n💼 ADDITIONAL PROFESSIONAL CONTEXT:\n{content}\n"
-                else:
-                    base_instructions += f"\n📋 {doc_name.upper()}:\n{content}\n"
+                base_instructions += f"\n{self._document_label(doc_name)}:\n{content}\n"
             
             base_instructions += "\n=== END OF PROFESSIONAL INFORMATION ===\n"
             base_instructions += "\nWhen answering questions, reference specific details from the above information. Be specific about Brandon's experience, skills, and achievements."
@@ -86,144 +378,560 @@ class ResumeBot:
         print(f"🤖 Final prompt length: {len(base_instructions)} characters")
         return base_instructions
     
-    async def _generate_response_async(self, user_message: str) -> str:
+    @staticmethod
+    def _document_label(doc_name: str) -> str:
+        """Human-readable label for a source document"""
+        if "resume" in doc_name.lower() or "cv" in doc_name.lower():
+            return "📄 RESUME CONTENT"
+        if "context" in doc_name.lower():
+            return "💼 ADDITIONAL PROFESSIONAL CONTEXT"
+        return f"📋 {doc_name.upper()}"
+    
+    def _build_turn_input(self, user_message: str, snapshot: Optional[KnowledgeSnapshot] = None,
+                          session: Optional[SessionState] = None):
+        """
+        Build the Runner input for one question
+        
+        The input is, in order: the top-k relevant document chunks (with
+        retrieval enabled), the session's conversation memory - a summary of
+        older turns plus recent turns up to MEMORY_TOKEN_BUDGET - and the
+        user's question.
+        """
+        with spans.span("prompt"):
+            return self._assemble_turn_input(user_message, snapshot or self.snapshot, session)
+    
+    def _assemble_turn_input(self, user_message: str, snapshot: KnowledgeSnapshot,
+                             session: Optional[SessionState]):
+        items = []
+        
+        if config.ENABLE_RETRIEVAL and snapshot.chunks:
+            # Follow-ups like "tell me more" retrieve against the previous question too
+            query = user_message
+            previous_question = session.memory.last_user_message() if session else None
+            if previous_question:
+                query = f"{previous_question} {user_message}"
+            
+            with spans.span("retrieval"):
+                chunks = snapshot.search(query, top_k=config.RETRIEVAL_TOP_K)
+            excerpts = ["=== RELEVANT EXCERPTS FROM BRANDON'S DOCUMENTS ==="]
+            for chunk in chunks:
+                excerpts.append(f"\n{self._document_label(chunk.doc_name)} ({chunk.section or 'General'}):\n{chunk.text}")
+            excerpts.append("\n=== END OF EXCERPTS ===")
+            items.append({"role": "system", "content": "\n".join(excerpts)})
+        
+        if session is not None:
+            items.extend(session.memory.input_items(config.MEMORY_TOKEN_BUDGET))
+        
+        if not items:
+            return user_message
+        return items + [{"role": "user", "content": user_message}]
+    
+    async def _run_agent(self, snapshot: KnowledgeSnapshot, session: SessionState,
+                         user_message: str, trace_name: str) -> str:
+        """Run the snapshot's agent for one question and record the exchange"""
+        from agents import Runner, trace
+        
+        turn_input = self._build_turn_input(user_message, snapshot, session)
+        run_config = self._run_config()
+        with trace(trace_name, group_id=session.session_id), spans.span("model"):
+            # Retried and hedged attempts are side-effect free; only the winner is recorded below
+            result = await self.resilience.call(
+                lambda: Runner.run(snapshot.agent, turn_input, run_config=run_config))
+        
+        # Extract the response
+        bot_response = result.final_output.strip()
+        
+        # Update this session's history and token counters
+        session.record_exchange(user_message, bot_response)
+        self._record_usage(session, result.context_wrapper.usage)
+        return bot_response
+    
+    @staticmethod
+    def _run_config() -> "RunConfig":
+        """Run settings that resolve model names against the shared, pooled OpenAI client"""
+        from agents import RunConfig
+        from .openai_client import get_openai_provider
+        return RunConfig(model_provider=get_openai_provider())
+    
+    @staticmethod
+    def _record_usage(session: SessionState, usage):
+        """Add a run's token usage to the session and the process-wide counters"""
+        session.record_usage(usage.input_tokens, usage.output_tokens)
+        metrics.TOKENS.inc(usage.input_tokens, direction="input")
+        metrics.TOKENS.inc(usage.output_tokens, direction="output")
+    
+    async def _stream_agent(self, snapshot: KnowledgeSnapshot, session: SessionState,
+                            user_message: str) -> AsyncIterator[str]:
+        """Stream the snapshot's agent for one question; the exchange is recorded once complete"""
+        from agents import Runner, trace
+        
+        turn_input = self._build_turn_input(user_message, snapshot, session)
+        run_config = self._run_config()
+        finished = []
+        
+        def attempt():
+            return self._text_deltas(Runner.run_streamed(snapshot.agent, turn_input, run_config=run_config),
+                                     finished)
+        
+        chunks = []
+        with trace(session.trace_name, group_id=session.session_id):
+            async for delta in self.resilience.stream(attempt):
+                chunks.append(delta)
+                yield delta
+        
+        bot_response = "".join(chunks).strip()
+        session.record_exchange(user_message, bot_response)
+        self._record_usage(session, finished[-1].context_wrapper.usage)
+    
+    @staticmethod
+    async def _text_deltas(result: "RunResultStreaming", finished: List["RunResultStreaming"]) -> AsyncIterator[str]:
+        """Text deltas of one streamed run; a run abandoned part-way (lost hedge, timeout) is cancelled"""
+        from openai.types.responses import ResponseTextDeltaEvent
+        
+        try:
+            async for event in result.stream_events():
+                if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                    yield event.data.delta
+            finished.append(result)
+        finally:
+            if not result.is_complete:
+                result.cancel()
+    
+    def _answer_cache_key(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str) -> Optional[str]:
+        """Cache key for context-free first turns; None when the answer must not be cached"""
+        if not config.ENABLE_ANSWER_CACHE or session.memory.total_exchanges or session.memory.turns:
+            return None
+        return make_cache_key(user_message, snapshot.fingerprint)
+    
+    def _serve_cached_answer(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str,
+                             cache_key: Optional[str]) -> Optional[str]:
+        """Return a cached answer (recording the exchange), or None on a miss"""
+        if cache_key is None:
+            return None
+        answer = self.answer_cache.get(cache_key)
+        tier = "Answer"
+        if answer is None and self.persistent_cache is not None:
+            answer = self.persistent_cache.get(cache_key)
+            tier = "Persistent"
+            if answer is not None:
+                self.answer_cache.put(cache_key, answer)
+        if answer is None and self.semantic_cache is not None:
+            answer = self.semantic_cache.get(user_message, snapshot.fingerprint)
+            tier = "Semantic"
+        if answer is not None:
+            session.record_exchange(user_message, answer)
+            if config.ENABLE_TRACING:
+                print(f"[TRACE] {tier} cache hit ({self.answer_cache.stats()['hit_rate']:.0%} exact hit rate)")
+        return answer
+    
+    def _store_cached_answer(self, snapshot: KnowledgeSnapshot, user_message: str, cache_key: Optional[str], answer: str):
+        """Remember a first-turn answer in every cache tier"""
+        if cache_key is None or not answer:
+            return
+        self.answer_cache.put(cache_key, answer)
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(user_message, snapshot.fingerprint, answer)
+        if self.persistent_cache is not None:
+            self.persistent_cache.put(cache_key, snapshot.fingerprint, user_message, answer)
+    
+    def _admit(self, session: SessionState, client_ip: Optional[str]):
+        """Apply the per-session and per-IP rate limits to a request that needs the model"""
+        if config.ENABLE_ADMISSION_CONTROL:
+            with spans.span("admission"):
+                self.admission.check_rate(session.session_id, client_ip)
+    
+    def _model_slot(self):
+        """Context manager holding a global model-call slot (no-op when admission control is off)"""
+        if config.ENABLE_ADMISSION_CONTROL:
+            return self.admission.slot()
+        return contextlib.nullcontext()
+    
+    def _overloaded_answer(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str,
+                           reason: str) -> str:
+        """
+        Best answer available without the model
+        
+        A cached answer for an opening question (one may have landed while
+        this turn waited), else - unless the visitor is just asking too
+        fast - an extractive answer from the documents, else a retry hint.
+        Follow-ups never take cached answers: those were given without
+        context, and "tell me more about that" depends on what came before.
+        A turn answered either way is labeled "fallback" in its timings.
+        """
+        if config.ENABLE_TRACING:
+            print(f"[TRACE] Answering without the model ({reason})")
+        cache_key = self._answer_cache_key(snapshot, session, user_message)
+        if cache_key is not None:
+            cached = self._serve_cached_answer(snapshot, session, user_message, cache_key)
+            if cached is not None:
+                spans.set_outcome("fallback")
+                return cached
+        if reason in ("session_rate", "ip_rate"):
+            return "You're asking questions a little faster than I can keep up with. Please wait a few seconds and try again."
+        fallback = self._fallback_answer(snapshot, session, user_message, reason)
+        if fallback is not None:
+            spans.set_outcome("fallback")
+            return fallback
+        if reason not in ("queue_full", "queue_timeout"):
+            # ModelUnavailable: the API timed out or failed, or the circuit is open
+            return "I'm having trouble reaching my AI service right now. Please try again in a minute."
+        return "I'm getting a lot of questions right now. Please try again in a few seconds."
+    
+    async def _coalesced_turn(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str,
+                              cache_key: str, streaming: bool) -> AsyncIterator[str]:
+        """
+        Answer a cacheable first turn through a call shared with identical concurrent questions
+        
+        The shared call runs in a throwaway session (the input of a
+        context-free first turn doesn't depend on the session), caches its
+        answer once, and every subscriber records the exchange in its own
+        session. Token usage is attributed to the request that started it.
+        """
+        flight_session = SessionState(f"flight-v{snapshot.version}", max_exchanges=1,
+                                      max_bytes=config.MAX_SESSION_BYTES)
+        
+        async def produce() -> AsyncIterator[str]:
+            # Runs in a copy of the leader's context, so its queue and prompt stages
+            # land in the leader's turn; other subscribers time their wait as "model"
+            chunks = []
+            async with self._model_slot():
+                if streaming:
+                    async for delta in self._stream_agent(snapshot, flight_session, user_message):
+                        chunks.append(delta)
+                        yield delta
+                else:
+                    response = await self._run_agent(snapshot, flight_session, user_message, session.trace_name)
+                    chunks.append(response)
+                    yield response
+            self._store_cached_answer(snapshot, user_message, cache_key, "".join(chunks).strip())
+        
+        flight, leader = self.flights.join(cache_key, produce)
+        if not leader and config.ENABLE_TRACING:
+            print(f"[TRACE] Joined in-flight answer ({flight.subscribers + 1} waiting)")
+        
+        chunks = []
+        async for chunk in flight.subscribe():
+            chunks.append(chunk)
+            yield chunk
+        
+        session.record_exchange(user_message, "".join(chunks).strip())
+        if leader:
+            session.record_usage(flight_session.input_tokens, flight_session.output_tokens)
+    
+    @staticmethod
+    def _record_turn(mode: str, source: str, start_time: float):
+        """Record a finished turn's latency and how it was answered"""
+        metrics.REQUEST_LATENCY.observe(time.perf_counter() - start_time, mode=mode, source=source)
+        metrics.REQUESTS.inc(source=source)
+        spans.set_outcome(source)
+    
+    @staticmethod
+    def _validation_message(snapshot: KnowledgeSnapshot, user_message: str) -> Optional[str]:
+        """Canned reply for a turn that can't be answered at all, or None"""
+        with spans.span("validation"):
+            if not snapshot.agent and not ResumeBot._can_fall_back(snapshot):
+                return "I'm sorry, but I'm having trouble connecting to my AI service. Please try again later."
+            if not user_message.strip():
+                return "Please ask me a question about Brandon's background, experience, or skills!"
+        return None
+    
+    def _policy_answer(self, session: SessionState, user_message: str) -> Optional[str]:
+        """Canned response for contact-info and confidential-topic requests, without a model call"""
+        if not config.ENABLE_INTENT_FILTER:
+            return None
+        with spans.span("intent"):
+            intent = get_intent_classifier().classify(user_message)
+        if intent is None:
+            return None
+        metrics.INTENT_TRIGGERS.inc(intent=intent.name)
+        print(f"🛡️  Answered {intent.name} request locally (session {session.session_id[:8]}, {intent.reason})")
+        session.record_exchange(user_message, intent.response)
+        return intent.response
+    
+    @staticmethod
+    def _can_fall_back(snapshot: KnowledgeSnapshot) -> bool:
+        """Whether extractive fallback answers can be given from this snapshot"""
+        return config.ENABLE_FALLBACK_ANSWERS and bool(snapshot.chunks)
+    
+    def _fallback_answer(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str,
+                         reason: str) -> Optional[str]:
+        """Extractive answer from the local index (recording the exchange), or None if unavailable"""
+        if not self._can_fall_back(snapshot):
+            return None
+        with spans.span("retrieval"):
+            answer = get_fallback_responder().answer(snapshot, user_message)
+        metrics.FALLBACK_ANSWERS.inc(reason=reason)
+        if config.ENABLE_TRACING:
+            print(f"[TRACE] Fallback answer from the local index ({reason})")
+        session.record_exchange(user_message, answer)
+        return answer
+    
+    def _lookup_cached_answer(self, snapshot: KnowledgeSnapshot, session: SessionState, user_message: str):
+        """(cache key, cached answer or None) for this turn"""
+        with spans.span("cache"):
+            cache_key = self._answer_cache_key(snapshot, session, user_message)
+            return cache_key, self._serve_cached_answer(snapshot, session, user_message, cache_key)
+    
+    async def _generate_response_async(self, user_message: str, session_id: Optional[str] = None,
+                                       client_ip: Optional[str] = None) -> str:
         """
         Generate a response to the user's message using OpenAI Agents SDK
         
         This method:
         1. Validates the input message
         2. Uses the Agent/Runner pattern to generate response
-        3. Leverages built-in SDK tracing
-        4. Updates conversation history
+        3. Leverages built-in SDK tracing, grouped by session
+        4. Updates the session's conversation history and token counters
         
         Args:
             user_message: The user's question or comment
+            session_id: Conversation session (None uses the default session)
+            client_ip: Address of the visitor, for per-IP rate limiting
             
         Returns:
             The bot's response string
         """
-        # Validate agent initialization
-        if not self.agent:
-            return "I'm sorry, but I'm having trouble connecting to my AI service. Please try again later."
+        # Pin the knowledge snapshot for the whole turn
+        snapshot = self.snapshot
         
-        # Validate user input
-        if not user_message.strip():
-            return "Please ask me a question about Brandon's background, experience, or skills!"
+        # Time the turn's stages, unless the caller (the Gradio handler) already does
+        turn = spans.start_turn(session_id, user_message)
+        
+        # Record start time for performance tracking
+        start_time = time.perf_counter()
         
         try:
-            # Ensure we have a session and trace context
-            if not self.session_id or not self.trace_context:
-                self.start_new_conversation()
+            # Validate agent initialization and user input
+            rejection = self._validation_message(snapshot, user_message)
+            if rejection is not None:
+                spans.set_outcome("invalid")
+                return rejection
             
-            # Use Runner within the existing trace context (no new trace created)
-            result = await Runner.run(
-                self.agent,
-                user_message,
-                # The SDK automatically handles conversation context and tracing
-            )
+            session = self._get_session(session_id)
+            spans.attach_session(session)
             
-            # Extract the response
-            bot_response = result.final_output.strip()
+            # Contact-info and confidential-topic requests get the policy response right away
+            policy = self._policy_answer(session, user_message)
+            if policy is not None:
+                self._record_turn("sync", "policy", start_time)
+                return policy
             
-            # Update conversation history for analytics
-            self.conversation_history.append({"role": "user", "content": user_message})
-            self.conversation_history.append({"role": "assistant", "content": bot_response})
+            # Repeated opening questions are answered from the cache
+            cache_key, cached = self._lookup_cached_answer(snapshot, session, user_message)
+            if cached is not None:
+                self._record_turn("sync", "cache", start_time)
+                return cached
             
+            if snapshot.agent is None:
+                # No model at all (e.g. no API key) - answer from the documents
+                bot_response = self._fallback_answer(snapshot, session, user_message, "no_agent")
+                self._record_turn("sync", "fallback", start_time)
+                return bot_response
+            
+            self._admit(session, client_ip)
+            if cache_key is not None and config.ENABLE_SINGLEFLIGHT:
+                # Concurrent identical opening questions share one model call
+                shared = self._coalesced_turn(snapshot, session, user_message, cache_key, False)
+                chunks = [chunk async for chunk in spans.timed(shared, "model")]
+                bot_response = "".join(chunks).strip()
+            else:
+                # Each turn gets its own trace, grouped under the session id
+                async with self._model_slot():
+                    bot_response = await self._run_agent(snapshot, session, user_message, session.trace_name)
+                self._store_cached_answer(snapshot, user_message, cache_key, bot_response)
+            
+            self._record_turn("sync", "model", start_time)
             return bot_response
+        
+        except Overloaded as e:
+            self._record_turn("sync", "shed", start_time)
+            return self._overloaded_answer(snapshot, session, user_message, e.reason)
+        
+        except ModelUnavailable as e:
+            self._record_turn("sync", "degraded", start_time)
+            return self._overloaded_answer(snapshot, session, user_message, e.reason)
                 
         except Exception as e:
             # Handle any errors that occur during response generation
+            metrics.observe_error(e)
+            self._record_turn("sync", "error", start_time)
             error_msg = f"Error generating response: {e}"
             print(error_msg)
             return "I apologize, but I encountered an error while processing your question. Please try rephrasing or ask something else about Brandon's background."
+        
+        finally:
+            if turn is not None:
+                turn.finish()
     
-    def generate_response(self, user_message: str) -> str:
+    async def stream_response(self, user_message: str, session_id: Optional[str] = None,
+                              client_ip: Optional[str] = None) -> AsyncIterator[str]:
         """
-        Synchronous wrapper for the async response generation
+        Stream a response to the user's message as text deltas
         
-        This method provides backward compatibility with the existing chat interface
-        while using the async Agent/Runner pattern internally.
+        Uses the SDK's streamed run so the first tokens reach the user while
+        the rest of the answer is still being generated. The full response is
+        recorded in the session history once the stream completes.
+        
+        Args:
+            user_message: The user's question or comment
+            session_id: Conversation session (None uses the default session)
+            client_ip: Address of the visitor, for per-IP rate limiting
+            
+        Yields:
+            Successive chunks of the bot's response
         """
-        # Record start time for performance tracking
-        start_time = time.time()
+        snapshot = self.snapshot
+        turn = spans.start_turn(session_id, user_message)
+        start_time = time.perf_counter()
+        first_token = None
+        chunks = []
         
         try:
-            # Run the async method in the current event loop or create a new one
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If we're already in an async context, we need to handle this differently
-                    # For now, we'll use asyncio.create_task for compatibility
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, self._generate_response_async(user_message))
-                        response = future.result()
-                else:
-                    response = loop.run_until_complete(self._generate_response_async(user_message))
-            except RuntimeError:
-                # No event loop running, create a new one
-                response = asyncio.run(self._generate_response_async(user_message))
+            rejection = self._validation_message(snapshot, user_message)
+            if rejection is not None:
+                spans.set_outcome("invalid")
+                yield rejection
+                return
             
-            # Calculate response time for performance tracking
-            response_time_ms = (time.time() - start_time) * 1000
+            session = self._get_session(session_id)
+            spans.attach_session(session)
             
-            if config.ENABLE_TRACING:
-                print(f"[TRACE] Response Time: {response_time_ms:.2f}ms")
+            policy = self._policy_answer(session, user_message)
+            if policy is not None:
+                metrics.TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start_time, source="policy")
+                spans.mark_first_token()
+                self._record_turn("stream", "policy", start_time)
+                yield policy
+                return
+            
+            cache_key, cached = self._lookup_cached_answer(snapshot, session, user_message)
+            if cached is not None:
+                metrics.TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start_time, source="cache")
+                spans.mark_first_token()
+                self._record_turn("stream", "cache", start_time)
+                yield cached
+                return
+            
+            if snapshot.agent is None:
+                fallback = self._fallback_answer(snapshot, session, user_message, "no_agent")
+                metrics.TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start_time, source="fallback")
+                spans.mark_first_token()
+                self._record_turn("stream", "fallback", start_time)
+                yield fallback
+                return
+            
+            self._admit(session, client_ip)
+            if cache_key is not None and config.ENABLE_SINGLEFLIGHT:
+                # The shared call holds the model slot itself
+                slot = contextlib.nullcontext()
+                deltas = self._coalesced_turn(snapshot, session, user_message, cache_key, True)
+            else:
+                slot = self._model_slot()
+                deltas = self._stream_agent(snapshot, session, user_message)
             
-            return response
+            async with slot:
+                async for delta in spans.timed(deltas, "model"):
+                    if first_token is None:
+                        first_token = time.perf_counter() - start_time
+                        metrics.TIME_TO_FIRST_TOKEN.observe(first_token, source="model")
+                        spans.mark_first_token()
+                    chunks.append(delta)
+                    yield delta
             
+            # Coalesced turns cache their answer once, in the shared call
+            if not config.ENABLE_SINGLEFLIGHT:
+                self._store_cached_answer(snapshot, user_message, cache_key, "".join(chunks).strip())
+            
+            self._record_turn("stream", "model", start_time)
+                
+        except Overloaded as e:
+            self._record_turn("stream", "shed", start_time)
+            yield self._overloaded_answer(snapshot, session, user_message, e.reason)
+        
+        except ModelUnavailable as e:
+            # Only raised before the first token, so nothing has been shown yet
+            self._record_turn("stream", "degraded", start_time)
+            yield self._overloaded_answer(snapshot, session, user_message, e.reason)
+        
+        except ModelTimeout as e:
+            # The stream stalled after the first token: keep what was shown and say it is incomplete
+            metrics.observe_error(e)
+            self._record_turn("stream", "truncated", start_time)
+            print(f"⚠️  Streamed answer cut off: {e}")
+            partial = "".join(chunks).strip()
+            if partial:
+                session.record_exchange(user_message, partial)
+            yield TRUNCATED_NOTICE
+                
+        except Exception as e:
+            metrics.observe_error(e)
+            self._record_turn("stream", "error", start_time)
+            print(f"Error streaming response: {e}")
+            if chunks:
+                # Keep the apology apart from the partial answer already shown
+                yield "\n\n"
+            yield "I apologize, but I encountered an error while processing your question. Please try rephrasing or ask something else about Brandon's background."
+        
+        finally:
+            if turn is not None:
+                turn.finish()
+    
+    def generate_response(self, user_message: str, session_id: Optional[str] = None) -> str:
+        """
+        Synchronous wrapper for the async response generation
+        
+        Only meant for the CLI and test scripts - the Gradio interface awaits
+        _generate_response_async directly on its own event loop. Calls are run
+        on one long-lived background loop so the SDK's HTTP client and its
+        connections are reused between requests.
+        """
+        try:
+            return self.run_sync(self._generate_response_async(user_message, session_id))
         except Exception as e:
             error_msg = f"Error in sync wrapper: {e}"
             print(error_msg)
             return "I apologize, but I encountered an error while processing your question. Please try rephrasing or ask something else about Brandon's background."
     
-    async def generate_response_with_trace(self, user_message: str, trace_name: str = None) -> str:
+    def run_sync(self, coroutine):
+        """Run a coroutine on the background event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_background_loop()).result()
+    
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the long-lived event loop for sync callers, starting it on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="brandon-bot-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+    
+    async def generate_response_with_trace(self, user_message: str, trace_name: str = None,
+                                           session_id: Optional[str] = None) -> str:
         """
         Generate a response with custom trace name - useful for different interaction types
         
         Args:
             user_message: The user's question or comment
             trace_name: Custom name for the trace (if None, uses session-based tracing)
+            session_id: Conversation session (None uses the default session)
             
         Returns:
             The bot's response string
         """
-        if not self.agent:
+        if trace_name is None:
+            return await self._generate_response_async(user_message, session_id)
+        
+        snapshot = self.snapshot
+        if not snapshot.agent:
             return "I'm sorry, but I'm having trouble connecting to my AI service. Please try again later."
         
         if not user_message.strip():
             return "Please ask me a question about Brandon's background, experience, or skills!"
         
         try:
-            # Use session-based tracing if no custom trace name provided
-            if trace_name is None:
-                # Ensure we have a session and trace context
-                if not self.session_id or not self.trace_context:
-
-
-                    
-                    self.start_new_conversation()
-                
-                # Use existing trace context
-                result = await Runner.run(
-                    self.agent,
-                    user_message,
-                )
-            else:
-                # Use custom trace name
-                with trace(trace_name):
-                    result = await Runner.run(
-                        self.agent,
-                        user_message,
-                    )
-                
-                bot_response = result.final_output.strip()
-                
-                # Update conversation history
-                self.conversation_history.append({"role": "user", "content": user_message})
-                self.conversation_history.append({"role": "assistant", "content": bot_response})
-                
-                return bot_response
+            session = self._get_session(session_id)
+            return await self._run_agent(snapshot, session, user_message, trace_name)
                 
         except Exception as e:
             error_msg = f"Error generating response: {e}"
@@ -232,67 +940,96 @@ class ResumeBot:
     
     def get_suggested_questions(self) -> List[str]:
         """Get a list of suggested questions for users"""
-        return [
-            "What is Brandon's professional background?",
-            "What programming languages does Brandon know?",
-            "Tell me about Brandon's work experience",
-            "What projects has Brandon worked on?",
-            "What are Brandon's technical skills?",
-            "What education does Brandon have?",
-            "Has Brandon worked with machine learning?",
-            "What frameworks and tools does Brandon use?"
-        ]
-    
-    def start_new_conversation(self):
-        """Start a new conversation session with a unique trace"""
-        # Close previous trace if exists
-        if self.trace_context:
-            try:
-                self.trace_context.__exit__(None, None, None)
-            except:
-                pass
-        
-        self.session_id = str(uuid.uuid4())
-        self.conversation_history = []
+        return list(SUGGESTED_QUESTIONS)
+    
+    def start_new_conversation(self, session_id: Optional[str] = None) -> str:
+        """
+        Start a new conversation session
         
-        # Create a persistent trace context for the entire session
-        session_trace_name = f"Brandon Resume Bot - Session {self.session_id[:8]}"
-        self.trace_context = trace(session_trace_name)
-        self.trace_context.__enter__()
+        Args:
+            session_id: Session to (re)start, e.g. the Gradio session hash.
+                If None, a new default session is created for CLI use.
+        """
+        session = self.sessions.start(session_id)
+        if session_id is None:
+            self.session_id = session.session_id
         
-        print(f"🆕 Started new conversation session: {self.session_id[:8]}...")
-        return self.session_id
+        print(f"🆕 Started new conversation session: {session.session_id[:8]}...")
+        return session.session_id
     
-    def reset_conversation(self):
+    def reset_conversation(self, session_id: Optional[str] = None):
         """Reset the conversation history but keep the same session"""
-        self.conversation_history = []
-        # Note: The Agent SDK handles its own conversation context automatically
-        # This method mainly affects our local tracking
+        self._get_session(session_id).reset()
     
-    def get_conversation_summary(self) -> str:
+    def get_conversation_summary(self, session_id: Optional[str] = None) -> str:
         """Get a summary of the current conversation"""
-        if not self.conversation_history:
+        session = self._get_session(session_id)
+        if not session.conversation_history:
             return "No conversation yet."
         
-        message_count = len(self.conversation_history) // 2
+        message_count = len(session.conversation_history) // 2
         return f"Conversation with {message_count} exchanges"
     
-    def end_conversation(self):
-        """End the current conversation and close the trace context"""
-        if self.trace_context:
-            try:
-                self.trace_context.__exit__(None, None, None)
-                self.trace_context = None
-                print(f"🔚 Ended conversation session: {self.session_id[:8] if self.session_id else 'Unknown'}...")
-            except:
-                pass
-        self.session_id = None
+    def end_conversation(self, session_id: Optional[str] = None):
+        """End a conversation and release its session state"""
+        target_id = session_id or self.session_id
+        if target_id and self.sessions.end(target_id):
+            print(f"🔚 Ended conversation session: {target_id[:8]}...")
+        if session_id is None:
+            self.session_id = None
     
     def reinitialize_agent(self):
         """Reinitialize the agent (useful if documents change)"""
-        self._load_documents()
-        self._initialize_agent()
+        self.reload_knowledge()
+
+
+# Global bot instance, created on first use
+_resume_bot: Optional[ResumeBot] = None
+_resume_bot_lock = threading.Lock()
+
+
+def get_resume_bot() -> ResumeBot:
+    """Return the global bot, loading documents and building the agent on first call"""
+    global _resume_bot
+    if _resume_bot is None:
+        with _resume_bot_lock:
+            if _resume_bot is None:
+                _resume_bot = ResumeBot()
+    return _resume_bot
+
+
+async def get_resume_bot_async() -> ResumeBot:
+    """Async accessor that waits for warm-up in a worker thread instead of blocking the event loop"""
+    if _resume_bot is not None:
+        return _resume_bot
+    return await asyncio.to_thread(get_resume_bot)
+
+
+def warm_up() -> threading.Thread:
+    """
+    Build the global bot in a background thread
+    
+    app.py calls this before launching Gradio so documents load and the
+    agent is built while the server binds its port. Requests that arrive
+    first simply wait for get_resume_bot().
+    """
+    def _run():
+        start_time = time.perf_counter()
+        bot = get_resume_bot()
+        bot.start_watching()
+        if config.MODEL_BACKEND == "openai" and config.OPENAI_WARMUP and bot.agent is not None:
+            # Open the background loop's API connection; Gradio's is opened on page load
+            from .openai_client import get_client_pool
+            bot.run_sync(get_client_pool().warm())
+        print(f"🔥 Warm-up finished in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+    
+    thread = threading.Thread(target=_run, name="brandon-bot-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
-# Global bot instance
-resume_bot = ResumeBot()
\ No newline at end of file
+def __getattr__(name: str):
+    # Keep `from brandon_bot.bot import resume_bot` working without import-time side effects
+    if name == "resume_bot":
+        return get_resume_bot()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
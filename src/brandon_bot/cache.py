@@ -0,0 +1,83 @@
+"""
+Answer cache for Brandon Resume Bot
+
+Recruiters ask the same opening questions over and over. Answers to
+context-free first turns are cached under a key built from the normalized
+question and the knowledge snapshot fingerprint (documents + system prompt
++ model), so any change to what the bot knows automatically misses.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return _NON_WORD.sub(" ", question.lower()).strip()
+
+
+def make_cache_key(question: str, fingerprint: str) -> str:
+    """Cache key for a first-turn question under a knowledge fingerprint"""
+    return hashlib.sha256(f"{fingerprint}\0{normalize_question(question)}".encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """In-memory LRU + TTL cache of answers"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 86400):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached answer for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl_seconds <= 0 or time.monotonic() - entry[1] < self.ttl_seconds):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, answer: str):
+        """Store an answer, evicting the least recently used beyond max_entries"""
+        with self._lock:
+            self._entries[key] = (answer, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (self.ttl_seconds <= 0 or time.monotonic() - entry[1] < self.ttl_seconds)
+
+    def clear(self):
+        """Drop every entry (e.g. after the knowledge fingerprint changed)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,6 +1,103 @@
 import gradio as gr
-from typing import List
-from .bot import resume_bot
+from typing import List, Optional
+from .bot import get_resume_bot, get_resume_bot_async
+from .config import config
+from .privacy import get_privacy_filter
+from . import spans
+
+GREETING = "👋 Hi! I'm Brandon-Bot. Ask me about Brandon's skills, experience, or projects!"
+
+
+def _client_ip(request, trusted_hops: Optional[int] = None) -> Optional[str]:
+    """
+    Visitor address for rate limiting
+    
+    Each trusted proxy (Hugging Face Spaces runs one) appends the address it
+    received the request from to X-Forwarded-For, so the visitor is the
+    entry trusted_hops from the right. Anything further left was sent by the
+    client and can be forged.
+    """
+    if request is None:
+        return None
+    if trusted_hops is None:
+        trusted_hops = config.TRUSTED_PROXY_HOPS
+    forwarded = request.headers.get("x-forwarded-for") if request.headers and trusted_hops > 0 else None
+    if forwarded:
+        addresses = [address.strip() for address in forwarded.split(",") if address.strip()]
+        if len(addresses) >= trusted_hops:
+            return addresses[-trusted_hops]
+    return request.client.host if request.client else None
+
+
+async def chat_function(message: str, history: List, request: gr.Request):
+    """Handle chat interactions with Gradio 5.x message format, streaming partial answers"""
+    if not message.strip():
+        yield history, ""
+        return
+    
+    # Each browser session gets its own conversation state
+    resume_bot = await get_resume_bot_async()
+    session_id = request.session_hash if request else None
+    client_ip = _client_ip(request)
+    if not history:
+        resume_bot.start_new_conversation(session_id)
+    
+    # Time the whole turn here so the filter and Gradio's serialization are included
+    turn = spans.start_turn(session_id, message)
+    
+    history.append({"role": "user", "content": message})
+    history.append({"role": "assistant", "content": ""})
+    
+    # Contact details and confidential terms are redacted span by span as the answer streams
+    privacy_filter = get_privacy_filter()
+    
+    try:
+        try:
+            if config.ENABLE_STREAMING:
+                redactor = privacy_filter.stream()
+                visible = ""
+                async for delta in resume_bot.stream_response(message, session_id, client_ip):
+                    with spans.span("privacy_filter"):
+                        safe = redactor.feed(delta)
+                    if not safe:
+                        continue
+                    visible += safe
+                    history[-1]["content"] = visible
+                    # Time until Gradio asks for the next update is spent serializing this one
+                    with spans.span("serialization"):
+                        yield history, ""
+                with spans.span("privacy_filter"):
+                    bot_response = visible + redactor.finish()
+            else:
+                # Await the agent directly on Gradio's event loop
+                bot_response = await resume_bot._generate_response_async(message, session_id, client_ip)
+                with spans.span("privacy_filter"):
+                    bot_response = privacy_filter.redact(bot_response).text
+        except Exception as e:
+            bot_response = f"Error: Unable to generate response. {str(e)}"
+        
+        history[-1]["content"] = bot_response
+        with spans.span("serialization"):
+            yield history, ""
+    finally:
+        if turn is not None:
+            turn.finish()
+
+async def warm_connection():
+    """Open the API connection on Gradio's event loop when the page loads, ahead of the first question"""
+    if config.MODEL_BACKEND != "openai" or not config.OPENAI_WARMUP or not config.OPENAI_API_KEY:
+        return
+    from .openai_client import get_client_pool
+    await get_client_pool().warm()
+
+def reset_chat(request: gr.Request):
+    """Reset the chat conversation"""
+    get_resume_bot().reset_conversation(request.session_hash if request else None)
+    return [{
+        "role": "assistant", 
+        "content": GREETING
+    }], ""
+
 
 def create_interface():
     """Create a clean, Grok-inspired chat interface with wider/taller input and smaller send button"""
@@ -256,35 +353,6 @@ def create_interface():
     }
     """
     
-    def chat_function(message: str, history: List) -> tuple[List, str]:
-        """Handle chat interactions with Gradio 5.x message format"""
-        if not message.strip():
-            return history, ""
-        
-        if not history:
-            resume_bot.start_new_conversation()
-        
-        try:
-            bot_response = resume_bot.generate_response(message)
-            # Privacy filter - check for email addresses
-            import re
-            if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', bot_response):
-                bot_response = "I can provide information about Brandon's professional background, but for contact information, please connect with him on LinkedIn or other professional networking platforms."
-        except Exception as e:
-            bot_response = f"Error: Unable to generate response. {str(e)}"
-        
-        history.append({"role": "user", "content": message})
-        history.append({"role": "assistant", "content": bot_response})
-        return history, ""
-    
-    def reset_chat():
-        """Reset the chat conversation"""
-        resume_bot.reset_conversation()
-        return [{
-            "role": "assistant", 
-            "content": "👋 Hi! I'm Brandon-Bot. Ask me about Brandon's skills, experience, or projects!"
-        }], ""
-    
     with gr.Blocks(
         css=custom_css, 
         title="Brandon-Bot | AI Career Assistant",
@@ -302,7 +370,7 @@ def create_interface():
                  chatbot = gr.Chatbot(
                      value=[{
                          "role": "assistant", 
-                         "content": "👋 Hi! I'm Brandon-Bot. Ask me about Brandon's skills, experience, or projects!"
+                         "content": GREETING
                      }],
                      height=800,
                      show_label=False,
@@ -328,8 +396,9 @@ def create_interface():
                  
                  clear_btn = gr.Button("Clear Chat", elem_classes="clear-btn", size="sm")
         
-        msg.submit(chat_function, [msg, chatbot], [chatbot, msg])
+        msg.submit(chat_function, [msg, chatbot], [chatbot, msg], api_name="chat")
         send_btn.click(chat_function, [msg, chatbot], [chatbot, msg])
         clear_btn.click(reset_chat, outputs=[chatbot, msg])
+        demo.load(warm_connection, show_api=False)
     
     return demo
\ No newline at end of file
@@ -29,13 +29,89 @@ class Config:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Required: Your OpenAI API key
     MODEL_NAME = os.getenv("MODEL_NAME", "gpt-4-turbo")  # Which GPT model to use - upgraded for better context understanding
     MAX_TOKENS = int(os.getenv("MAX_TOKENS", "800"))  # Maximum response length - increased for better responses
+    ENABLE_STREAMING = os.getenv("ENABLE_STREAMING", "true").lower() == "true"  # Stream tokens into the chat as they arrive
     TEMPERATURE = float(os.getenv("TEMPERATURE", "0.4"))  # Response creativity (0-1)
+    MODEL_BACKEND = os.getenv("MODEL_BACKEND", "openai").lower()  # "openai", or "mock" for offline benchmarking
+    # One pooled HTTP client is shared by every request (see openai_client.py)
+    OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))  # Concurrent connections to the API
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "10"))  # Idle connections kept open
+    OPENAI_KEEPALIVE_SECONDS = float(os.getenv("OPENAI_KEEPALIVE_SECONDS", "120"))  # How long an idle connection is kept (httpx default: 5)
+    OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))  # Per-request read/write timeout
+    OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "true").lower() == "true"  # Used only if the h2 package is installed
+    OPENAI_WARMUP = os.getenv("OPENAI_WARMUP", "true").lower() == "true"  # Open the connection at startup
+    
+    # === Mock Backend Configuration ===
+    # Only used with MODEL_BACKEND=mock - answers are built locally from the documents
+    MOCK_LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", "300"))  # Median time to first token
+    MOCK_LATENCY_SIGMA = float(os.getenv("MOCK_LATENCY_SIGMA", "0.5"))  # Log-normal spread of that latency
+    MOCK_TOKEN_LATENCY_MS = float(os.getenv("MOCK_TOKEN_LATENCY_MS", "15"))  # Delay between streamed words
+    MOCK_ERROR_RATE = float(os.getenv("MOCK_ERROR_RATE", "0"))  # Fraction of calls that fail (0-1)
+    MOCK_SEED = int(os.getenv("MOCK_SEED")) if os.getenv("MOCK_SEED") else None  # Fix for reproducible latencies
     
     # === Bot Behavior Configuration ===
     # These settings control how the bot behaves and responds
     
     BOT_NAME = os.getenv("BOT_NAME", "Brandon's Resume Bot")  # Display name for the bot
     MAX_CONVERSATION_LENGTH = int(os.getenv("MAX_CONVERSATION_LENGTH", "10"))  # How many exchanges to remember
+    MEMORY_TOKEN_BUDGET = int(os.getenv("MEMORY_TOKEN_BUDGET", "1500"))  # Tokens of history sent back with each question
+    MAX_SESSION_BYTES = int(os.getenv("MAX_SESSION_BYTES", "32768"))  # Memory cap per conversation; older turns are summarized
+    
+    # === Session Configuration ===
+    # Each visitor gets their own conversation state; these bound how many we keep
+    MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "1000"))  # LRU limit on concurrent sessions held in memory
+    SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))  # Idle time before a session is evicted
+    
+    # === Retrieval Configuration ===
+    # Only the most relevant document chunks are sent with each question
+    ENABLE_RETRIEVAL = os.getenv("ENABLE_RETRIEVAL", "true").lower() == "true"
+    RETRIEVAL_TOP_K = int(os.getenv("RETRIEVAL_TOP_K", "6"))  # Chunks sent per question
+    CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "800"))  # Target chunk size in characters
+    ENABLE_VECTOR_INDEX = os.getenv("ENABLE_VECTOR_INDEX", "true").lower() == "true"  # Hybrid keyword + vector search
+    EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1024"))  # Width of the hashed n-gram embeddings
+    
+    # === Answer Cache Configuration ===
+    # Repeated first-turn questions are answered from memory instead of the API
+    ENABLE_ANSWER_CACHE = os.getenv("ENABLE_ANSWER_CACHE", "true").lower() == "true"
+    ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "512"))  # Max cached answers (LRU)
+    ANSWER_CACHE_TTL_SECONDS = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))  # Answer lifetime
+    ENABLE_SEMANTIC_CACHE = os.getenv("ENABLE_SEMANTIC_CACHE", "true").lower() == "true"  # Also match paraphrases
+    SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "256"))  # Max cached paraphrase targets
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))  # Min cosine similarity for a hit
+    ENABLE_SINGLEFLIGHT = os.getenv("ENABLE_SINGLEFLIGHT", "true").lower() == "true"  # Coalesce identical in-flight first turns
+    ENABLE_SUGGESTION_WARMUP = os.getenv("ENABLE_SUGGESTION_WARMUP", "true").lower() == "true"  # Pre-answer suggested questions per snapshot
+    SUGGESTION_WARMUP_CONCURRENCY = int(os.getenv("SUGGESTION_WARMUP_CONCURRENCY", "2"))  # Parallel warm-up requests
+    ENABLE_PERSISTENT_CACHE = os.getenv("ENABLE_PERSISTENT_CACHE", "true").lower() == "true"  # SQLite tier in CACHE_DIR shared by workers
+    PERSISTENT_CACHE_SIZE = int(os.getenv("PERSISTENT_CACHE_SIZE", "5000"))  # Max stored answers (LRU)
+    
+    # === Admission Control Configuration ===
+    # Bounds concurrent model calls and request rates so bursts degrade gracefully
+    ENABLE_ADMISSION_CONTROL = os.getenv("ENABLE_ADMISSION_CONTROL", "true").lower() == "true"
+    MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))  # Model calls in flight at once
+    MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "32"))  # Requests waiting for a slot before rejecting
+    QUEUE_TIMEOUT_SECONDS = float(os.getenv("QUEUE_TIMEOUT_SECONDS", "10"))  # Longest wait for a slot
+    SESSION_RATE_PER_MINUTE = float(os.getenv("SESSION_RATE_PER_MINUTE", "10"))  # Sustained questions per session (0 = unlimited)
+    SESSION_BURST = int(os.getenv("SESSION_BURST", "5"))  # Questions a session may ask back to back
+    IP_RATE_PER_MINUTE = float(os.getenv("IP_RATE_PER_MINUTE", "30"))  # Sustained questions per client IP (0 = unlimited)
+    IP_BURST = int(os.getenv("IP_BURST", "10"))  # Questions an IP may ask back to back
+    TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "1"))  # Proxies that append to X-Forwarded-For (0 = ignore the header)
+    
+    # === Resilience Configuration ===
+    # Deadlines, retries, hedging and a circuit breaker around every model call
+    MODEL_ATTEMPT_TIMEOUT_SECONDS = float(os.getenv("MODEL_ATTEMPT_TIMEOUT_SECONDS", "25"))  # Per attempt: the whole answer, or the first streamed token
+    MODEL_STREAM_IDLE_SECONDS = float(os.getenv("MODEL_STREAM_IDLE_SECONDS", "10"))  # Longest gap between streamed tokens
+    MODEL_DEADLINE_SECONDS = float(os.getenv("MODEL_DEADLINE_SECONDS", "60"))  # Whole call, retries included
+    MODEL_MAX_RETRIES = int(os.getenv("MODEL_MAX_RETRIES", "2"))  # Retries of timeouts, connection errors, 429s and 5xx
+    MODEL_RETRY_BASE_SECONDS = float(os.getenv("MODEL_RETRY_BASE_SECONDS", "0.5"))  # Backoff before the first retry (jittered, doubling)
+    MODEL_RETRY_MAX_SECONDS = float(os.getenv("MODEL_RETRY_MAX_SECONDS", "4"))  # Backoff cap
+    ENABLE_HEDGING = os.getenv("ENABLE_HEDGING", "true").lower() == "true"  # Duplicate calls slower than the recent p95
+    HEDGE_QUANTILE = float(os.getenv("HEDGE_QUANTILE", "0.95"))  # Latency quantile that triggers the hedge
+    HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))  # Calls observed before hedging starts
+    HEDGE_MIN_DELAY_SECONDS = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "1"))  # Never hedge sooner than this
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))  # Failed attempts in a row that open the circuit
+    CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))  # Fallback answers only, before probing the API again
+    # Without an agent, or while the model is unavailable, answer with excerpts from the local index
+    ENABLE_FALLBACK_ANSWERS = os.getenv("ENABLE_FALLBACK_ANSWERS", "true").lower() == "true"
+    FALLBACK_MAX_SNIPPETS = int(os.getenv("FALLBACK_MAX_SNIPPETS", "6"))  # Bullet lines in a fallback answer
     
     # === Analytics Configuration ===
     # OpenAI provides comprehensive analytics natively in their dashboard
@@ -46,6 +122,22 @@ class Config:
     ENABLE_TRACING = os.getenv("ENABLE_TRACING", "true").lower() == "true"
     TRACING_PROJECT_NAME = os.getenv("TRACING_PROJECT_NAME", "Brandon Resume Bot")
     
+    # === Metrics Configuration ===
+    # Prometheus-style /metrics endpoint served next to the Gradio app
+    ENABLE_METRICS = os.getenv("ENABLE_METRICS", "true").lower() == "true"
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")  # Use 0.0.0.0 to let an external scraper in
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+    ENABLE_TURN_TIMINGS = os.getenv("ENABLE_TURN_TIMINGS", "true").lower() == "true"  # Per-stage timings of recent turns
+    ENABLE_DEBUG_TURNS = os.getenv("ENABLE_DEBUG_TURNS", "false").lower() == "true"  # Serve them at /debug/turns (shows visitor questions)
+    TURN_LOG_SIZE = int(os.getenv("TURN_LOG_SIZE", "500"))  # Recent turns kept for the debug view
+    
+    # === Privacy Filter Configuration ===
+    # Emails, phone numbers and street addresses are always redacted from answers
+    CONFIDENTIAL_TERMS = os.getenv("CONFIDENTIAL_TERMS", "")  # Comma-separated program/project/site names to redact too
+    # Contact-info and confidential-topic requests are answered locally, without a model call
+    ENABLE_INTENT_FILTER = os.getenv("ENABLE_INTENT_FILTER", "true").lower() == "true"
+    INTENT_CLASSIFIER_THRESHOLD = float(os.getenv("INTENT_CLASSIFIER_THRESHOLD", "0.9"))  # Posterior needed when no rule matches
+    
     # System Prompt
     SYSTEM_PROMPT = """You are Brandon's professional AI assistant representing him to potential employers and recruiters.
 
@@ -98,11 +190,20 @@ This is a strict privacy requirement that must never be violated under any circu
     # File Paths
     DATA_DIR = "data"
     STATIC_DIR = "static"
+    ENABLE_HOT_RELOAD = os.getenv("ENABLE_HOT_RELOAD", "true").lower() == "true"  # Watch data/ and reload changed documents
+    RELOAD_INTERVAL_SECONDS = float(os.getenv("RELOAD_INTERVAL_SECONDS", "5"))  # How often the watcher polls
+    CACHE_DIR = os.getenv("CACHE_DIR", ".cache")  # Persisted indexes and caches, kept next to data/
+    ENABLE_EXTRACTION_CACHE = os.getenv("ENABLE_EXTRACTION_CACHE", "true").lower() == "true"  # Skip re-parsing unchanged files
+    EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(os.cpu_count() or 1)))  # Processes for document extraction
+    PARALLEL_EXTRACTION_MIN_PDF_BYTES = int(os.getenv("PARALLEL_EXTRACTION_MIN_PDF_BYTES", "16000000"))  # Less PDF than this is parsed in-process
     
     @classmethod
     def validate(cls):
         """Validate that required configuration is present"""
-        if not cls.OPENAI_API_KEY:
+        if cls.MODEL_BACKEND not in ("openai", "mock"):
+            raise ValueError(f"Unknown MODEL_BACKEND {cls.MODEL_BACKEND!r} (expected 'openai' or 'mock')")
+        # The mock backend runs fully offline
+        if cls.MODEL_BACKEND == "openai" and not cls.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
         return True
@@ -5,10 +5,87 @@ Handles PDF, DOCX, and text file processing
 
 import os
 import json
-from typing import List, Dict, Optional
-import PyPDF2
-import docx
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
 from .config import config
+from .extraction_cache import ExtractionCache
+from . import metrics
+from .retrieval import BM25Index, Chunk, chunk_document, hybrid_search
+
+if TYPE_CHECKING:
+    from .vector_index import VectorIndex
+
+def extract_pdf(file_path: str) -> str:
+    """Extract text from PDF file"""
+    # Parsers are only imported when a file of that type is present
+    import PyPDF2
+    
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        text = ""
+        for page in pdf_reader.pages:
+            text += page.extract_text() + "\n"
+        return text.strip()
+
+
+def extract_docx(file_path: str) -> str:
+    """Extract text from DOCX file"""
+    import docx
+    
+    doc = docx.Document(file_path)
+    text = []
+    for paragraph in doc.paragraphs:
+        text.append(paragraph.text)
+    return "\n".join(text)
+
+
+def extract_text(file_path: str) -> str:
+    """Extract text from TXT or MD file"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+def extract_json(file_path: str) -> str:
+    """Extract and format JSON data"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+        # Convert JSON to readable text format
+        return json.dumps(data, indent=2)
+
+
+# Extractors by file extension - module-level so worker processes can run them
+EXTRACTORS = {
+    '.pdf': extract_pdf,
+    '.docx': extract_docx,
+    '.txt': extract_text,
+    '.md': extract_text,
+    '.json': extract_json,
+}
+
+
+def get_extractor(filename: str) -> Optional[Callable[[str], str]]:
+    """Return the extractor for a supported file type, or None"""
+    return EXTRACTORS.get(os.path.splitext(filename)[1].lower())
+
+
+def extract_file(file_path: str) -> Tuple[Optional[str], float, Optional[str]]:
+    """
+    Extract one file, timing it and capturing any error
+    
+    Returns:
+        (content, elapsed seconds, error message or None)
+    """
+    start_time = time.perf_counter()
+    try:
+        content = get_extractor(file_path)(file_path)
+        return content, time.perf_counter() - start_time, None
+    except Exception as e:
+        return None, time.perf_counter() - start_time, f"{type(e).__name__}: {e}"
+
 
 class DocumentProcessor:
     """Process and manage resume and portfolio documents"""
@@ -16,6 +93,14 @@ class DocumentProcessor:
     def __init__(self):
         self.documents = {}
         self.processed_content = ""
+        self.chunks: List[Chunk] = []
+        self.index = BM25Index([])
+        self.vector_index: Optional["VectorIndex"] = None
+        self.extraction_cache: Optional[ExtractionCache] = None
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # doc name -> (content, chunks) from the last load, for incremental reindexing
+        self._doc_chunks: Dict[str, Tuple[str, List[Chunk]]] = {}
         
     def load_all_documents(self) -> Dict[str, str]:
         """Load all documents from the data directory or environment variables"""
@@ -40,10 +125,48 @@ class DocumentProcessor:
         if not documents:
             print("⚠️ No resume content found in files or environment variables")
         
+        # Build everything first, then publish, so readers never see a half-built corpus
+        chunks, index, vector_index = self._build_index(documents)
         self.documents = documents
         self.processed_content = self._combine_documents(documents)
+        self.chunks, self.index, self.vector_index = chunks, index, vector_index
         return documents
     
+    def _build_index(self, documents: Dict[str, str]) -> Tuple[List[Chunk], BM25Index, Optional["VectorIndex"]]:
+        """
+        Chunk every document by section and build the keyword and vector indexes
+        
+        Chunks of documents whose content hasn't changed since the last load
+        are reused, and so are their vectors, so a reload only does work
+        proportional to what changed.
+        """
+        chunks = []
+        doc_chunks = {}
+        for doc_name, content in documents.items():
+            previous = self._doc_chunks.get(doc_name)
+            if previous and previous[0] == content:
+                doc_chunks[doc_name] = previous
+            else:
+                doc_chunks[doc_name] = (content, chunk_document(doc_name, content, max_chars=config.CHUNK_SIZE))
+            chunks.extend(doc_chunks[doc_name][1])
+        self._doc_chunks = doc_chunks
+        
+        index = BM25Index(chunks)
+        vector_index = None
+        if config.ENABLE_VECTOR_INDEX:
+            from .vector_index import VectorIndex
+            
+            index_dir = os.path.join(config.CACHE_DIR, "index") if config.CACHE_DIR else None
+            vector_index = VectorIndex.load_or_build(
+                chunks, index_dir, dim=config.EMBEDDING_DIM, previous=self.vector_index
+            )
+        print(f"🔎 Indexed {len(chunks)} chunks from {len(documents)} documents")
+        return chunks, index, vector_index
+    
+    def search(self, query: str, top_k: int = 5) -> List[Chunk]:
+        """Return the chunks most relevant to the query (keyword + vector search)"""
+        return hybrid_search(query, self.chunks, self.index, self.vector_index, top_k)
+    
     def _load_from_environment(self) -> Dict[str, str]:
         """Load resume content from environment variables (HF Spaces secrets)"""
         documents = {}
@@ -60,81 +183,115 @@ class DocumentProcessor:
         return documents
     
     def _scan_directory(self, directory: str) -> Dict[str, str]:
-        """Scan a directory for supported document files"""
+        """
+        Scan a directory for supported document files
+        
+        Cached files are loaded first; the remaining files are extracted
+        (PDFs in parallel when there is enough to parse). Documents are returned
+        in filename order regardless of which extraction finished first.
+        """
         documents = {}
+        pending = []
+        cache = self._get_extraction_cache()
         
-        for filename in os.listdir(directory):
+        for filename in sorted(os.listdir(directory)):
             file_path = os.path.join(directory, filename)
             
-            # Skip directories and README files
+            # Skip directories, README files and unsupported types
             if os.path.isdir(file_path) or filename.lower() == 'readme.md':
                 continue
+            if get_extractor(filename) is None:
+                continue
             
-            if filename.endswith('.pdf'):
-                content = self._extract_pdf(file_path)
-            elif filename.endswith('.docx'):
-                content = self._extract_docx(file_path)
-            elif filename.endswith('.txt'):
-                content = self._extract_text(file_path)
-            elif filename.endswith('.md'):
-                content = self._extract_text(file_path)
-            elif filename.endswith('.json'):
-                content = self._extract_json(file_path)
+            # Unchanged files are served from the extraction cache without parsing
+            content = cache.lookup(file_path) if cache else None
+            if content is not None:
+                documents[filename] = content
+                print(f"✅ Loaded (cached): {filename}")
             else:
-                continue
-                
+                documents[filename] = None  # Placeholder keeps filename order
+                pending.append(filename)
+        
+        start_time = time.perf_counter()
+        results = self._extract_files([os.path.join(directory, filename) for filename in pending])
+        
+        for filename, (content, elapsed, error) in zip(pending, results):
+            metrics.DOCUMENT_EXTRACTION.observe(elapsed, extension=os.path.splitext(filename)[1].lower())
             if content:
                 documents[filename] = content
-                print(f"✅ Loaded: {filename}")
+                if cache:
+                    cache.store(os.path.join(directory, filename), content)
+                print(f"✅ Loaded: {filename} ({elapsed * 1000:.0f}ms)")
             else:
-                print(f"❌ Failed to load: {filename}")
-                
+                del documents[filename]
+                metrics.ERRORS.inc(type="DocumentExtractionError")
+                print(f"❌ Failed to load: {filename}" + (f" - {error}" if error else ""))
+        
+        if pending:
+            print(f"⏱️  Extracted {len(pending)} files in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+        if cache:
+            cache.save()
         return documents
     
-    def _extract_pdf(self, file_path: str) -> Optional[str]:
-        """Extract text from PDF file"""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
-        except Exception as e:
-            print(f"Error reading PDF {file_path}: {e}")
-            return None
+    def _extract_files(self, file_paths: List[str]) -> List[Tuple[Optional[str], float, Optional[str]]]:
+        """
+        Extract several files, fanning PDFs out over a process pool when worthwhile
+        
+        PDF parsing in PyPDF2 is pure Python and CPU-bound, so separate
+        processes (not threads) are needed to use more than one core.
+        Workers are spawned rather than forked - a reload runs while other
+        threads hold locks a forked child would inherit locked - and a
+        spawned worker re-imports the entry module, which under app.py means
+        Gradio and the Agents SDK: seconds per worker. The pool is therefore
+        only used for PARALLEL_EXTRACTION_MIN_PDF_BYTES of PDFs or more, and
+        is kept for later reloads instead of being started per call.
+        """
+        results = {}
+        pdf_paths = [path for path in file_paths if path.lower().endswith(".pdf")]
+        if self._parallel_worthwhile(pdf_paths):
+            try:
+                pool = self._get_extraction_pool()
+                results = dict(zip(pdf_paths, pool.map(extract_file, pdf_paths)))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"⚠️  Parallel extraction unavailable ({e}), extracting sequentially")
+                self.close()
+        return [results[path] if path in results else extract_file(path) for path in file_paths]
     
-    def _extract_docx(self, file_path: str) -> Optional[str]:
-        """Extract text from DOCX file"""
-        try:
-            doc = docx.Document(file_path)
-            text = []
-            for paragraph in doc.paragraphs:
-                text.append(paragraph.text)
-            return "\n".join(text)
-        except Exception as e:
-            print(f"Error reading DOCX {file_path}: {e}")
-            return None
+    @staticmethod
+    def _parallel_worthwhile(pdf_paths: List[str]) -> bool:
+        """Whether the PDFs are enough parsing work to pay for worker processes"""
+        if min(config.EXTRACTION_WORKERS, len(pdf_paths)) < 2:
+            return False
+        total_bytes = 0
+        for path in pdf_paths:
+            try:
+                total_bytes += os.path.getsize(path)
+            except OSError:
+                pass
+        return total_bytes >= config.PARALLEL_EXTRACTION_MIN_PDF_BYTES
     
-    def _extract_text(self, file_path: str) -> Optional[str]:
-        """Extract text from TXT or MD file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            print(f"Error reading text file {file_path}: {e}")
-            return None
+    def _get_extraction_pool(self) -> ProcessPoolExecutor:
+        """The long-lived extraction pool, started on first use"""
+        with self._pool_lock:
+            if self._extraction_pool is None:
+                self._extraction_pool = ProcessPoolExecutor(max_workers=config.EXTRACTION_WORKERS,
+                                                            mp_context=multiprocessing.get_context("spawn"))
+            return self._extraction_pool
     
-    def _extract_json(self, file_path: str) -> Optional[str]:
-        """Extract and format JSON data"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                # Convert JSON to readable text format
-                return json.dumps(data, indent=2)
-        except Exception as e:
-            print(f"Error reading JSON file {file_path}: {e}")
+    def close(self):
+        """Shut down the extraction pool, if one was started"""
+        with self._pool_lock:
+            pool, self._extraction_pool = self._extraction_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _get_extraction_cache(self) -> Optional[ExtractionCache]:
+        """Return the persistent extraction cache, if enabled"""
+        if not config.ENABLE_EXTRACTION_CACHE or not config.CACHE_DIR:
             return None
+        if self.extraction_cache is None:
+            self.extraction_cache = ExtractionCache(os.path.join(config.CACHE_DIR, "extracted"))
+        return self.extraction_cache
     
     def _combine_documents(self, documents: Dict[str, str]) -> str:
         """Combine all documents into a single context string"""
@@ -159,5 +316,29 @@ class DocumentProcessor:
         
         return "\n".join(summary)
 
-# Global document processor instance
-document_processor = DocumentProcessor()
+# Global document processor instance, created on first use
+_document_processor: Optional[DocumentProcessor] = None
+_document_processor_lock = threading.Lock()
+
+
+def get_document_processor() -> DocumentProcessor:
+    """Return the global document processor"""
+    global _document_processor
+    if _document_processor is None:
+        with _document_processor_lock:
+            if _document_processor is None:
+                _document_processor = DocumentProcessor()
+    return _document_processor
+
+
+def close_document_processor():
+    """Release the document processor's worker processes, if it was created"""
+    if _document_processor is not None:
+        _document_processor.close()
+
+
+def __getattr__(name: str):
+    # Keep `from brandon_bot.document_processor import document_processor` working
+    if name == "document_processor":
+        return get_document_processor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
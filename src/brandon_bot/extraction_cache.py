@@ -0,0 +1,118 @@
+"""
+Persistent cache of extracted document text for Brandon Resume Bot
+
+Extracted text is stored on disk keyed by the file's content hash and the
+extractor version. A small manifest remembers each file's size and mtime,
+so unchanged files are recognised with a single stat call and never parsed
+(or even hashed) again - across restarts and across worker processes.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+# Bump when extraction logic changes so cached text is re-extracted
+EXTRACTOR_VERSION = 1
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """On-disk map of content hash -> extracted text, with a stat manifest"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.manifest: Dict[str, Dict] = self._read_manifest()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _read_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+            if manifest.get("version") == EXTRACTOR_VERSION:
+                return manifest.get("files", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _text_path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, f"{content_hash}-v{EXTRACTOR_VERSION}.txt")
+
+    def _read_text(self, content_hash: str) -> Optional[str]:
+        try:
+            with open(self._text_path(content_hash), "r", encoding="utf-8") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def lookup(self, file_path: str) -> Optional[str]:
+        """
+        Return cached text for file_path, or None if it must be extracted
+
+        Files whose size and mtime match the manifest are served after one
+        stat call. Otherwise the file is hashed, so a touched-but-unchanged
+        or renamed file still hits the cache.
+        """
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        entry = self.manifest.get(key)
+
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            text = self._read_text(entry["hash"])
+            if text is not None:
+                self.hits += 1
+                return text
+
+        content_hash = hash_file(file_path)
+        self.manifest[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": content_hash}
+        self._dirty = True
+        text = self._read_text(content_hash)
+        if text is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return text
+
+    def store(self, file_path: str, text: str):
+        """Cache freshly extracted text for file_path"""
+        key = os.path.abspath(file_path)
+        entry = self.manifest.get(key)
+        content_hash = entry["hash"] if entry else hash_file(file_path)
+        if not entry:
+            stat = os.stat(file_path)
+            self.manifest[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": content_hash}
+            self._dirty = True
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = self._text_path(content_hash) + f".{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(temp_path, self._text_path(content_hash))
+        except OSError as e:
+            print(f"⚠️  Could not cache extracted text for {file_path}: {e}")
+
+    def save(self):
+        """Persist the manifest if it changed"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": EXTRACTOR_VERSION, "files": self.manifest}, file)
+            os.replace(temp_path, self.manifest_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not save extraction cache manifest: {e}")
@@ -0,0 +1,124 @@
+"""
+Extractive fallback answers for Brandon Resume Bot
+
+When there is no agent (no API key) or the model is unavailable - the
+circuit is open, calls time out, the API is rate limiting or the bot is
+overloaded - questions are answered straight from the loaded documents
+instead of with an apology. The snapshot's BM25 index picks the best
+matching sections, and the lines sharing the most words with the question
+are returned as bullet snippets under their section headings, clearly
+labeled as an excerpt rather than a written answer.
+
+Everything is local: no network, no embeddings, well under a millisecond
+for a resume-sized corpus. Snippets are verbatim document text, so they
+are passed through the privacy filter before being returned.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from .knowledge import KnowledgeSnapshot
+from .privacy import get_privacy_filter
+from .retrieval import Chunk, is_heading, tokenize
+
+FALLBACK_HEADER = ("⚠️ *My AI service is unavailable right now, so here are the most relevant "
+                   "excerpts from Brandon's documents:*")
+FALLBACK_FOOTER = "*This is an automatic excerpt, not a written answer - please try again in a minute for a full response.*"
+NO_MATCH_ANSWER = ("⚠️ *My AI service is unavailable right now, and I couldn't find that in Brandon's documents.* "
+                   "Try asking about his experience, skills, projects or education.")
+
+# Snippets longer than this are cut at a word boundary
+MAX_SNIPPET_CHARS = 300
+
+# Lines written for the model or about the bot itself rather than about Brandon
+META_LINE_PATTERN = re.compile(
+    r"instructions? for (?:the )?llm|\[confidential|confidentiality note|ai assistant|brandon-bot|"
+    r"chat interface|session management|how to use|trained on|openai",
+    re.IGNORECASE,
+)
+
+
+def _section_title(chunk: Chunk) -> str:
+    """Innermost heading of the chunk's section path"""
+    return (chunk.section or "General").split(" / ")[-1].strip()
+
+
+def _lines(chunk: Chunk) -> List[Tuple[str, str]]:
+    """(heading, line) for each content line of a chunk; headings inside the chunk start a new group"""
+    headings = {part.strip() for part in (chunk.section or "").split(" / ")}
+    headings.add((chunk.section or "").strip())
+    title = _section_title(chunk)
+    lines = []
+    for line in chunk.text.splitlines():
+        line = line.strip(" \t•-*")
+        if not line or line in headings or META_LINE_PATTERN.search(line):
+            continue
+        if is_heading(line):
+            title = line.split(" / ")[-1]
+            continue
+        lines.append((title, line))
+    return lines
+
+
+def _shorten(line: str) -> str:
+    line = " ".join(line.split())
+    if len(line) <= MAX_SNIPPET_CHARS:
+        return line
+    return line[:MAX_SNIPPET_CHARS].rsplit(" ", 1)[0] + "…"
+
+
+class FallbackResponder:
+    """Answers a question with the best-matching document lines, formatted as bullets"""
+
+    def __init__(self, max_sections: int = 3, max_snippets: int = 6, per_section: int = 2):
+        self.max_sections = max_sections
+        self.max_snippets = max_snippets
+        self.per_section = per_section
+
+    def snippets(self, snapshot: KnowledgeSnapshot, question: str) -> List[Tuple[str, List[str]]]:
+        """(section title, lines) for the sections best matching the question, best first"""
+        terms = set(tokenize(question))
+        sections: List[Tuple[str, List[str]]] = []
+        remaining = self.max_snippets
+        for chunk, _ in snapshot.index.search(question, self.max_sections):
+            lines = _lines(chunk)
+            if not lines or remaining <= 0:
+                continue
+            # A line's heading counts towards its match, so "education" finds the degree line
+            overlaps = [len(terms & set(tokenize(f"{title} {line}"))) for title, line in lines]
+            # Most shared words first (earlier lines on ties), then back in document order
+            ranked = sorted(range(len(lines)), key=lambda position: -overlaps[position])
+            best = sorted(position for position in ranked[:min(self.per_section, remaining)] if overlaps[position])
+            if not best:
+                # Only the section heading matched - show how the section starts
+                best = [0]
+            remaining -= len(best)
+            for position in best:
+                title, line = lines[position]
+                if not sections or sections[-1][0] != title:
+                    sections.append((title, []))
+                sections[-1][1].append(_shorten(line))
+        return sections
+
+    def answer(self, snapshot: KnowledgeSnapshot, question: str) -> str:
+        """Labeled, privacy-filtered extractive answer"""
+        sections = self.snippets(snapshot, question)
+        if not sections:
+            return NO_MATCH_ANSWER
+        parts = [FALLBACK_HEADER]
+        for title, lines in sections:
+            parts.append(f"**{title}**\n" + "\n".join(f"- {line}" for line in lines))
+        parts.append(FALLBACK_FOOTER)
+        return get_privacy_filter().redact("\n\n".join(parts)).text
+
+
+_responder: Optional[FallbackResponder] = None
+
+
+def get_fallback_responder() -> FallbackResponder:
+    """Process-wide responder configured from Config"""
+    global _responder
+    if _responder is None:
+        from .config import config
+        _responder = FallbackResponder(max_snippets=config.FALLBACK_MAX_SNIPPETS)
+    return _responder
@@ -0,0 +1,233 @@
+"""
+Local intent pre-classifier for Brandon Resume Bot
+
+Requests for Brandon's contact details and questions about confidential
+Apple matters only ever get a canned policy response, so they are answered
+here without a model call. Detection is two-staged:
+
+- phrase rules (regexes) for the unambiguous wordings, and
+- a small multinomial naive Bayes classifier over word unigrams and
+  bigrams, trained at import on the examples below, for paraphrases the
+  rules miss. It only fires above a high posterior threshold, so ordinary
+  resume questions fall through to the model.
+
+Every trigger is logged and counted in brandon_bot_intent_triggers_total.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .privacy import CONTACT_REDIRECT
+from .retrieval import tokenize
+
+CONTACT = "contact"
+CONFIDENTIAL = "confidential"
+OTHER = "other"
+
+POLICY_RESPONSES = {
+    CONTACT: CONTACT_REDIRECT,
+    CONFIDENTIAL: (
+        "Out of respect for his current employer, Brandon can't share confidential information about Apple - "
+        "such as program or project names, sites, budgets, tools or internal policies. I'm happy to talk about "
+        "his skills, the kind of work he does and his achievements, and for anything more specific please "
+        "contact Brandon directly through LinkedIn."
+    ),
+}
+
+_SUBJECT = r"(?:his|brandon'?s|your)"
+_APPLE = r"\b(?:apple|apple's|cupertino|apple\s+park)\b"
+# A contact detail, optionally qualified ("his personal email address")
+_DETAIL = (r"(?:personal\s+|private\s+|work\s+|home\s+|direct\s+)?"
+           r"(?:e-?mail(?:\s+address)?|(?:phone|cell|mobile|telephone)(?:\s+number)?|"
+           r"(?:home\s+|mailing\s+|street\s+)?address|contact\s+(?:info|information|details|number))")
+# Details of confidential work, as opposed to the work itself
+_SECRET_DETAIL = (r"(?:code\s*names?|(?:program|project|product|supplier|vendor|site)\s+names?|names?\s+of|"
+                  r"which\s+(?:sites?|factor(?:y|ies)|suppliers?|vendors?)|factor(?:y|ies)|plants?|facilit(?:y|ies)|"
+                  r"headcount|roadmaps?|unreleased|upcoming\s+products?|internal\s+(?:tools?|tooling|polic(?:y|ies)))")
+# Money and policy words only count with a possessive or quantity wording -
+# "he cut costs at Apple" is an achievement, "Apple's budget" is not
+_MONEY = r"(?:budgets?|spend(?:ing)?|costs?)"
+
+RULES: Dict[str, Sequence[str]] = {
+    CONTACT: (
+        # "what is his email?", "share Brandon's phone number" - the detail ends the sentence
+        rf"\b(?:what(?:'s|\s+is|\s+are)|give|share|send|provide|tell|get|have|need|know|find)\b.{{0,30}}"
+        rf"\b{_SUBJECT}\s+{_DETAIL}\s*[?.!]*$",
+        # Unambiguous anywhere: "his phone number", "his email address"
+        rf"\b{_SUBJECT}\s+(?:personal\s+|private\s+|work\s+|direct\s+)?"
+        r"(?:e-?mail\s+address|(?:phone|cell|mobile|telephone)\s+number|home\s+address|mailing\s+address)\b",
+        r"\bhow\s+(?:can|do|could|should|would)\s+(?:i|we|recruiters?|someone)\s+(?:contact|reach|e-?mail|call|text)\s+"
+        r"(?:him|brandon)\b(?!\s+(?:on|through|via)\s+linkedin)",
+        r"\b(?:contact|reach|call|e-?mail|text|phone|ring)\s+(?:him|brandon)\s*[?.!]*$",
+        r"\b(?:contact|personal)\s+(?:info|information|details)\b",
+        r"\bwhere\s+does\s+(?:he|brandon)\s+live\b",
+        r"\bget\s+in\s+touch\s+with\s+(?:him|brandon)\b",
+    ),
+    CONFIDENTIAL: (
+        rf"{_APPLE}.{{0,60}}\b{_SECRET_DETAIL}\b",
+        rf"\b{_SECRET_DETAIL}\b.{{0,40}}{_APPLE}",
+        rf"\bapple'?s\s+(?:\w+\s+)?(?:{_MONEY}|polic(?:y|ies))\b",
+        r"\bhow\s+much\s+(?:money\s+)?(?:does|did|do|is|was|will)\s+apple\b.{0,20}\b(?:spend|spent|pay|paid|budget|cost)",
+        rf"\bthe\s+{_MONEY}\s+(?:of|for)\b.{{0,40}}{_APPLE}",
+        r"\b(?:confidential|internal|proprietary|under\s+nda)\b.{0,40}\b(?:apple|projects?|programs?)\b",
+    ),
+}
+
+# Training examples for the fallback classifier. OTHER holds the ordinary
+# questions it must leave alone - including ones about Apple or email tools.
+EXAMPLES: Dict[str, Tuple[str, ...]] = {
+    CONTACT: (
+        "what is his email",
+        "can I have his phone number",
+        "how do I reach him directly",
+        "give me brandon's contact details",
+        "what's the best way to get hold of him",
+        "is there a number I can call",
+        "where does brandon live",
+        "send me his home address",
+        "can you share his cell",
+        "how can recruiters contact him outside linkedin",
+        "what is his personal email address",
+        "drop me his mobile",
+        "can I text him",
+        "does he have a phone I can ring",
+        "which city and street does he live on",
+    ),
+    CONFIDENTIAL: (
+        "what are the names of the apple programs he is on",
+        "which apple project code names has he worked on",
+        "what are the code names of his apple products",
+        "which apple factories does he visit",
+        "where are apple's manufacturing sites",
+        "what is the budget of his team at apple",
+        "how much does apple spend on his programs",
+        "what equipment does apple use in the factory",
+        "which software tools does apple use internally",
+        "what internal apple policies does he follow",
+        "tell me about unreleased apple products",
+        "what is apple's product roadmap",
+        "what are the names of apple's suppliers he works with",
+        "what confidential projects is he on at apple",
+        "which apple sites and locations does he support",
+    ),
+    OTHER: (
+        "what are his technical skills",
+        "what programming languages does he know",
+        "tell me about his experience",
+        "what did he do at apple",
+        "what is his role at apple",
+        "how long has he worked at apple",
+        "what is his educational background",
+        "what projects has he built outside work",
+        "does he have leadership experience",
+        "what are his biggest achievements",
+        "is he good with python and sql",
+        "has he managed a team",
+        "what kind of role is he looking for",
+        "has he built email automation tools",
+        "what machine learning projects has he done",
+        "how does he handle cross functional programs",
+        "what industries has he worked in",
+        "what certifications does he have",
+        "tell me about his data engineering work",
+        "why should we hire him",
+        "what are his strengths and weaknesses",
+        "does he have experience with manufacturing test",
+        "what tools and technologies does he use",
+        "how many years of experience does he have",
+        "which teams at apple did he collaborate with",
+        "what skills did he build at apple",
+        "when does he have time for a phone screen",
+        "what projects did he lead at apple",
+        "did he manage suppliers and vendors",
+        "what is his number one strength",
+        "does he have email marketing experience",
+        "can we call him for an interview",
+        "what is the secret to his success",
+        "did he reduce costs at apple",
+        "how did he cut costs at apple by 20 percent",
+    ),
+}
+
+
+class Intent(NamedTuple):
+    """A classified policy intent"""
+    name: str
+    reason: str
+    response: str
+
+
+def _features(text: str) -> List[str]:
+    """Content-word unigrams and bigrams"""
+    tokens = tokenize(text)
+    return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+
+class NaiveBayes:
+    """Multinomial naive Bayes with add-one smoothing"""
+
+    def __init__(self, examples: Dict[str, Iterable[str]]):
+        self.classes = list(examples)
+        self.counts: Dict[str, Counter] = {}
+        self.totals: Dict[str, int] = {}
+        self.log_priors: Dict[str, float] = {}
+        documents = {label: list(texts) for label, texts in examples.items()}
+        total_documents = sum(len(texts) for texts in documents.values())
+        for label, texts in documents.items():
+            counts = Counter(feature for text in texts for feature in _features(text))
+            self.counts[label] = counts
+            self.totals[label] = sum(counts.values())
+            self.log_priors[label] = math.log(len(texts) / total_documents)
+        self.vocabulary = set().union(*self.counts.values())
+
+    def posteriors(self, text: str) -> Dict[str, float]:
+        """P(class | text); unseen features are ignored"""
+        features = [feature for feature in _features(text) if feature in self.vocabulary]
+        scores = {}
+        for label in self.classes:
+            denominator = self.totals[label] + len(self.vocabulary)
+            counts = self.counts[label]
+            scores[label] = self.log_priors[label] + sum(
+                math.log((counts[feature] + 1) / denominator) for feature in features)
+        top = max(scores.values())
+        exp = {label: math.exp(score - top) for label, score in scores.items()}
+        norm = sum(exp.values())
+        return {label: value / norm for label, value in exp.items()}
+
+
+class IntentClassifier:
+    """Phrase rules first, then the naive Bayes fallback"""
+
+    def __init__(self, threshold: float = 0.9, rules: Dict[str, Sequence[str]] = RULES,
+                 examples: Dict[str, Iterable[str]] = EXAMPLES):
+        self.threshold = threshold
+        self.rules = [(name, re.compile(pattern, re.IGNORECASE))
+                      for name, patterns in rules.items() for pattern in patterns]
+        self.model = NaiveBayes(examples)
+
+    def classify(self, text: str) -> Optional[Intent]:
+        """The policy intent of a question, or None if the model should answer it"""
+        for name, pattern in self.rules:
+            match = pattern.search(text)
+            if match:
+                return Intent(name, f"rule {match.group(0)!r}", POLICY_RESPONSES[name])
+
+        posteriors = self.model.posteriors(text)
+        name = max(posteriors, key=posteriors.get)
+        if name != OTHER and posteriors[name] >= self.threshold:
+            return Intent(name, f"classifier p={posteriors[name]:.2f}", POLICY_RESPONSES[name])
+        return None
+
+
+_classifier: Optional[IntentClassifier] = None
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """Process-wide classifier configured from Config"""
+    global _classifier
+    if _classifier is None:
+        from .config import config
+        _classifier = IntentClassifier(threshold=config.INTENT_CLASSIFIER_THRESHOLD)
+    return _classifier
@@ -0,0 +1,61 @@
+"""
+Immutable knowledge snapshots for Brandon Resume Bot
+
+A KnowledgeSnapshot bundles everything a chat turn reads - the loaded
+documents, their chunks and indexes, the system instructions and the Agent
+built from them. Reloading documents builds a brand new snapshot and swaps
+the reference atomically, so requests that already hold the old snapshot
+finish on it undisturbed.
+"""
+
+import hashlib
+import itertools
+import time
+from typing import Dict, List
+
+from .retrieval import BM25Index, Chunk, hybrid_search
+
+_versions = itertools.count(1)
+
+
+def compute_fingerprint(documents: Dict[str, str], *settings: str) -> str:
+    """Hash of the document names and contents plus any settings that shape answers"""
+    digest = hashlib.sha256()
+    for value in settings:
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    for doc_name in sorted(documents):
+        digest.update(doc_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(documents[doc_name].encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class KnowledgeSnapshot:
+    """Read-only bundle of documents, indexes and the agent built from them"""
+
+    def __init__(self, documents: Dict[str, str], chunks: List[Chunk], index: BM25Index,
+                 vector_index, instructions: str, agent, fingerprint: str):
+        self.documents = documents
+        self.chunks = chunks
+        self.index = index
+        self.vector_index = vector_index
+        self.instructions = instructions
+        self.agent = agent
+        self.fingerprint = fingerprint
+        self.version = next(_versions)
+        self.created_at = time.time()
+
+    @classmethod
+    def empty(cls) -> "KnowledgeSnapshot":
+        """Placeholder snapshot used before documents are loaded"""
+        return cls({}, [], BM25Index([]), None, "", None, "")
+
+    def search(self, query: str, top_k: int = 5) -> List[Chunk]:
+        """Return the chunks most relevant to the query"""
+        return hybrid_search(query, self.chunks, self.index, self.vector_index, top_k)
+
+    def __repr__(self) -> str:
+        agent_state = "ready" if self.agent else "no agent"
+        return f"KnowledgeSnapshot(v{self.version}, {len(self.documents)} docs, {agent_state})"
@@ -0,0 +1,119 @@
+"""
+Bounded conversation memory for Brandon Resume Bot
+
+Recent exchanges are kept verbatim and sent back to the model as input
+items, up to a token budget. Older exchanges are folded into a compact
+running summary, so long conversations keep their context while both the
+prompt size and the per-session memory stay bounded.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Rough chars-per-token ratio for English text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate without a tokenizer"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _shorten(text: str, limit: int) -> str:
+    """First sentence of text, cut to at most limit characters"""
+    text = " ".join(text.split())
+    match = _SENTENCE_END.search(text)
+    if match and match.start() < limit:
+        text = text[:match.start()]
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+class ConversationMemory:
+    """Recent turns verbatim plus a rolling summary of older ones"""
+
+    def __init__(self, max_exchanges: int = 10, max_bytes: int = 32768, summary_max_chars: int = 1500):
+        self.max_exchanges = max_exchanges
+        self.max_bytes = max_bytes
+        self.summary_max_chars = summary_max_chars
+        self.turns: List[Dict[str, str]] = []
+        self.summary_lines: List[str] = []
+        self.total_exchanges = 0
+
+    @property
+    def summary(self) -> str:
+        return "\n".join(self.summary_lines)
+
+    @property
+    def size_bytes(self) -> int:
+        """UTF-8 size of the conversation's text"""
+        return (sum(len(turn["content"].encode("utf-8")) for turn in self.turns)
+                + sum(len(line.encode("utf-8")) for line in self.summary_lines))
+
+    def add_exchange(self, user_message: str, bot_response: str):
+        """Record one exchange, then fold old turns to stay within limits"""
+        self.turns.append({"role": "user", "content": user_message})
+        self.turns.append({"role": "assistant", "content": bot_response})
+        self.total_exchanges += 1
+        self._compact()
+
+    def replace(self, turns: List[Dict[str, str]]):
+        """Replace the verbatim turns (e.g. history restored by a caller)"""
+        self.turns = list(turns)
+        self._compact()
+
+    def reset(self):
+        """Forget everything"""
+        self.turns = []
+        self.summary_lines = []
+        self.total_exchanges = 0
+
+    def last_user_message(self) -> Optional[str]:
+        """Most recent user message still held verbatim"""
+        for turn in reversed(self.turns):
+            if turn["role"] == "user":
+                return turn["content"]
+        return None
+
+    def input_items(self, token_budget: int) -> List[Dict[str, str]]:
+        """
+        Conversation context as Runner input items, oldest first
+
+        The summary is always included; recent turns are added newest-first
+        until the token budget is spent, in whole user/assistant pairs.
+        """
+        items: List[Dict[str, str]] = []
+        remaining = token_budget
+        if self.summary_lines:
+            summary = "Summary of earlier conversation:\n" + self.summary
+            remaining -= estimate_tokens(summary)
+            items.append({"role": "system", "content": summary})
+
+        recent: List[Dict[str, str]] = []
+        for i in range(len(self.turns) - 2, -1, -2):
+            pair = self.turns[i:i + 2]
+            cost = sum(estimate_tokens(turn["content"]) for turn in pair)
+            if cost > remaining:
+                break
+            remaining -= cost
+            recent[:0] = pair
+        return items + recent
+
+    def _compact(self):
+        """Fold the oldest exchanges into the summary until within limits"""
+        while len(self.turns) > 2 * self.max_exchanges or (self.turns and self.size_bytes > self.max_bytes):
+            oldest = self.turns[:2]
+            del self.turns[:2]
+            self._fold(oldest)
+
+        while self.summary_lines and (
+            len(self.summary) > self.summary_max_chars or self.size_bytes > self.max_bytes
+        ):
+            self.summary_lines.pop(0)
+
+    def _fold(self, turns: List[Dict[str, str]]):
+        """Add a one-line digest of an exchange to the summary"""
+        question = next((t["content"] for t in turns if t["role"] == "user"), "")
+        answer = next((t["content"] for t in turns if t["role"] == "assistant"), "")
+        self.summary_lines.append(f"- Asked: {_shorten(question, 120)} | Answered: {_shorten(answer, 200)}")
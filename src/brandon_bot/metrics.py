@@ -0,0 +1,287 @@
+"""
+Prometheus-style metrics for Brandon Resume Bot
+
+A tiny dependency-free registry of counters, gauges and histograms, rendered
+in the Prometheus text exposition format and served over HTTP on its own
+port next to the Gradio app (GET /metrics), along with the per-stage
+timings of the slowest recent turns (GET /debug/turns?limit=20, only with
+ENABLE_DEBUG_TURNS). Recording a sample is a dict
+lookup plus an addition under a lock, cheap enough to stay on in
+production. Values that already live elsewhere (cache and admission stats)
+are read through callbacks at scrape time instead of being duplicated.
+"""
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import spans
+from .config import config
+
+# Latency buckets in seconds, from cache hits to slow model calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class: a named family of samples keyed by label values"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels: str):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Bucketed distribution with sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    """Gauge or counter whose samples are read from a callback at scrape time"""
+
+    def __init__(self, name: str, documentation: str, kind: str,
+                 callback: Callable[[], Dict[LabelValues, float]], labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        try:
+            samples = self.callback()
+        except Exception:
+            return []
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(samples.items())]
+
+
+class Registry:
+    """Ordered collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric; re-registering a name replaces the previous one"""
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name: str, documentation: str, kind: str,
+                 callback: Callable[[], Dict[LabelValues, float]], labelnames: Sequence[str] = ()) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, kind, callback, labelnames))
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# === Chat turns ===
+REQUEST_LATENCY = REGISTRY.histogram(
+    "brandon_bot_request_latency_seconds", "End-to-end latency of chat turns", ["mode", "source"])
+TIME_TO_FIRST_TOKEN = REGISTRY.histogram(
+    "brandon_bot_time_to_first_token_seconds", "Time until the first streamed token", ["source"])
+REQUESTS = REGISTRY.counter(
+    "brandon_bot_requests_total", "Chat turns by how they were answered", ["source"])
+TOKENS = REGISTRY.counter(
+    "brandon_bot_tokens_total", "Model tokens from run usage", ["direction"])
+ERRORS = REGISTRY.counter(
+    "brandon_bot_errors_total", "Errors by exception type", ["type"])
+INTENT_TRIGGERS = REGISTRY.counter(
+    "brandon_bot_intent_triggers_total", "Requests answered locally with a policy response", ["intent"])
+REDACTIONS = REGISTRY.counter(
+    "brandon_bot_redactions_total", "Spans removed by the privacy filter", ["kind"])
+FALLBACK_ANSWERS = REGISTRY.counter(
+    "brandon_bot_fallback_answers_total", "Extractive answers served without the model", ["reason"])
+
+# === Documents ===
+DOCUMENT_EXTRACTION = REGISTRY.histogram(
+    "brandon_bot_document_extraction_seconds", "Time to extract one document", ["extension"])
+KNOWLEDGE_RELOAD = REGISTRY.histogram(
+    "brandon_bot_knowledge_reload_seconds", "Time to load documents and build a knowledge snapshot")
+DOCUMENTS_LOADED = REGISTRY.gauge(
+    "brandon_bot_documents_loaded", "Documents in the current knowledge snapshot")
+
+
+def observe_error(error: BaseException):
+    """Count an exception by class name"""
+    ERRORS.inc(type=type(error).__name__)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path in ("/metrics", "/"):
+            body = self.registry.render().encode("utf-8")
+        elif url.path == "/debug/turns" and config.ENABLE_DEBUG_TURNS:
+            # Opt-in: the view quotes visitor questions, which a metrics scraper has no need for
+            try:
+                limit = int(parse_qs(url.query).get("limit", ["20"])[0])
+            except ValueError:
+                limit = 20
+            body = spans.TURN_LOG.render(limit).encode("utf-8")
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would drown the app's own logs
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics from a daemon thread (idempotent)"""
+    global _server
+    if _server is not None:
+        return _server
+    try:
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        print(f"⚠️  Metrics server not started on {host}:{port}: {e}")
+        return None
+    _server.daemon_threads = True
+    threading.Thread(target=_server.serve_forever, name="brandon-bot-metrics", daemon=True).start()
+    print(f"📈 Metrics available at http://{host}:{_server.server_address[1]}/metrics")
+    return _server
+
+
+def stop_metrics_server():
+    """Shut the metrics server down"""
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
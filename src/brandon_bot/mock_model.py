@@ -0,0 +1,227 @@
+"""
+Offline mock model backend for Brandon Resume Bot
+
+Plugs into the OpenAI Agents SDK as a local ModelProvider, so the full
+Gradio -> bot -> privacy filter path runs without network access or an
+OPENAI_API_KEY. Answers are deterministic: the sentences of the document
+excerpts in the prompt that best overlap the question. Latency follows a
+configurable log-normal distribution for the first token plus a per-token
+delay, responses stream word by word, and errors can be injected at a
+configurable rate.
+
+Select it with MODEL_BACKEND=mock.
+"""
+
+import asyncio
+import math
+import random
+import re
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+from agents.items import ModelResponse
+from agents.models.interface import Model, ModelProvider
+from agents.usage import Usage
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseCreatedEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+from .memory import estimate_tokens
+from .retrieval import tokenize
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"\S+\s*")
+
+FALLBACK_ANSWER = "I don't have that information in Brandon's documents."
+
+
+class MockModelError(RuntimeError):
+    """Injected failure, standing in for an API error"""
+
+    # Treated like a transient API failure by the resilience layer
+    retryable = True
+
+
+def _content_text(content: Any) -> str:
+    """Text of an input item's content (a string or a list of content parts)"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return ""
+
+
+def _terms(text: str) -> set:
+    """Content words with a crude plural/verb 's' stripped, so 'knows' matches 'know'"""
+    return {token[:-1] if len(token) > 3 and token.endswith("s") else token for token in tokenize(text)}
+
+
+def compose_answer(question: str, context: Iterable[str], max_sentences: int = 3) -> str:
+    """Sentences of the context sharing the most content words with the question, in document order"""
+    terms = _terms(question)
+    sentences: List[str] = []
+    for text in context:
+        sentences.extend(s.strip() for s in _SENTENCE_SPLIT.split(text) if len(s.strip()) > 20)
+
+    scored = []
+    for position, sentence in enumerate(sentences):
+        overlap = len(terms & _terms(sentence))
+        if overlap:
+            scored.append((-overlap, position, sentence))
+    if not scored:
+        return FALLBACK_ANSWER
+
+    best = sorted(sorted(scored)[:max_sentences], key=lambda item: item[1])
+    seen = []
+    for _, _, sentence in best:
+        if sentence not in seen:
+            seen.append(sentence)
+    return "Based on Brandon's documents: " + " ".join(seen)
+
+
+class MockModel(Model):
+    """Deterministic local stand-in for a Responses API model"""
+
+    def __init__(self, name: str = "mock", latency_ms: float = 300.0, latency_sigma: float = 0.5,
+                 token_latency_ms: float = 15.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.token_latency_ms = token_latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    def _first_token_delay(self) -> float:
+        """Seconds until the first token, log-normal around latency_ms"""
+        if self.latency_ms <= 0:
+            return 0.0
+        return self._random.lognormvariate(math.log(self.latency_ms), self.latency_sigma) / 1000
+
+    def _answer(self, system_instructions: Optional[str], input: Any) -> tuple:
+        """(question, answer, input token estimate) for one request"""
+        items = [{"role": "user", "content": input}] if isinstance(input, str) else list(input)
+        question = ""
+        excerpts = []
+        for item in items:
+            text = _content_text(item.get("content"))
+            if item.get("role") == "user":
+                question = text
+            elif item.get("role") == "system":
+                excerpts.append(text)
+        # Retrieved excerpts arrive as system items; without retrieval the documents are in the instructions
+        context = excerpts or [system_instructions or ""]
+        prompt_tokens = estimate_tokens(system_instructions or "") + sum(map(estimate_tokens, excerpts))
+        return question, compose_answer(question, context), prompt_tokens + estimate_tokens(question)
+
+    async def _begin(self):
+        self.calls += 1
+        await asyncio.sleep(self._first_token_delay())
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise MockModelError("Injected mock model failure")
+
+    def _response(self, text: str, input_tokens: int) -> Response:
+        output_tokens = estimate_tokens(text)
+        return Response(
+            id=f"mock-{self.calls}",
+            created_at=0,
+            model=self.name,
+            object="response",
+            output=[_message(text)],
+            tool_choice="none",
+            tools=[],
+            top_p=None,
+            parallel_tool_calls=False,
+            status="completed",
+            usage=ResponseUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+                input_tokens_details=InputTokensDetails.model_validate({"cached_tokens": 0, "cache_write_tokens": 0}),
+                output_tokens_details=OutputTokensDetails.model_validate({"reasoning_tokens": 0}),
+            ),
+        )
+
+    async def get_response(self, system_instructions, input, model_settings, tools, output_schema,
+                           handoffs, tracing, **kwargs) -> ModelResponse:
+        _, text, input_tokens = self._answer(system_instructions, input)
+        await self._begin()
+        await asyncio.sleep(self.token_latency_ms * len(_WORD.findall(text)) / 1000)
+        output_tokens = estimate_tokens(text)
+        return ModelResponse(
+            output=[_message(text)],
+            usage=Usage(requests=1, input_tokens=input_tokens, output_tokens=output_tokens,
+                        total_tokens=input_tokens + output_tokens),
+            response_id=None,
+        )
+
+    async def stream_response(self, system_instructions, input, model_settings, tools, output_schema,
+                              handoffs, tracing, **kwargs) -> AsyncIterator[Any]:
+        _, text, input_tokens = self._answer(system_instructions, input)
+        response = self._response(text, input_tokens)
+        await self._begin()
+        yield ResponseCreatedEvent(type="response.created", response=response, sequence_number=0)
+
+        sequence = 1
+        for word in _WORD.findall(text):
+            yield ResponseTextDeltaEvent(
+                type="response.output_text.delta",
+                item_id="mock-message",
+                output_index=0,
+                content_index=0,
+                delta=word,
+                logprobs=[],
+                sequence_number=sequence,
+            )
+            sequence += 1
+            if self.token_latency_ms > 0:
+                await asyncio.sleep(self.token_latency_ms / 1000)
+
+        yield ResponseCompletedEvent(type="response.completed", response=response, sequence_number=sequence)
+
+
+def _message(text: str) -> ResponseOutputMessage:
+    return ResponseOutputMessage(
+        id="mock-message",
+        type="message",
+        role="assistant",
+        status="completed",
+        content=[ResponseOutputText(text=text, type="output_text", annotations=[], logprobs=[])],
+    )
+
+
+class MockModelProvider(ModelProvider):
+    """ModelProvider handing out one shared MockModel"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._model: Optional[MockModel] = None
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        if self._model is None:
+            self._model = MockModel(name=model_name or "mock", **self.settings)
+        return self._model
+
+
+_provider: Optional[MockModelProvider] = None
+
+
+def get_mock_provider() -> MockModelProvider:
+    """Process-wide provider configured from Config, so every snapshot shares one model"""
+    global _provider
+    if _provider is None:
+        from .config import config
+        _provider = MockModelProvider(
+            latency_ms=config.MOCK_LATENCY_MS,
+            latency_sigma=config.MOCK_LATENCY_SIGMA,
+            token_latency_ms=config.MOCK_TOKEN_LATENCY_MS,
+            error_rate=config.MOCK_ERROR_RATE,
+            seed=config.MOCK_SEED,
+        )
+    return _provider
@@ -0,0 +1,184 @@
+"""
+Pooled OpenAI HTTP client for Brandon Resume Bot
+
+Every turn used to go through whatever client the Agents SDK created
+lazily, with httpx's default 5-second keep-alive - so after a visitor
+paused to read an answer, their next question paid for a fresh TCP and
+TLS handshake. This module keeps one long-lived AsyncOpenAI client with a
+tuned connection pool (limits, long keep-alive, HTTP/2 when the optional
+h2 package is installed), opens its connection at startup and closes it
+on shutdown.
+
+httpx connection pools belong to the event loop that opened them, and
+model calls run on two loops here: Gradio's, which serves every visitor,
+and the bot's background loop for the CLI and suggestion warm-up. The pool
+therefore holds one client per loop - in practice one per process for web
+traffic. PooledOpenAIProvider hands the Agents SDK models bound to the
+current loop's client and is passed to every run, which makes it the
+default for the whole app without binding the SDK's global client to a
+single loop.
+
+A client can only be closed from its own loop while that loop runs, so
+close_openai_clients() has to be called before the web server stops -
+app.py does so on SIGINT/SIGTERM. Clients whose loop already stopped are
+skipped and their sockets are released with the process.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+from agents.models.interface import Model, ModelProvider
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class OpenAIClientPool:
+    """One pooled AsyncOpenAI client per event loop"""
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 120.0, timeout: float = 60.0, http2: bool = True,
+                 warm_model: Optional[str] = None):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        # HTTP/2 multiplexes concurrent streams over one connection, but needs the h2 package
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.warm_model = warm_model
+        self._clients: Dict[asyncio.AbstractEventLoop, "AsyncOpenAI"] = {}
+        self._warmed = set()
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def _create(self) -> "AsyncOpenAI":
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            http2=self.http2,
+        )
+        # Retries are left to the resilience layer, which knows the turn's deadline
+        return AsyncOpenAI(http_client=http_client, max_retries=0)
+
+    def get(self) -> "AsyncOpenAI":
+        """The client for the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                # Loops that were closed can't be reused; drop their clients
+                for stale in [other for other in self._clients if other.is_closed()]:
+                    del self._clients[stale]
+                    self._warmed.discard(stale)
+                client = self._clients[loop] = self._create()
+                self.created += 1
+        return client
+
+    async def warm(self) -> bool:
+        """
+        Open a connection for the running loop's client ahead of the first turn
+
+        Fetches the configured model's metadata - a tiny authenticated GET -
+        so DNS, TCP and TLS are done before a visitor asks anything. Only
+        the first call per loop does any work.
+        """
+        loop = asyncio.get_running_loop()
+        if loop in self._warmed:
+            return True
+        self._warmed.add(loop)
+        client = self.get()
+        try:
+            if self.warm_model:
+                await client.models.retrieve(self.warm_model)
+            else:
+                await client.models.list()
+            return True
+        except Exception as e:
+            print(f"⚠️  OpenAI connection warm-up failed: {e}")
+            return False
+
+    def close(self, timeout: float = 5.0):
+        """Close every client whose loop is still running (called on shutdown)"""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            self._warmed.clear()
+        for loop, client in clients:
+            if loop.is_closed() or not loop.is_running():
+                # Nothing can await the close any more; the sockets go with the process
+                continue
+            if loop is _running_loop():
+                # Can't block the loop we are running on; let it close the client afterwards
+                loop.create_task(client.close())
+                continue
+            future = asyncio.run_coroutine_threadsafe(client.close(), loop)
+            try:
+                future.result(timeout)
+            except Exception as e:
+                print(f"⚠️  Could not close OpenAI client cleanly: {e}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+class PooledOpenAIProvider(ModelProvider):
+    """ModelProvider whose models use the current loop's pooled client"""
+
+    def __init__(self, pool: OpenAIClientPool, default_model: str):
+        self.pool = pool
+        self.default_model = default_model
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        from agents import OpenAIResponsesModel
+        return OpenAIResponsesModel(model=model_name or self.default_model, openai_client=self.pool.get())
+
+
+_pool: Optional[OpenAIClientPool] = None
+_provider: Optional[PooledOpenAIProvider] = None
+
+
+def get_client_pool() -> OpenAIClientPool:
+    """Process-wide client pool configured from Config"""
+    global _pool
+    if _pool is None:
+        from .config import config
+        _pool = OpenAIClientPool(
+            max_connections=config.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.OPENAI_KEEPALIVE_SECONDS,
+            timeout=config.OPENAI_TIMEOUT_SECONDS,
+            http2=config.OPENAI_HTTP2,
+            warm_model=config.MODEL_NAME,
+        )
+    return _pool
+
+
+def get_openai_provider() -> PooledOpenAIProvider:
+    """Process-wide provider over the shared pool"""
+    global _provider
+    if _provider is None:
+        from .config import config
+        _provider = PooledOpenAIProvider(get_client_pool(), config.MODEL_NAME)
+    return _provider
+
+
+def close_openai_clients():
+    """Close the pooled clients, if any were created"""
+    if _pool is not None:
+        _pool.close()
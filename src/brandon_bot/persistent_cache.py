@@ -0,0 +1,183 @@
+"""
+Shared persistent answer cache for Brandon Resume Bot
+
+Answers are stored in a local SQLite database in WAL mode, so every worker
+process on the machine reads the others' completions and the cache stays
+warm across restarts. Reads use one connection per thread and never block
+on writers; all writes go through a single background thread that commits
+them in batches and keeps the table within a row budget (least recently
+used rows are evicted first).
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used);
+CREATE INDEX IF NOT EXISTS answers_fingerprint ON answers (fingerprint, last_used);
+"""
+
+# Sentinel that tells the writer thread to exit
+_STOP = object()
+
+
+class PersistentAnswerCache:
+    """SQLite (WAL) answer store shared by all workers using the same file"""
+
+    def __init__(self, path: str, max_entries: int = 5000, ttl_seconds: float = 86400,
+                 batch_size: int = 64, flush_interval: float = 0.05):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._queue: "queue.Queue" = queue.Queue()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        writer = self._connect()
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.executescript(_SCHEMA)
+        writer.commit()
+        self._writer_connection = writer
+        self._writer = threading.Thread(target=self._write_loop, name="brandon-bot-cache-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        """Connection owned by the calling thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _fresh(self, created_at: float) -> bool:
+        return self.ttl_seconds <= 0 or time.time() - created_at < self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored answer for key, or None"""
+        try:
+            row = self._reader().execute(
+                "SELECT answer, created_at FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading answer cache: {e}")
+            row = None
+        if row is not None and self._fresh(row[1]):
+            self.hits += 1
+            self._queue.put(("touch", key, time.time()))
+            return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, fingerprint: str, question: str, answer: str):
+        """Queue an answer for the writer thread"""
+        self._queue.put(("put", key, fingerprint, question, answer, time.time()))
+
+    def recent(self, fingerprint: str, limit: int) -> List[Tuple[str, str]]:
+        """Most recently used (question, answer) pairs for a fingerprint"""
+        try:
+            rows = self._reader().execute(
+                "SELECT question, answer, created_at FROM answers WHERE fingerprint = ? "
+                "ORDER BY last_used DESC LIMIT ?", (fingerprint, limit)
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error reading answer cache: {e}")
+            return []
+        return [(question, answer) for question, answer, created_at in rows if self._fresh(created_at)]
+
+    def discard_fingerprint(self, fingerprint: str):
+        """Queue deletion of every answer built from the given knowledge"""
+        self._queue.put(("discard", fingerprint))
+
+    def flush(self):
+        """Block until every queued write is committed"""
+        self._queue.join()
+
+    def close(self):
+        """Commit pending writes and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout=5)
+
+    def __len__(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Give concurrent completions a moment to join the same transaction
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is _STOP
+            try:
+                self._apply([op for op in batch if op is not _STOP])
+            except sqlite3.Error as e:
+                print(f"Error writing answer cache: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._writer_connection.close()
+                return
+
+    def _apply(self, batch: List[Tuple]):
+        """Commit one batch of writes, then enforce the TTL and row budget"""
+        if not batch:
+            return
+        connection = self._writer_connection
+        with connection:
+            for op in batch:
+                if op[0] == "put":
+                    _, key, fingerprint, question, answer, now = op
+                    connection.execute(
+                        "INSERT OR REPLACE INTO answers (key, fingerprint, question, answer, created_at, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", (key, fingerprint, question, answer, now, now)
+                    )
+                elif op[0] == "touch":
+                    connection.execute("UPDATE answers SET last_used = ? WHERE key = ?", (op[2], op[1]))
+                elif op[0] == "discard":
+                    connection.execute("DELETE FROM answers WHERE fingerprint = ?", (op[1],))
+
+            if self.ttl_seconds > 0:
+                connection.execute("DELETE FROM answers WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            connection.execute(
+                "DELETE FROM answers WHERE key IN "
+                "(SELECT key FROM answers ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+            )
@@ -0,0 +1,320 @@
+"""
+Privacy and confidentiality filter for Brandon Resume Bot
+
+Backs up the rules in SYSTEM_PROMPT with a check in code. Email addresses,
+phone numbers, street addresses and confidential terms are redacted span
+by span, so one leaked detail no longer throws away an otherwise good
+answer.
+
+All patterns are compiled once. The term list is folded into a character
+trie and emitted as nested alternations, so the regex engine walks shared
+prefixes once per position - the Aho-Corasick idea, executed by the C
+regex engine instead of a Python loop. Every pattern starts with a literal
+or character class so the engine can skip ahead to candidates, and cheap
+substring checks (an "@", any digits, ten for a phone number, the first
+word of a term) skip most scans for the common clean answer. A typical
+answer is scanned in microseconds (see benchmarks/bench_privacy.py).
+
+StreamRedactor applies the same filter to streamed output: it only emits
+text that no later chunk can turn into a match, holding back the trailing
+partial word and any recent digits or term prefixes until they are
+settled.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import metrics
+
+CONTACT_REDIRECT = "I can provide information about Brandon's professional background, but for contact information, please connect with him on LinkedIn or other professional networking platforms."
+
+# Shown in place of redacted spans
+CONTACT_PLACEHOLDER = "[contact details removed - please connect with Brandon on LinkedIn]"
+CONFIDENTIAL_PLACEHOLDER = "[confidential]"
+
+# Markings that only appear when an answer quotes confidential Apple material;
+# program, project and site names go in CONFIDENTIAL_TERMS
+DEFAULT_CONFIDENTIAL_TERMS = (
+    "apple confidential",
+    "apple internal only",
+    "apple proprietary",
+    "internal use only",
+    "proprietary and confidential",
+    "confidential and proprietary",
+)
+
+EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+
+# The phone and address patterns start with a character class and check the
+# character before the match in a lookbehind after it, so the regex engine
+# can skip straight to candidate characters instead of trying every position.
+
+# US-style numbers: 555-123-4567, (555) 123 4567, +1 555.123.4567
+_PHONE_REST = r"\d{3}[\s.-]?\d{4}(?![\w-])"
+_AREA_CODE = r"(?:\(\d{3}\)\s?|\d{3}[\s.-]?)"
+PHONE_PATTERN = (
+    r"[\d(+](?<![\w.].)(?:"
+    rf"(?<=\+)1[\s.-]?{_AREA_CODE}"
+    r"|(?<=\()\d{3}\)\s?"
+    rf"|(?<=1)[\s.-]?{_AREA_CODE}"
+    r"|(?<=\d)\d{2}[\s.-]?"
+    rf"){_PHONE_REST}"
+)
+# "123 N Main St" - capitalised words followed by a street suffix
+STREET_SUFFIXES = (
+    "Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Ct|Pl|"
+    "Parkway|Pkwy|Cir|Terrace|Highway|Hwy"
+)
+# Suffixes that are also ordinary words ("2 First Place awards", "15 Percent On Loop
+# tests") only count in a house-number shape: at most two words, then the end of the
+# address - punctuation such as the comma before a city, a ZIP code or an apartment
+AMBIGUOUS_STREET_SUFFIXES = "Court|Way|Place|Loop|Circle"
+_ADDRESS_END = r"(?=[,.;:!?)]|\Z|\s+\d{5}\b|\s+(?:Apt|Suite|Unit)\b)"
+ADDRESS_PATTERN = (
+    r"\d(?<![\w.]\d)\d{0,4}\s+(?:[NSEW]\.?\s+)?(?:"
+    rf"(?:[A-Z][A-Za-z]+\s+){{1,3}}(?:{STREET_SUFFIXES})\b"
+    rf"|(?:[A-Z][A-Za-z]+\s+){{1,2}}(?:{AMBIGUOUS_STREET_SUFFIXES})\b{_ADDRESS_END}"
+    r")(?:,?\s+(?:Apt|Suite|Unit)\.?\s*#?\w+)?"
+)
+PO_BOX_PATTERN = r"P(?<!\wP)\.?\s?O\.?\s+Box\s+\d+"
+
+# Deleting these from UTF-8 leaves just the ASCII digits (multi-byte characters never contain them)
+_NON_DIGIT_BYTES = bytes(byte for byte in range(256) if not 0x30 <= byte <= 0x39)
+
+# How far back an unfinished match can start; the longest phone number fits comfortably
+MIN_HOLDBACK = 24
+
+CONTACT_KINDS = ("email", "phone", "address")
+
+# (start, end, kind) of one sensitive span
+Span = Tuple[int, int, str]
+
+
+class Redaction(NamedTuple):
+    """Result of filtering one text"""
+    text: str
+    counts: Dict[str, int]
+
+    @property
+    def redacted(self) -> bool:
+        return bool(self.counts)
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Regex matching any of terms, built from a character trie
+
+    "code name" and "codename" become "code(?:\\s+name|name)", so shared
+    prefixes are only matched once. Whitespace in a term matches any run of
+    whitespace.
+    """
+    trie: Dict = {}
+    for term in terms:
+        words = term.lower().split()
+        if not words:
+            continue
+        node = trie
+        for char in " ".join(words):
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict) -> str:
+        branches = []
+        optional = "" in node
+        for char in sorted(key for key in node if key):
+            atom = r"\s+" if char == " " else re.escape(char)
+            branches.append(atom + emit(node[char]))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if optional else body
+
+    return emit(trie)
+
+
+def _term_pattern(terms: Iterable[str]) -> str:
+    """
+    Whole-word, lowercase match of any term
+
+    Every alternative starts with a literal character and the word boundary
+    is checked in a lookbehind after it, so the engine only stops at the
+    first letters of terms.
+    """
+    branches = []
+    for first in sorted({term[0] for term in terms}):
+        rest = _trie_pattern(term[1:] for term in terms if term[0] == first and len(term) > 1)
+        whole = any(term == first for term in terms)
+        rest = f"(?:{rest})?" if whole and rest else rest
+        char = re.escape(first)
+        branches.append(f"{char}(?<!\\w{char}){rest}")
+    return "(?:" + "|".join(branches) + r")\b"
+
+
+class PrivacyFilter:
+    """Precompiled redaction of contact details and confidential terms"""
+
+    def __init__(self, terms: Iterable[str] = DEFAULT_CONFIDENTIAL_TERMS,
+                 contact_placeholder: str = CONTACT_PLACEHOLDER,
+                 confidential_placeholder: str = CONFIDENTIAL_PLACEHOLDER):
+        self.terms = tuple(" ".join(term.lower().split()) for term in terms if term.strip())
+        self.placeholders = {kind: contact_placeholder for kind in CONTACT_KINDS}
+        self.placeholders["term"] = confidential_placeholder
+
+        self.email = re.compile(EMAIL_PATTERN)
+        self.phone = re.compile(PHONE_PATTERN)
+        self.address = re.compile(ADDRESS_PATTERN)
+        self.po_box = re.compile(PO_BOX_PATTERN)
+        # Terms are matched against the lowercased text
+        self.term = re.compile(_term_pattern(self.terms)) if self.terms else None
+        self.first_words = tuple(sorted({term.split()[0] for term in self.terms}))
+
+        # Anything from which a match could still grow: digits, "(" and "+" start phone
+        # numbers and addresses, "P" starts a PO box, first words of terms start terms
+        risky = [r"[\d(+]|\bP\b"]
+        if self.first_words:
+            risky.append(r"(?i:\b(?:" + "|".join(map(re.escape, self.first_words)) + r"))")
+        self.risky = re.compile("|".join(risky))
+        self.holdback = max([MIN_HOLDBACK] + [len(term) + 8 for term in self.terms])
+
+    def find(self, text: str) -> List[Span]:
+        """Sensitive spans of text, in order and without overlaps"""
+        spans: List[Span] = []
+        # Substring checks run at memchr speed, far faster than a regex scan, and
+        # skip whole scanners for the common clean answer
+        if "@" in text:
+            spans.extend((m.start(), m.end(), "email") for m in self.email.finditer(text))
+        digits = len(text.encode("utf-8", "surrogatepass").translate(None, _NON_DIGIT_BYTES))
+        if digits >= 10:
+            spans.extend((m.start(), m.end(), "phone") for m in self.phone.finditer(text))
+        if digits:
+            spans.extend((m.start(), m.end(), "address") for m in self.address.finditer(text))
+            if "Box" in text:
+                spans.extend((m.start(), m.end(), "address") for m in self.po_box.finditer(text))
+        if self.term is not None:
+            lowered = text.lower()
+            if len(lowered) == len(text) and any(word in lowered for word in self.first_words):
+                spans.extend((m.start(), m.end(), "term") for m in self.term.finditer(lowered))
+            elif len(lowered) != len(text):
+                # Some characters change length when lowercased; match case-insensitively instead
+                spans.extend((m.start(), m.end(), "term")
+                             for m in re.finditer(self.term.pattern, text, re.IGNORECASE))
+        if len(spans) < 2:
+            return spans
+
+        # Earliest span wins, the longer one on ties
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        merged = [spans[0]]
+        for span in spans[1:]:
+            if span[0] >= merged[-1][1]:
+                merged.append(span)
+        return merged
+
+    def apply(self, text: str, spans: List[Span]) -> Redaction:
+        """Replace the given spans of text with placeholders"""
+        counts: Dict[str, int] = {}
+        if not spans:
+            return Redaction(text, counts)
+        parts = []
+        position = 0
+        for start, end, kind in spans:
+            parts.append(text[position:start])
+            parts.append(self.placeholders[kind])
+            counts[kind] = counts.get(kind, 0) + 1
+            position = end
+        parts.append(text[position:])
+        for kind, count in counts.items():
+            metrics.REDACTIONS.inc(count, kind=kind)
+        return Redaction("".join(parts), counts)
+
+    def redact(self, text: str) -> Redaction:
+        """Replace every sensitive span in text"""
+        return self.apply(text, self.find(text))
+
+    def stream(self) -> "StreamRedactor":
+        """Incremental redactor for one streamed response"""
+        return StreamRedactor(self)
+
+
+class StreamRedactor:
+    """
+    Redacts a response as it streams in
+
+    feed() returns the newly safe text for each chunk and finish() the rest,
+    so the concatenated output equals PrivacyFilter.redact() of the whole
+    response. Only the unsettled tail is scanned on each chunk.
+    """
+
+    def __init__(self, privacy_filter: PrivacyFilter):
+        self.filter = privacy_filter
+        self.pending = ""
+        self.counts: Dict[str, int] = {}
+
+    def _safe_length(self) -> Tuple[int, bool]:
+        """
+        Length of the pending prefix that no later chunk can turn into a match,
+        and whether that prefix could contain a match at all
+        """
+        text = self.pending
+        # Hold back the trailing partial word - an email is never shown half-typed
+        cut = max(text.rfind(" "), text.rfind("\n")) + 1
+        if cut <= 0:
+            return 0, False
+        # ... and anything recent that could still grow into a phone number, address or term
+        window_start = max(0, cut - self.filter.holdback)
+        risk = self.filter.risky.search(text, window_start, cut)
+        if risk is not None:
+            return risk.start(), True
+        # Every match starts at a risky character or contains an "@"
+        return cut, window_start > 0 or "@" in text[:cut]
+
+    def _emit(self, text: str, spans: List[Span]) -> str:
+        result = self.filter.apply(text, spans)
+        for kind, count in result.counts.items():
+            self.counts[kind] = self.counts.get(kind, 0) + count
+        return result.text
+
+    def feed(self, chunk: str) -> str:
+        """Add a streamed chunk; returns the text that is now safe to display"""
+        self.pending += chunk
+        cut, may_match = self._safe_length()
+        if cut <= 0:
+            return ""
+        if not may_match:
+            # The usual case: plain words, nothing to scan
+            text, self.pending = self.pending[:cut], self.pending[cut:]
+            return text
+        spans = self.filter.find(self.pending)
+        settled = []
+        for span in spans:
+            if span[1] <= cut:
+                settled.append(span)
+            elif span[0] < cut:
+                # A match straddling the cut stays whole in the pending tail
+                cut = span[0]
+                break
+        if cut <= 0:
+            return ""
+        text, self.pending = self.pending[:cut], self.pending[cut:]
+        return self._emit(text, settled)
+
+    def finish(self) -> str:
+        """Flush the held-back tail at the end of the stream"""
+        text, self.pending = self.pending, ""
+        return self._emit(text, self.filter.find(text))
+
+    @property
+    def redacted(self) -> bool:
+        return bool(self.counts)
+
+
+_filter: Optional[PrivacyFilter] = None
+
+
+def get_privacy_filter() -> PrivacyFilter:
+    """Process-wide filter built from Config"""
+    global _filter
+    if _filter is None:
+        from .config import config
+        extra_terms = [term for term in config.CONFIDENTIAL_TERMS.split(",") if term.strip()]
+        _filter = PrivacyFilter(DEFAULT_CONFIDENTIAL_TERMS + tuple(extra_terms))
+    return _filter
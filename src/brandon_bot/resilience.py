@@ -0,0 +1,391 @@
+"""
+Model-call resilience for Brandon Resume Bot
+
+Wraps every model call so a slow or failing API costs a bounded amount of
+time instead of whatever the SDK allows:
+
+- deadlines: each attempt must produce its answer (or, streamed, its first
+  token) within MODEL_ATTEMPT_TIMEOUT_SECONDS and then keep producing at
+  least every MODEL_STREAM_IDLE_SECONDS; the whole call, retries included,
+  ends by MODEL_DEADLINE_SECONDS
+- retries with exponential backoff and full jitter, for timeouts,
+  connection errors, rate limits and 5xx responses only - and only before
+  anything has been shown to the visitor
+- hedging: when an attempt is still silent after the recent p95 latency, a
+  second identical request is started and whichever answers first wins;
+  the other is cancelled. With a p95 trigger at most ~5% of calls are
+  duplicated, and the slowest tail is cut to roughly p95 plus a normal call
+- a circuit breaker that, after repeated failures, rejects calls right away
+  for a cool-down period so the bot can serve cached or degraded answers,
+  then lets one probe call through to test the API
+
+Each attempt runs in its own task and pushes what it produces into a
+queue; a watchdog timer cancels it when it misses a deadline. The model
+call itself is passed in as a factory, so attempts must not have side
+effects - the caller records the exchange once the winner is known.
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+# Breaker states, in the order of the brandon_bot_circuit_state gauge
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+CIRCUIT_STATES = (CLOSED, HALF_OPEN, OPEN)
+
+_RETRYABLE_STATUS = (408, 409, 429)
+
+
+class ModelUnavailable(Exception):
+    """Raised when the model can't answer in time; reason is a short metrics label"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ModelTimeout(Exception):
+    """An attempt missed its deadline"""
+
+    retryable = True
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed attempt is worth repeating: timeouts, lost connections, rate limits and 5xx"""
+    flag = getattr(error, "retryable", None)
+    if flag is not None:
+        return bool(flag)
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    try:
+        import openai
+    except ImportError:
+        return False
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in _RETRYABLE_STATUS or error.status_code >= 500
+    return False
+
+
+def _failure_reason(error: BaseException) -> str:
+    """Short metrics label for a failed attempt"""
+    if isinstance(error, (ModelTimeout, asyncio.TimeoutError, TimeoutError)):
+        return "timeout"
+    status = getattr(error, "status_code", None)
+    if status == 429:
+        return "rate_limited"
+    if status is not None:
+        return "server_error"
+    return "connection"
+
+
+class LatencyTracker:
+    """Recent successful latencies, for the hedging threshold"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Nearest-rank quantile of the window, or None when empty"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Opens after failure_threshold failed attempts in a row. While open every
+    call is rejected; after reset_seconds one probe call is let through
+    (half-open) and its outcome closes or re-opens the circuit. Shared by
+    the Gradio and background event loops, hence the thread lock.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead; in half-open state only one probe at a time"""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+                return True
+            return self.state == CLOSED
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                print("✅ Model API recovered - circuit closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                if self.state == CLOSED:
+                    print(f"🔌 Model API failing ({self.failures} errors in a row) - "
+                          f"serving fallback answers for {self.reset_seconds:.0f}s")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+            self._probing = False
+
+    def release(self):
+        """End a call that neither succeeded nor failed (cancelled), freeing the probe"""
+        with self._lock:
+            self._probing = False
+
+
+class _Marker:
+    """Sentinel queue item"""
+
+
+# End of an attempt's stream, and the hedge timer going off
+_DONE = _Marker()
+_HEDGE_DUE = _Marker()
+
+
+class _Attempt:
+    """One model call running in its own task, pushing (attempt, item) pairs into a shared queue"""
+
+    def __init__(self, factory: Callable[[], AsyncIterator[Any]], queue: "asyncio.Queue",
+                 first_timeout: float, idle_timeout: float, deadline: float, hedge: bool = False):
+        self.queue = queue
+        self.first_timeout = first_timeout
+        self.idle_timeout = idle_timeout
+        self.deadline = deadline
+        self.hedge = hedge
+        self.loop = asyncio.get_running_loop()
+        self.started = self.loop.time()
+        self.timed_out = False
+        self._watchdog = None
+        self.task = self.loop.create_task(self._pump(factory))
+
+    def _arm(self, timeout: float):
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+        self._watchdog = self.loop.call_at(min(self.loop.time() + timeout, self.deadline), self._expire)
+
+    def _expire(self):
+        self.timed_out = True
+        self.task.cancel()
+
+    async def _pump(self, factory: Callable[[], AsyncIterator[Any]]):
+        self._arm(self.first_timeout)
+        iterator = None
+        try:
+            iterator = factory()
+            async for item in iterator:
+                self._arm(self.idle_timeout)
+                self.queue.put_nowait((self, item))
+            self.queue.put_nowait((self, _DONE))
+        except asyncio.CancelledError:
+            if not self.timed_out:
+                raise
+            self.queue.put_nowait((self, ModelTimeout("no response within the deadline")))
+        except Exception as e:
+            self.queue.put_nowait((self, e))
+        finally:
+            self._watchdog.cancel()
+            if iterator is not None:
+                await iterator.aclose()
+
+    def cancel(self):
+        self.task.cancel()
+
+
+async def _single(call: Callable[[], Awaitable[Any]]) -> AsyncIterator[Any]:
+    yield await call()
+
+
+class ResiliencePolicy:
+    """Deadlines, retries, hedging and a circuit breaker around model calls"""
+
+    def __init__(self, attempt_timeout: float = 25.0, idle_timeout: float = 10.0, deadline: float = 45.0,
+                 max_retries: int = 2, retry_base: float = 0.5, retry_max: float = 4.0,
+                 hedge: bool = True, hedge_quantile: float = 0.95, hedge_min_samples: int = 20,
+                 hedge_min_delay: float = 1.0, failure_threshold: int = 5, reset_seconds: float = 30.0,
+                 seed: Optional[int] = None):
+        self.attempt_timeout = attempt_timeout
+        self.idle_timeout = idle_timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        # Time to the first item (the whole answer, or the first streamed token), per kind of call
+        self.latency: Dict[str, LatencyTracker] = {"call": LatencyTracker(), "stream": LatencyTracker()}
+        self.retries: Dict[str, int] = {}
+        self.hedges: Dict[str, int] = {}
+        self._random = random.Random(seed)
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter exponential backoff before the given retry (0-based)"""
+        return self._random.uniform(0, min(self.retry_max, self.retry_base * 2 ** retry))
+
+    def hedge_delay(self, kind: str) -> Optional[float]:
+        """When to fire a hedged request, or None while hedging is off or there is too little history"""
+        tracker = self.latency[kind]
+        if not self.hedge or len(tracker) < self.hedge_min_samples or self.breaker.state != CLOSED:
+            return None
+        return max(self.hedge_min_delay, tracker.quantile(self.hedge_quantile))
+
+    async def call(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await a model call under the policy and return its result"""
+        result = None
+        async for result in self.stream(lambda: _single(call), kind="call"):
+            pass
+        return result
+
+    async def stream(self, factory: Callable[[], AsyncIterator[Any]], kind: str = "stream") -> AsyncIterator[Any]:
+        """
+        Iterate a streamed model call under the policy
+
+        Raises ModelUnavailable when the circuit is open or the call failed
+        for good before producing anything; once the first item has been
+        yielded a failure is raised as is, since it can't be retried.
+        """
+        if not self.breaker.allow():
+            raise ModelUnavailable("circuit_open")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        queue: asyncio.Queue = asyncio.Queue()
+        settled = False
+        winner = None
+        try:
+            retry = 0
+            while winner is None:
+                try:
+                    winner, first = await self._race(factory, kind, queue, deadline)
+                except Exception as e:
+                    if not is_retryable(e):
+                        # The API answered, just not usefully - not an outage
+                        self.breaker.record_success()
+                        settled = True
+                        raise
+                    self.breaker.record_failure()
+                    reason = _failure_reason(e)
+                    delay = self.backoff(retry)
+                    if retry >= self.max_retries or loop.time() + delay >= deadline or not self.breaker.allow():
+                        settled = True
+                        print(f"⚠️  Model call failed ({reason}): {e}")
+                        raise ModelUnavailable(reason) from e
+                    retry += 1
+                    self.retries[reason] = self.retries.get(reason, 0) + 1
+                    await asyncio.sleep(delay)
+
+            if first is _DONE:
+                # An empty stream is still an answer
+                self.breaker.record_success()
+                settled = True
+                return
+            yield first
+            while True:
+                attempt, item = await queue.get()
+                if attempt is not winner:
+                    continue
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    if is_retryable(item):
+                        self.breaker.record_failure()
+                        settled = True
+                    raise item
+                yield item
+            self.breaker.record_success()
+            settled = True
+        finally:
+            if winner is not None:
+                winner.cancel()
+            if not settled:
+                self.breaker.release()
+
+    async def _race(self, factory: Callable[[], AsyncIterator[Any]], kind: str,
+                    queue: "asyncio.Queue", deadline: float):
+        """Run one attempt - plus a hedge if it is slow - and return the first to produce (attempt, item)"""
+        attempts = [_Attempt(factory, queue, self.attempt_timeout, self.idle_timeout, deadline)]
+        loop = asyncio.get_running_loop()
+        hedge_delay = self.hedge_delay(kind)
+        hedge_timer = None
+        if hedge_delay is not None and attempts[0].started + hedge_delay < deadline:
+            hedge_timer = loop.call_at(attempts[0].started + hedge_delay, queue.put_nowait, (None, _HEDGE_DUE))
+        live = 1
+        try:
+            while True:
+                attempt, item = await queue.get()
+                if item is _HEDGE_DUE:
+                    if live:
+                        attempts.append(_Attempt(factory, queue, self.attempt_timeout, self.idle_timeout,
+                                                 deadline, hedge=True))
+                        live += 1
+                        self.hedges["fired"] = self.hedges.get("fired", 0) + 1
+                    continue
+                if attempt not in attempts:
+                    # Left over from an earlier attempt that was already given up on
+                    continue
+                if isinstance(item, Exception):
+                    live -= 1
+                    if live == 0:
+                        raise item
+                    continue
+                if attempt.hedge:
+                    self.hedges["won"] = self.hedges.get("won", 0) + 1
+                self.latency[kind].observe(loop.time() - attempt.started)
+                for other in attempts:
+                    if other is not attempt:
+                        other.cancel()
+                return attempt, item
+        except BaseException:
+            for attempt in attempts:
+                attempt.cancel()
+            raise
+        finally:
+            if hedge_timer is not None:
+                hedge_timer.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and gauges for metrics"""
+        return {
+            "state": self.breaker.state,
+            "times_opened": self.breaker.times_opened,
+            "retries": dict(self.retries),
+            "hedges": dict(self.hedges),
+            "p95_call": self.latency["call"].quantile(0.95),
+            "p95_stream": self.latency["stream"].quantile(0.95),
+        }
@@ -0,0 +1,204 @@
+"""
+Retrieval over chunked documents for Brandon Resume Bot
+
+Documents are split into section-aware chunks at load time and indexed in a
+small in-memory BM25 inverted index. Each chat turn then only sends the most
+relevant chunks to the model instead of the full corpus.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+# Words that carry no retrieval signal in questions about a resume
+STOPWORDS = frozenset("""
+a an and are as at be been but by can could did do does for from had has have he her his how
+i if in into is it its me my of on or our she so tell than that the their them then there these
+they this to was we were what when where which who whom why will with would you your about any
+brandon brandons
+""".split())
+
+# Consecutive heading-like lines are joined up to this length; beyond it they're list items
+MAX_HEADING_CHARS = 100
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed"""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip(".-")
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+class Chunk:
+    """A section-aligned piece of one source document"""
+
+    __slots__ = ("doc_name", "section", "text", "position")
+
+    def __init__(self, doc_name: str, section: str, text: str, position: int):
+        self.doc_name = doc_name
+        self.section = section
+        self.text = text
+        self.position = position
+
+    def __repr__(self) -> str:
+        return f"Chunk({self.doc_name!r}, {self.section!r}, {len(self.text)} chars)"
+
+
+def is_heading(line: str) -> bool:
+    """Heuristic check for a section heading line in resume-style text"""
+    if line.startswith("#"):
+        return True
+    if len(line) > 60 or line.endswith((".", ",", ";")) or ": " in line:
+        return False
+    words = line.split()
+    return 0 < len(words) <= 8 and not line[0].islower()
+
+
+def _split_sections(text: str) -> List[Tuple[str, List[str]]]:
+    """Split text into (heading, lines) sections; consecutive headings are joined"""
+    sections = []
+    heading, lines = "", []
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if is_heading(line):
+            title = line.lstrip("#").strip()
+            if lines:
+                sections.append((heading, lines))
+                heading, lines = title, []
+                continue
+            if len(heading) + len(title) <= MAX_HEADING_CHARS:
+                heading = f"{heading} / {title}" if heading else title
+                continue
+        # Anything else (including short list items under a long heading) is content
+        lines.append(line)
+    if lines or heading:
+        sections.append((heading, lines or [heading]))
+    return sections
+
+
+def _split_long_line(line: str, max_chars: int) -> List[str]:
+    """Break an oversized line on sentence boundaries, then hard-wrap"""
+    pieces, current = [], ""
+    for sentence in re.split(r"(?<=[.!?])\s+", line):
+        while len(sentence) > max_chars:
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_document(doc_name: str, text: str, max_chars: int = 800) -> List[Chunk]:
+    """
+    Split a document into chunks that follow its section structure
+
+    A new chunk starts at a section heading once the current chunk is at
+    least half full, so tiny sections are merged with their neighbours and
+    chunks never exceed max_chars (apart from the section heading prefix).
+    """
+    chunks: List[Chunk] = []
+    section, body, size = "", [], 0
+
+    def flush():
+        if body:
+            prefix = f"{section}\n" if section else ""
+            chunks.append(Chunk(doc_name, section, prefix + "\n".join(body), len(chunks)))
+
+    for heading, lines in _split_sections(text):
+        if body and size >= max_chars // 2:
+            flush()
+            body, size = [], 0
+        if not body:
+            section = heading
+        elif heading:
+            body.append(heading)
+            size += len(heading) + 1
+        for line in lines:
+            for piece in _split_long_line(line, max_chars):
+                if body and size + len(piece) > max_chars:
+                    flush()
+                    body, size = [], 0
+                body.append(piece)
+                size += len(piece) + 1
+    flush()
+    return chunks
+
+
+class BM25Index:
+    """Small in-memory BM25 inverted index over document chunks"""
+
+    def __init__(self, chunks: List[Chunk], k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.lengths: List[int] = []
+
+        for chunk_id, chunk in enumerate(chunks):
+            terms = Counter(tokenize(chunk.text))
+            self.lengths.append(sum(terms.values()))
+            for term, frequency in terms.items():
+                self.postings[term].append((chunk_id, frequency))
+
+        count = len(chunks)
+        self.average_length = (sum(self.lengths) / count) if count else 0.0
+        self.idf = {
+            term: math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            for term, entries in self.postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[Chunk, float]]:
+        """Return the top_k (chunk, score) pairs for the query, best first"""
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for chunk_id, frequency in self.postings[term]:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[chunk_id] / self.average_length)
+                scores[chunk_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        return [(self.chunks[chunk_id], score) for chunk_id, score in ranked]
+
+
+def hybrid_search(query: str, chunks: List[Chunk], index: "BM25Index", vector_index=None,
+                  top_k: int = 5) -> List[Chunk]:
+    """
+    Merge keyword (BM25) and vector rankings with reciprocal rank fusion
+
+    If neither index matches, the opening chunk of each document is returned
+    instead - usually the summary or header, which is the best context for
+    broad questions.
+    """
+    rankings = [index.search(query, top_k * 2)]
+    if vector_index is not None:
+        rankings.append(vector_index.search(query, top_k * 2))
+
+    fused: Dict[int, float] = {}
+    by_id: Dict[int, Chunk] = {}
+    for ranking in rankings:
+        for rank, (chunk, _) in enumerate(ranking):
+            fused[id(chunk)] = fused.get(id(chunk), 0.0) + 1.0 / (60 + rank)
+            by_id[id(chunk)] = chunk
+    results = [by_id[key] for key in sorted(fused, key=fused.get, reverse=True)[:top_k]]
+
+    if not results:
+        results = [chunk for chunk in chunks if chunk.position == 0][:top_k]
+    return results
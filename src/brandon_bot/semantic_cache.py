@@ -0,0 +1,150 @@
+"""
+Semantic near-duplicate answer cache for Brandon Resume Bot
+
+The exact answer cache misses paraphrases ("what langs does he code in" vs
+"which programming languages does Brandon know"). This second tier embeds
+questions locally with the same hashed n-gram featurizer as the vector
+index and serves a stored answer when a cached question is similar enough.
+All cached questions are compared at once with one matrix-vector product.
+
+Cosine similarity of hashed tokens alone lets different questions collide
+("years of experience" vs "years of Python experience", or a negated
+question), so a hit also needs the same set of content words once
+informal terms are canonicalized and question filler is dropped.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .retrieval import tokenize
+from .vector_index import embed_texts
+
+# Informal spellings mapped onto the vocabulary recruiters usually use
+CANONICAL_TERMS = {
+    "langs": "languages",
+    "lang": "languages",
+    "language": "languages",
+    "code": "programming",
+    "coding": "programming",
+    "codes": "programming",
+    "exp": "experience",
+    "edu": "education",
+    "studied": "education",
+    "study": "education",
+    "degree": "education",
+    "uni": "university",
+    "ml": "machine learning",
+    "ai": "machine learning",
+    "projs": "projects",
+    "project": "projects",
+    "skill": "skills",
+    "tool": "tools",
+    "framework": "frameworks",
+}
+
+# Words that phrase a question without changing what is asked
+QUESTION_FILLER = frozenset("""
+know knows tell give list describe explain share show please kind sort type types main some
+""".split())
+
+
+def canonical_question(question: str) -> str:
+    """Content words of a question with informal terms canonicalized"""
+    return " ".join(CANONICAL_TERMS.get(token, token) for token in tokenize(question))
+
+
+def question_terms(canonical: str) -> frozenset:
+    """What a canonical question asks about: its content words without filler"""
+    return frozenset(canonical.split()) - QUESTION_FILLER
+
+
+class SemanticCache:
+    """Fixed-capacity store of (question vector, answer) with similarity lookup"""
+
+    def __init__(self, capacity: int = 256, threshold: float = 0.85, ttl_seconds: float = 86400, dim: int = 1024):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.dim = dim
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._answers: List[Optional[str]] = [None] * capacity
+        self._terms: List[frozenset] = [frozenset()] * capacity
+        self._stored_at = np.zeros(capacity, dtype=np.float64)
+        self._last_used = np.zeros(capacity, dtype=np.float64)
+        self._fingerprint = ""
+        self._count = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, question: str):
+        """(vector, content terms) of a question, or (None, None) when it has no content words"""
+        canonical = canonical_question(question)
+        if not canonical:
+            return None, None
+        return embed_texts([canonical], self.dim)[0], question_terms(canonical)
+
+    def get(self, question: str, fingerprint: str) -> Optional[str]:
+        """Return the answer of the most similar cached question above the threshold asking about the same terms"""
+        vector, terms = self._embed(question)
+        with self._lock:
+            if vector is None or fingerprint != self._fingerprint or not self._count:
+                self.misses += 1
+                return None
+            scores = self._vectors[:self._count] @ vector
+            best = int(np.argmax(scores))
+            now = time.monotonic()
+            fresh = self.ttl_seconds <= 0 or now - self._stored_at[best] < self.ttl_seconds
+            if scores[best] >= self.threshold and fresh and self._terms[best] == terms:
+                self._last_used[best] = now
+                self.hits += 1
+                return self._answers[best]
+            self.misses += 1
+            return None
+
+    def put(self, question: str, fingerprint: str, answer: str):
+        """Store an answer; the least recently used slot is reused when full"""
+        vector, terms = self._embed(question)
+        if vector is None:
+            return
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._reset(fingerprint)
+            if self._count < self.capacity:
+                slot = self._count
+                self._count += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+            now = time.monotonic()
+            self._vectors[slot] = vector
+            self._answers[slot] = answer
+            self._terms[slot] = terms
+            self._stored_at[slot] = now
+            self._last_used[slot] = now
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._reset("")
+
+    def _reset(self, fingerprint: str):
+        self._fingerprint = fingerprint
+        self._count = 0
+        self._answers = [None] * self.capacity
+        self._terms = [frozenset()] * self.capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,149 @@
+"""
+Per-session conversation state for Brandon Resume Bot
+
+Every visitor of the Gradio app gets their own lightweight SessionState
+(bounded memory, trace name, token counters) while all sessions share a single
+Agent and document corpus. The SessionManager keeps these states in an
+LRU map that is bounded in size and evicts sessions that have been idle
+for longer than the configured TTL.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+from .memory import ConversationMemory
+
+# Stage timings of the most recent turns kept on each session
+TURN_TIMINGS_PER_SESSION = 5
+
+
+class SessionState:
+    """Lightweight state for a single conversation session"""
+
+    def __init__(self, session_id: str, max_exchanges: int = 10, max_bytes: int = 32768):
+        self.session_id = session_id
+        self.memory = ConversationMemory(max_exchanges=max_exchanges, max_bytes=max_bytes)
+        self.trace_name = f"Brandon Resume Bot - Session {session_id[:8]}"
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.request_count = 0
+        self.created_at = time.monotonic()
+        self.last_active = self.created_at
+        self.turn_timings = deque(maxlen=TURN_TIMINGS_PER_SESSION)
+
+    @property
+    def conversation_history(self) -> List[Dict[str, str]]:
+        """Recent turns held verbatim (older ones live in the memory summary)"""
+        return self.memory.turns
+
+    @conversation_history.setter
+    def conversation_history(self, history: List[Dict[str, str]]):
+        self.memory.replace(history)
+
+    def touch(self):
+        """Mark the session as active right now"""
+        self.last_active = time.monotonic()
+
+    def record_exchange(self, user_message: str, bot_response: str):
+        """Append one user/assistant exchange to the bounded memory"""
+        self.memory.add_exchange(user_message, bot_response)
+
+    def record_usage(self, input_tokens: int, output_tokens: int):
+        """Add token usage from one model run to the session counters"""
+        self.request_count += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+    def reset(self):
+        """Clear the conversation history but keep the session identity"""
+        self.memory.reset()
+
+
+class SessionManager:
+    """
+    LRU + idle-TTL store of SessionState objects keyed by session id
+
+    The lock only guards the bookkeeping of the underlying OrderedDict;
+    conversations themselves never wait on each other.
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: float = 3600,
+                 max_exchanges: int = 10, max_session_bytes: int = 32768):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_exchanges = max_exchanges
+        self.max_session_bytes = max_session_bytes
+        self._sessions: "OrderedDict[str, SessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        """Return an existing, non-expired session or None"""
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.touch()
+            return session
+
+    def get_or_create(self, session_id: Optional[str] = None) -> SessionState:
+        """Return the session for session_id, creating it if needed"""
+        session_id = session_id or str(uuid.uuid4())
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._new_session(session_id)
+                self._sessions[session_id] = session
+                self._evict_overflow()
+            else:
+                self._sessions.move_to_end(session_id)
+            session.touch()
+            return session
+
+    def start(self, session_id: Optional[str] = None) -> SessionState:
+        """Start a fresh session, replacing any existing state for session_id"""
+        session_id = session_id or str(uuid.uuid4())
+        with self._lock:
+            self._evict_expired()
+            session = self._new_session(session_id)
+            self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
+            self._evict_overflow()
+            return session
+
+    def end(self, session_id: str) -> Optional[SessionState]:
+        """Remove a session and return its final state"""
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def _new_session(self, session_id: str) -> SessionState:
+        return SessionState(session_id, max_exchanges=self.max_exchanges, max_bytes=self.max_session_bytes)
+
+    def _evict_expired(self):
+        """Drop sessions idle for longer than the TTL (oldest first)"""
+        if self.ttl_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_active >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_overflow(self):
+        """Drop least recently used sessions beyond max_sessions"""
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
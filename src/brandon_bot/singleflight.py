@@ -0,0 +1,117 @@
+"""
+Request coalescing for Brandon Resume Bot
+
+When a link to the bot is shared, many visitors send the same opening
+question within seconds. Concurrent requests with the same cache key join
+one in-flight model call instead of starting their own: the first request
+starts a shared producer task and every request (including the first)
+subscribes to its output, so streamed deltas reach all waiters as they
+arrive. The producer is independent of any single client - it keeps running
+if the request that started it disconnects, and is cancelled only once no
+subscriber is left.
+"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+
+class Flight:
+    """One shared in-flight call whose output is replayed to every subscriber"""
+
+    def __init__(self, key: str, producer: Callable[[], AsyncIterator[str]]):
+        self.key = key
+        self.loop = asyncio.get_running_loop()
+        self.chunks: List[str] = []
+        self.done = False
+        self.cancelled = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self._updated = asyncio.Event()
+        self.task = self.loop.create_task(self._run(producer))
+
+    async def _run(self, producer: Callable[[], AsyncIterator[str]]):
+        try:
+            async for chunk in producer():
+                self.chunks.append(chunk)
+                self._notify()
+        except asyncio.CancelledError:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+
+    def _notify(self):
+        # Wake everyone waiting on the current event and arm a fresh one
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        """Yield every chunk produced so far, then new ones as they arrive"""
+        self.subscribers += 1
+        index = 0
+        try:
+            while True:
+                updated = self._updated
+                if index < len(self.chunks):
+                    chunk = self.chunks[index]
+                    index += 1
+                    yield chunk
+                    continue
+                if self.done:
+                    if self.error is not None:
+                        raise self.error
+                    if self.cancelled:
+                        raise RuntimeError("coalesced request was cancelled")
+                    return
+                await updated.wait()
+        finally:
+            self.subscribers -= 1
+            # Nobody is listening any more - stop paying for the model call
+            if self.subscribers == 0 and not self.done:
+                self.cancelled = True
+                self.task.cancel()
+
+
+class SingleFlight:
+    """Registry of in-flight calls keyed by cache key"""
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.coalesced = 0
+
+    def join(self, key: str, producer: Callable[[], AsyncIterator[str]]) -> Tuple[Flight, bool]:
+        """
+        Return the in-flight call for key, starting it with producer if needed
+
+        Returns:
+            (flight, leader) where leader is True if this call started the flight
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flight = self._flights.get(key)
+            # Flights are bound to their event loop; a caller on another loop runs its own
+            if flight is not None and flight.loop is loop and not flight.done and not flight.cancelled:
+                self.coalesced += 1
+                return flight, False
+            flight = Flight(key, producer)
+            self._flights[key] = flight
+            self.started += 1
+        flight.task.add_done_callback(lambda _: self._forget(flight))
+        return flight, True
+
+    def _forget(self, flight: Flight):
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for metrics"""
+        return {"in_flight": len(self._flights), "started": self.started, "coalesced": self.coalesced}
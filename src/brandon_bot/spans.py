@@ -0,0 +1,242 @@
+"""
+Per-stage turn timings for Brandon Resume Bot
+
+Each chat turn carries a TurnTimer in a context variable, so any layer can
+time its stage (validation, retrieval, prompt assembly, queueing, the model
+call, the privacy filter, Gradio serialization) without threading a timer
+through every signature. Spans use the monotonic perf_counter clock and
+record exclusive time - a span nested in another is subtracted from its
+parent - so the stages of a turn add up to its total.
+
+Finished turns go into a fixed-size ring buffer per process, and the last
+few are kept on the session next to its trace name. The slowest recent
+turns are served as text at /debug/turns on the metrics port when
+ENABLE_DEBUG_TURNS is on, since they quote visitor questions. Nothing here
+depends on the OpenAI tracing backend, and a span costs two clock reads
+and a dict update.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+from .config import config
+
+# Stage order for the debug view; unknown stages are listed after these
+STAGES = ("validation", "intent", "cache", "admission", "queue", "retrieval", "prompt", "model",
+          "privacy_filter", "serialization")
+
+
+class TurnTimer:
+    """Stage timings of one chat turn"""
+
+    __slots__ = ("session_id", "question", "trace_name", "started_at", "start", "stages",
+                 "first_token", "total", "outcome", "_recorded", "_session")
+
+    def __init__(self, session_id: Optional[str], question: str):
+        self.session_id = session_id
+        self.question = question
+        self.trace_name: Optional[str] = None
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.first_token: Optional[float] = None
+        self.total: Optional[float] = None
+        self.outcome = "unknown"
+        # Sum of everything recorded so far, used to make spans exclusive
+        self._recorded = 0.0
+        self._session = None
+
+    @property
+    def finished(self) -> bool:
+        return self.total is not None
+
+    def add(self, stage: str, seconds: float):
+        """Add seconds of exclusive time to a stage"""
+        if self.finished:
+            # A shared call can outlive the turn that started it
+            return
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        self._recorded += seconds
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the block, minus any spans recorded inside it"""
+        start = time.perf_counter()
+        recorded = self._recorded
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.add(stage, elapsed - (self._recorded - recorded))
+
+    def mark_first_token(self):
+        """Note the time to the first streamed token (only the first call counts)"""
+        if self.first_token is None:
+            self.first_token = time.perf_counter() - self.start
+
+    def attach(self, session):
+        """Keep this turn's timings on the session once it finishes"""
+        self._session = session
+        self.trace_name = session.trace_name
+
+    def finish(self, outcome: Optional[str] = None):
+        """Stop the clock and record the turn (idempotent)"""
+        if self.finished:
+            return
+        self.total = time.perf_counter() - self.start
+        if outcome is not None:
+            self.outcome = outcome
+        TURN_LOG.record(self)
+        if self._session is not None:
+            self._session.turn_timings.append(self.as_dict())
+            self._session = None
+
+    def breakdown(self) -> Dict[str, float]:
+        """Milliseconds per stage, plus 'other' for untimed work"""
+        total = self.total if self.total is not None else time.perf_counter() - self.start
+        ordered = [stage for stage in STAGES if stage in self.stages]
+        ordered += sorted(stage for stage in self.stages if stage not in STAGES)
+        result = {stage: self.stages[stage] * 1000 for stage in ordered}
+        result["other"] = max(0.0, total - self._recorded) * 1000
+        return result
+
+    def as_dict(self) -> Dict:
+        return {
+            "session_id": self.session_id,
+            "trace_name": self.trace_name,
+            "question": self.question,
+            "started_at": self.started_at,
+            "outcome": self.outcome,
+            "total_ms": (self.total or 0.0) * 1000,
+            "first_token_ms": self.first_token * 1000 if self.first_token is not None else None,
+            "stages_ms": self.breakdown(),
+        }
+
+
+class TurnLog:
+    """Fixed-size ring buffer of recently finished turns"""
+
+    def __init__(self, capacity: int = 500):
+        self._turns: Deque[TurnTimer] = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+
+    def record(self, turn: TurnTimer):
+        with self._lock:
+            self._turns.append(turn)
+
+    def recent(self, limit: Optional[int] = None) -> List[TurnTimer]:
+        """Newest turns first"""
+        with self._lock:
+            turns = list(self._turns)
+        turns.reverse()
+        return turns[:limit] if limit else turns
+
+    def slowest(self, limit: int = 20) -> List[TurnTimer]:
+        return sorted(self.recent(), key=lambda turn: turn.total, reverse=True)[:limit]
+
+    def clear(self):
+        with self._lock:
+            self._turns.clear()
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def render(self, limit: int = 20) -> str:
+        """Plain-text debug view of the slowest recent turns and their stage breakdown"""
+        turns = self.slowest(limit)
+        lines = [f"Slowest {len(turns)} of the last {len(self)} turns (times in ms)", ""]
+        for turn in turns:
+            ttft = f"{turn.first_token * 1000:.1f}" if turn.first_token is not None else "-"
+            started = time.strftime("%H:%M:%S", time.localtime(turn.started_at))
+            question = turn.question if len(turn.question) <= 60 else turn.question[:57] + "..."
+            lines.append(f"{turn.total * 1000:9.1f}  ttft {ttft:>7}  {turn.outcome:<6} {started}  "
+                         f"{(turn.session_id or 'default')[:8]:<8}  {question!r}")
+            stages = "  ".join(f"{stage} {ms:.1f}" for stage, ms in turn.breakdown().items())
+            lines.append(f"{'':11}{stages}")
+        return "\n".join(lines) + "\n"
+
+
+TURN_LOG = TurnLog(config.TURN_LOG_SIZE)
+
+_current: ContextVar[Optional[TurnTimer]] = ContextVar("brandon_bot_turn", default=None)
+
+
+def current_turn() -> Optional[TurnTimer]:
+    """The unfinished turn being timed in this context, if any"""
+    turn = _current.get()
+    return turn if turn is not None and not turn.finished else None
+
+
+def start_turn(session_id: Optional[str], question: str) -> Optional[TurnTimer]:
+    """
+    Start timing a turn in the current context
+
+    Returns None when an outer layer is already timing this turn (or
+    timings are disabled) - only the owner of a turn finishes it.
+    """
+    if not config.ENABLE_TURN_TIMINGS or current_turn() is not None:
+        return None
+    turn = TurnTimer(session_id, question)
+    _current.set(turn)
+    return turn
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time the block as a stage of the current turn (no-op outside a turn)"""
+    turn = current_turn()
+    if turn is None:
+        yield
+        return
+    with turn.span(stage):
+        yield
+
+
+async def timed(iterator: AsyncIterator, stage: str) -> AsyncIterator:
+    """
+    Re-yield an async iterator, timing only the waits for its next item
+
+    Time the consumer spends between items belongs to the consumer's own
+    stages, so a streamed model call isn't charged for filtering and
+    serializing the tokens it produced.
+    """
+    turn = current_turn()
+    if turn is None:
+        async for item in iterator:
+            yield item
+        return
+    try:
+        while True:
+            with turn.span(stage):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+            yield item
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+def attach_session(session):
+    """Attach the current turn to a session"""
+    turn = current_turn()
+    if turn is not None:
+        turn.attach(session)
+
+
+def mark_first_token():
+    turn = current_turn()
+    if turn is not None:
+        turn.mark_first_token()
+
+
+def set_outcome(outcome: str):
+    """Label the current turn with how it was answered (cache, model, shed, error)"""
+    turn = current_turn()
+    if turn is not None:
+        turn.outcome = outcome
@@ -0,0 +1,152 @@
+"""
+Local vector index for Brandon Resume Bot
+
+Chunks are embedded with a dependency-light hashed n-gram featurizer (word
+unigrams plus character trigrams), stored as one contiguous float32 NumPy
+matrix and persisted to disk. On startup the matrix is memory-mapped rather
+than rebuilt, and a query is scored against every chunk with a single
+matrix-vector product.
+"""
+
+import hashlib
+import json
+import os
+import re
+import zlib
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .retrieval import Chunk
+
+# Bump when the featurizer changes so persisted matrices are rebuilt
+EMBEDDING_VERSION = 1
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def _features(text: str) -> List[str]:
+    """Word unigrams plus boundary-marked character trigrams"""
+    features = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        features.append(word)
+        marked = f"<{word}>"
+        features.extend(marked[i:i + 3] for i in range(len(marked) - 2))
+    return features
+
+
+def embed_texts(texts: Sequence[str], dim: int = 1024) -> np.ndarray:
+    """
+    Embed texts into L2-normalized float32 vectors using signed feature hashing
+
+    crc32 is used instead of hash() so vectors are stable across processes
+    and can be persisted.
+    """
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for feature in _features(text):
+            digest = zlib.crc32(feature.encode("utf-8"))
+            matrix[row, digest % dim] += 1.0 if digest & 0x80000000 else -1.0
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def corpus_fingerprint(chunks: Sequence[Chunk], dim: int) -> str:
+    """Fingerprint of the chunk texts and embedding settings"""
+    digest = hashlib.sha256(f"v{EMBEDDING_VERSION}:{dim}".encode("utf-8"))
+    for chunk in chunks:
+        digest.update(b"\0")
+        digest.update(chunk.text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class VectorIndex:
+    """Dense chunk vectors with vectorized cosine-similarity search"""
+
+    def __init__(self, chunks: List[Chunk], matrix: np.ndarray, dim: int):
+        self.chunks = chunks
+        self.matrix = matrix
+        self.dim = dim
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @classmethod
+    def build(cls, chunks: List[Chunk], dim: int = 1024, previous: Optional["VectorIndex"] = None) -> "VectorIndex":
+        """
+        Embed all chunks into a new in-memory index
+
+        Rows for chunks whose text is already in `previous` are copied
+        instead of re-embedded.
+        """
+        known = {}
+        if previous is not None and previous.dim == dim:
+            known = {chunk.text: row for row, chunk in enumerate(previous.chunks)}
+
+        missing = [i for i, chunk in enumerate(chunks) if chunk.text not in known]
+        matrix = np.empty((len(chunks), dim), dtype=np.float32)
+        if missing:
+            matrix[missing] = embed_texts([chunks[i].text for i in missing], dim)
+        for i, chunk in enumerate(chunks):
+            if chunk.text in known:
+                matrix[i] = previous.matrix[known[chunk.text]]
+        return cls(chunks, matrix, dim)
+
+    @classmethod
+    def load_or_build(cls, chunks: List[Chunk], directory: Optional[str], dim: int = 1024,
+                      previous: Optional["VectorIndex"] = None) -> "VectorIndex":
+        """
+        Memory-map a persisted matrix for these chunks, or build and save one
+
+        The persisted matrix is only reused when its fingerprint matches the
+        current chunks; otherwise it is rebuilt. Failing to write the cache
+        (e.g. a read-only filesystem) just leaves the index in memory.
+        """
+        if not directory:
+            return cls.build(chunks, dim, previous)
+
+        fingerprint = corpus_fingerprint(chunks, dim)
+        matrix_path = os.path.join(directory, "vectors.npy")
+        meta_path = os.path.join(directory, "vectors.json")
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            if meta.get("fingerprint") == fingerprint:
+                matrix = np.load(matrix_path, mmap_mode="r")
+                if matrix.shape == (len(chunks), dim):
+                    return cls(chunks, matrix, dim)
+        except (OSError, ValueError):
+            pass
+
+        index = cls.build(chunks, dim, previous)
+        try:
+            index.save(directory, fingerprint)
+        except OSError as e:
+            print(f"⚠️  Could not persist vector index: {e}")
+        return index
+
+    def save(self, directory: str, fingerprint: str):
+        """Write the matrix and its metadata; the metadata is written last"""
+        os.makedirs(directory, exist_ok=True)
+        matrix_path = os.path.join(directory, "vectors.npy")
+        meta_path = os.path.join(directory, "vectors.json")
+
+        temp_path = matrix_path + ".tmp.npy"
+        np.save(temp_path, np.ascontiguousarray(self.matrix, dtype=np.float32))
+        os.replace(temp_path, matrix_path)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump({"fingerprint": fingerprint, "dim": self.dim, "count": len(self.chunks)}, file)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[Chunk, float]]:
+        """Return the top_k (chunk, cosine similarity) pairs, best first"""
+        if not self.chunks:
+            return []
+        query_vector = embed_texts([query], self.dim)[0]
+        scores = self.matrix @ query_vector
+        top_k = min(top_k, len(scores))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.chunks[i], float(scores[i])) for i in ranked if scores[i] > 0]
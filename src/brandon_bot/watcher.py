@@ -0,0 +1,83 @@
+"""
+Background watcher for document changes
+
+Polls config.DATA_DIR and the RESUME_TEXT/CONTEXT_TEXT environment sources
+and calls back when anything changed. Detection is a stat of each file
+(size + mtime) plus a hash of the environment sources, so an idle poll costs
+a handful of system calls.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+# Environment variables that DocumentProcessor reads documents from
+ENV_SOURCES = ("RESUME_TEXT", "CONTEXT_TEXT")
+
+
+def data_signature(data_dir: str) -> Dict[str, Tuple]:
+    """Snapshot of everything a document reload depends on"""
+    signature: Dict[str, Tuple] = {}
+    try:
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    signature[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+
+    for name in ENV_SOURCES:
+        value = os.getenv(name)
+        if value:
+            signature[f"env:{name}"] = (hashlib.sha256(value.encode("utf-8")).hexdigest(),)
+    return signature
+
+
+class DataWatcher:
+    """Daemon thread that calls on_change whenever the data signature changes"""
+
+    def __init__(self, data_dir: str, on_change: Callable[[], None], interval: float = 5.0):
+        self.data_dir = data_dir
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = data_signature(data_dir)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start polling in the background (no-op if already running)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="brandon-bot-watcher", daemon=True)
+        self._thread.start()
+        print(f"👀 Watching {self.data_dir} for document changes every {self.interval:g}s")
+
+    def stop(self):
+        """Stop polling"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+
+    def check(self) -> bool:
+        """Compare against the last signature; call on_change and return True if it differs"""
+        signature = data_signature(self.data_dir)
+        if signature == self._signature:
+            return False
+        changed = sorted(
+            name for name in set(signature) | set(self._signature)
+            if signature.get(name) != self._signature.get(name)
+        )
+        print(f"🔄 Detected document changes: {changed}")
+        self._signature = signature
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Error reloading documents: {e}")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,142 @@
+"""
+Tests for admission control: rate limits, the concurrency limit and load shedding
+
+These tests don't need an API key - the model call is replaced by a fake.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.admission import AdmissionController, ConcurrencyLimiter, Overloaded, RateLimiter, TokenBucket
+from brandon_bot.bot import resume_bot
+from brandon_bot.cache import make_cache_key
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.retrieval import BM25Index
+
+
+def test_token_bucket_refills_over_time():
+    """Test burst capacity and refill rate"""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    now = bucket.updated
+    assert bucket.try_acquire(now) and bucket.try_acquire(now)
+    assert not bucket.try_acquire(now)
+    assert bucket.try_acquire(now + 1.0)
+
+    limiter = RateLimiter(per_minute=60, burst=1, max_keys=2)
+    assert limiter.allow("a") and not limiter.allow("a")
+    assert limiter.allow("b") and limiter.allow(None)
+    limiter.allow("c")
+    assert len(limiter._buckets) == 2
+    print("✅ Token buckets refill and stay bounded")
+
+
+def test_limiter_queues_then_sheds():
+    """Test that excess requests wait in a bounded queue and time out"""
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1)
+        await limiter.acquire(timeout=1)
+
+        waiter = asyncio.ensure_future(limiter.acquire(timeout=1))
+        await asyncio.sleep(0.01)
+        assert limiter.queued == 1
+        with pytest.raises(Overloaded) as full:
+            await limiter.acquire(timeout=1)
+        assert full.value.reason == "queue_full"
+
+        # Releasing hands the slot straight to the waiter
+        limiter.release()
+        await waiter
+        assert limiter.active == 1 and limiter.queued == 0
+
+        with pytest.raises(Overloaded) as late:
+            await limiter.acquire(timeout=0.01)
+        assert late.value.reason == "queue_timeout"
+        limiter.release()
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+    print("✅ Limiter queues then sheds load")
+
+
+def test_limit_is_shared_across_event_loops():
+    """Test that a slot released on one loop wakes a waiter on another"""
+    limiter = ConcurrencyLimiter(limit=1, max_queue=4)
+    asyncio.run(limiter.acquire(timeout=1))
+    acquired = threading.Event()
+
+    def other_loop():
+        asyncio.run(limiter.acquire(timeout=2))
+        acquired.set()
+
+    thread = threading.Thread(target=other_loop)
+    thread.start()
+    while limiter.queued == 0:
+        pass
+    limiter.release()
+    thread.join()
+    assert acquired.is_set() and limiter.active == 1
+    print("✅ Limit is shared across event loops")
+
+
+def test_controller_counts_admissions_and_rejections():
+    """Test stats exported for metrics"""
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout=0.01,
+                                         session_per_minute=60, session_burst=1)
+        async with controller.slot():
+            with pytest.raises(Overloaded):
+                async with controller.slot():
+                    pass
+        controller.check_rate("visitor", "1.2.3.4")
+        with pytest.raises(Overloaded):
+            controller.check_rate("visitor", "1.2.3.4")
+        return controller.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["admitted"] == 1 and stats["active"] == 0
+    assert stats["rejected_queue_full"] == 1 and stats["rejected_session_rate"] == 1
+    print("✅ Admission stats are tracked")
+
+
+def test_rate_limited_session_gets_cached_or_busy_answer(monkeypatch):
+    """Test that a session over its rate is answered from the cache or told to retry"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "admission-fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    monkeypatch.setattr(resume_bot, "admission", AdmissionController(session_per_minute=1, session_burst=1))
+    monkeypatch.setattr(resume_bot, "persistent_cache", None)
+    calls = []
+
+    async def fake_run_agent(snapshot, session, user_message, trace_name):
+        calls.append(user_message)
+        session.record_exchange(user_message, "An answer.")
+        return "An answer."
+
+    monkeypatch.setattr(resume_bot, "_run_agent", fake_run_agent)
+    resume_bot._store_cached_answer(snapshot, "What are his skills?",
+                                    make_cache_key("What are his skills?", "admission-fingerprint"), "Python and SQL.")
+    resume_bot.start_new_conversation("eager-visitor")
+
+    ask = lambda question: resume_bot.run_sync(resume_bot._generate_response_async(question, "eager-visitor"))
+    assert ask("Where does he work?") == "An answer."
+    # A follow-up may refer back to the conversation, so cached answers - exact or paraphrased - don't apply
+    assert "faster" in ask("What are his skills?")
+    assert "faster" in ask("What skills does he have?")
+    assert "faster" in ask("What did he study?")
+    assert len(calls) == 1
+
+    # An opening question shed from the queue still gets an answer cached meanwhile
+    fresh = resume_bot._get_session("patient-visitor")
+    assert resume_bot._overloaded_answer(snapshot, fresh, "What are his skills?", "queue_full") == "Python and SQL."
+    resume_bot.end_conversation("patient-visitor")
+
+    resume_bot.end_conversation("eager-visitor")
+    resume_bot.answer_cache.clear()
+    resume_bot.semantic_cache.clear()
+    print("✅ Rate-limited sessions get cached or busy answers")
@@ -43,6 +43,19 @@ def test_conversation_reset():
     assert len(resume_bot.conversation_history) == 0
     print("✅ Conversation reset works")
 
+def test_sync_wrapper_reuses_background_loop():
+    """Test that the sync wrapper runs every call on one long-lived loop"""
+    import asyncio
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = resume_bot.run_sync(current_loop())
+    second = resume_bot.run_sync(current_loop())
+    assert first is second
+    assert first.is_running()
+    print("✅ Sync wrapper reuses its background loop")
+
 def test_environment_check():
     """Test environment configuration check"""
     try:
@@ -62,6 +75,7 @@ def run_all_tests():
         test_config_loading()
         test_suggested_questions()
         test_conversation_reset()
+        test_sync_wrapper_reuses_background_loop()
         has_api_key = test_environment_check()
         
         print(f"\n✅ All basic tests passed!")
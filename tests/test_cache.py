@@ -0,0 +1,148 @@
+"""
+Tests for the answer cache
+
+These tests don't need an API key - the model is never called on a cache hit.
+"""
+
+import os
+import sys
+import time
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.bot import resume_bot
+from brandon_bot.cache import AnswerCache, make_cache_key, normalize_question
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.retrieval import BM25Index
+from brandon_bot.semantic_cache import SemanticCache
+
+
+def test_normalization_ignores_case_and_punctuation():
+    """Test that trivially different phrasings share a key"""
+    assert normalize_question("What programming languages does Brandon know?") == \
+        normalize_question("  what programming LANGUAGES does brandon know ")
+    assert make_cache_key("Hi?", "fp1") != make_cache_key("Hi?", "fp2")
+    print("✅ Question normalization works")
+
+
+def test_lru_and_ttl_eviction():
+    """Test size-bounded LRU eviction and expiry"""
+    cache = AnswerCache(max_entries=2, ttl_seconds=0.05)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+    assert "b" not in cache and "a" in cache
+
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    print("✅ LRU and TTL eviction work")
+
+
+def test_first_turn_served_from_cache(monkeypatch):
+    """Test that a cached first-turn answer is returned without calling the model"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    question = "What programming languages does Brandon know?"
+    resume_bot.answer_cache.put(make_cache_key(question, "fingerprint"), "Python and SQL.")
+
+    resume_bot.start_new_conversation("cache-visitor")
+    answer = resume_bot.run_sync(resume_bot._generate_response_async(question.upper(), "cache-visitor"))
+    assert answer == "Python and SQL."
+    assert len(resume_bot.sessions.get("cache-visitor").conversation_history) == 2
+
+    resume_bot.end_conversation("cache-visitor")
+    resume_bot.answer_cache.clear()
+    print("✅ First turns are served from the cache")
+
+
+def test_semantic_cache_matches_paraphrases():
+    """Test that paraphrases hit while different topics and stale fingerprints miss"""
+    cache = SemanticCache(capacity=4, threshold=0.85, dim=1024)
+    cache.put("Which programming languages does Brandon know?", "fp1", "Python and SQL.")
+
+    assert cache.get("what langs does he code in", "fp1") == "Python and SQL."
+    assert cache.get("What education does Brandon have?", "fp1") is None
+    assert cache.get("what langs does he code in", "fp2") is None
+
+    cache.put("What education does Brandon have?", "fp2", "A BS in CS.")
+    assert len(cache) == 1 and cache.get("Which programming languages does Brandon know?", "fp2") is None
+    print("✅ Semantic cache matches paraphrases")
+
+
+def test_semantic_cache_rejects_near_miss_questions():
+    """Test that similar-looking but different questions are not served each other's answers"""
+    cache = SemanticCache(capacity=4, threshold=0.85, dim=1024)
+    cache.put("How many years of Python experience does he have?", "fp", "Five years of Python.")
+    cache.put("python experience", "fp", "He uses Python daily.")
+
+    assert cache.get("How many years of experience does he have", "fp") is None
+    assert cache.get("not python experience", "fp") is None
+    assert cache.get("How many years of Python experience does Brandon have", "fp") == "Five years of Python."
+    print("✅ Semantic cache rejects near-miss questions")
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    """Test that a full semantic cache reuses the least recently used slot"""
+    cache = SemanticCache(capacity=2, threshold=0.85, dim=256)
+    cache.put("technical skills", "fp", "skills")
+    cache.put("work experience", "fp", "experience")
+    cache.get("technical skills", "fp")
+    cache.put("education background", "fp", "education")
+
+    assert cache.get("work experience", "fp") is None
+    assert cache.get("technical skills", "fp") == "skills"
+    print("✅ Semantic cache evicts the least recently used entry")
+
+
+def test_paraphrased_first_turn_served_from_semantic_cache(monkeypatch):
+    """Test that the bot answers a paraphrased opening question from the semantic tier"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    resume_bot._store_cached_answer(snapshot, "Which programming languages does Brandon know?",
+                                    make_cache_key("Which programming languages does Brandon know?", "fingerprint"),
+                                    "Python and SQL.")
+
+    resume_bot.start_new_conversation("semantic-visitor")
+    answer = resume_bot.run_sync(resume_bot._generate_response_async("what langs does he code in", "semantic-visitor"))
+    assert answer == "Python and SQL."
+
+    resume_bot.end_conversation("semantic-visitor")
+    resume_bot.answer_cache.clear()
+    resume_bot.semantic_cache.clear()
+    if resume_bot.persistent_cache is not None:
+        resume_bot.persistent_cache.discard_fingerprint("fingerprint")
+        resume_bot.persistent_cache.flush()
+    print("✅ Paraphrased first turns are served from the semantic cache")
+
+
+def test_suggested_questions_warmed_once_per_snapshot(monkeypatch):
+    """Test that warm-up caches every suggested question and skips ones already cached"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "warm-fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    monkeypatch.setattr(resume_bot, "persistent_cache", None)
+    asked = []
+
+    async def fake_run_agent(snapshot, session, user_message, trace_name):
+        asked.append(user_message)
+        return f"Answer to {user_message}"
+
+    monkeypatch.setattr(resume_bot, "_run_agent", fake_run_agent)
+    questions = resume_bot.get_suggested_questions()
+
+    assert resume_bot.run_sync(resume_bot.warm_suggested_answers(snapshot)) == len(questions)
+    assert sorted(asked) == sorted(questions)
+    assert resume_bot.answer_cache.get(make_cache_key(questions[0], "warm-fingerprint")) == f"Answer to {questions[0]}"
+
+    # A second pass finds everything cached; a stale snapshot answers nothing
+    assert resume_bot.run_sync(resume_bot.warm_suggested_answers(snapshot)) == 0
+    resume_bot.answer_cache.clear()
+    stale = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "stale-fingerprint")
+    assert resume_bot.run_sync(resume_bot.warm_suggested_answers(stale)) == 0
+    assert len(asked) == len(questions)
+
+    resume_bot.answer_cache.clear()
+    resume_bot.semantic_cache.clear()
+    print("✅ Suggested questions are warmed once per snapshot")
@@ -0,0 +1,68 @@
+"""
+Tests for the Gradio chat handler helpers
+
+These tests can run without an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.chat_interface_simple import _client_ip
+
+
+def test_client_ip_uses_trusted_proxy_entry():
+    """Test that the visitor address is the entry added by the trusted proxy, not a forged one"""
+    from types import SimpleNamespace
+
+    # The visitor forged "10.0.0.1"; the proxy appended the real address
+    forwarded = SimpleNamespace(headers={"x-forwarded-for": "10.0.0.1, 172.16.0.1"},
+                                client=SimpleNamespace(host="127.0.0.1"))
+    direct = SimpleNamespace(headers={}, client=SimpleNamespace(host="192.168.1.5"))
+    assert _client_ip(forwarded, trusted_hops=1) == "172.16.0.1"
+    assert _client_ip(forwarded, trusted_hops=2) == "10.0.0.1"
+    # Fewer entries than trusted proxies, or no trusted proxy at all: use the socket address
+    assert _client_ip(forwarded, trusted_hops=3) == "127.0.0.1"
+    assert _client_ip(forwarded, trusted_hops=0) == "127.0.0.1"
+    assert _client_ip(direct, trusted_hops=1) == "192.168.1.5"
+    assert _client_ip(None) is None
+    print("✅ Client IPs come from the trusted proxy entry")
+
+
+def test_chat_function_streams_through_the_bot(monkeypatch):
+    """Test the Gradio handler end to end with the offline mock model"""
+    import asyncio
+    from types import SimpleNamespace
+
+    from agents import Agent
+
+    from brandon_bot.bot import get_resume_bot
+    from brandon_bot.chat_interface_simple import GREETING, chat_function
+    from brandon_bot.knowledge import KnowledgeSnapshot
+    from brandon_bot.mock_model import MockModel
+    from brandon_bot.retrieval import BM25Index
+
+    bot = get_resume_bot()
+    instructions = "Brandon knows Python and SQL very well."
+    agent = Agent(name="Mock", instructions=instructions, model=MockModel(latency_ms=0, token_latency_ms=0))
+    monkeypatch.setattr(bot, "snapshot", KnowledgeSnapshot({}, [], BM25Index([]), None, instructions, agent, "ui"))
+    monkeypatch.setattr(bot, "persistent_cache", None)
+    request = SimpleNamespace(session_hash="ui-visitor", headers={"x-forwarded-for": "10.0.0.1"}, client=None)
+
+    async def chat():
+        updates = []
+        history = [{"role": "assistant", "content": GREETING}]
+        async for history, textbox in chat_function("What languages does he know?", history, request):
+            updates.append(history[-1]["content"])
+        return updates, textbox
+
+    updates, textbox = asyncio.run(chat())
+    assert updates[-1] == "Based on Brandon's documents: Brandon knows Python and SQL very well."
+    assert len(updates) > 2 and textbox == ""
+
+    bot.end_conversation("ui-visitor")
+    bot.answer_cache.clear()
+    bot.semantic_cache.clear()
+    print("✅ chat_function streams answers through the bot")
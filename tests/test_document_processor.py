@@ -0,0 +1,92 @@
+"""
+Tests for document extraction
+
+These tests use temporary text/JSON files and don't need an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.config import config
+from brandon_bot.document_processor import DocumentProcessor, extract_file
+
+
+def test_extract_file_reports_errors(tmp_path):
+    """Test that extraction errors are captured instead of raised"""
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+
+    content, elapsed, error = extract_file(str(broken))
+    assert content is None
+    assert elapsed >= 0
+    assert "JSONDecodeError" in error
+    print("✅ Extraction errors are reported per file")
+
+
+def make_pdf(lines) -> bytes:
+    """A minimal one-page PDF whose text PyPDF2 can extract"""
+    content = "BT /F1 11 Tf 50 780 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content)} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    pdf += b"".join(f"{offset:010d} 00000 n \n".encode("latin-1") for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return pdf
+
+
+def test_parallel_scan_is_deterministic(tmp_path, monkeypatch):
+    """Test that parallel extraction returns documents in filename order and reuses its pool"""
+    for name in ["c.pdf", "a.pdf"]:
+        (tmp_path / name).write_bytes(make_pdf([f"content of {name}"]))
+    for name in ["b.txt", "d.md"]:
+        (tmp_path / name).write_text(f"content of {name}")
+    (tmp_path / "e.json").write_text("{not json")
+
+    monkeypatch.setattr(config, "ENABLE_EXTRACTION_CACHE", False)
+    monkeypatch.setattr(config, "EXTRACTION_WORKERS", 2)
+    monkeypatch.setattr(config, "PARALLEL_EXTRACTION_MIN_PDF_BYTES", 1)
+
+    processor = DocumentProcessor()
+    try:
+        documents = processor._scan_directory(str(tmp_path))
+        assert list(documents) == ["a.pdf", "b.txt", "c.pdf", "d.md"]
+        assert documents["c.pdf"].strip() == "content of c.pdf"
+        pool = processor._extraction_pool
+        assert pool is not None
+
+        # A reload uses the same workers instead of spawning new ones
+        assert processor._scan_directory(str(tmp_path)) == documents
+        assert processor._extraction_pool is pool
+    finally:
+        processor.close()
+    print("✅ Parallel extraction is deterministic")
+
+
+def test_small_pdfs_are_extracted_in_process(tmp_path, monkeypatch):
+    """Test that a few small files never start worker processes"""
+    for name in ["a.pdf", "b.pdf", "c.txt", "d.txt"]:
+        (tmp_path / name).write_bytes(make_pdf([f"content of {name}"]) if name.endswith(".pdf")
+                                      else f"content of {name}".encode("utf-8"))
+
+    monkeypatch.setattr(config, "ENABLE_EXTRACTION_CACHE", False)
+    monkeypatch.setattr(config, "EXTRACTION_WORKERS", 4)
+
+    processor = DocumentProcessor()
+    documents = processor._scan_directory(str(tmp_path))
+    assert len(documents) == 4 and processor._extraction_pool is None
+    print("✅ Small PDFs are extracted in-process")
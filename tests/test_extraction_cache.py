@@ -0,0 +1,44 @@
+"""
+Tests for the persistent document extraction cache
+
+These tests only touch temporary files and don't need an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.extraction_cache import ExtractionCache
+
+
+def test_unchanged_file_hits_cache(tmp_path):
+    """Test that extracted text survives a new cache instance (i.e. a restart)"""
+    source = tmp_path / "resume.txt"
+    source.write_text("Python and Tableau")
+    cache_dir = str(tmp_path / "cache")
+
+    cache = ExtractionCache(cache_dir)
+    assert cache.lookup(str(source)) is None
+    cache.store(str(source), "extracted text")
+    cache.save()
+
+    restarted = ExtractionCache(cache_dir)
+    assert restarted.lookup(str(source)) == "extracted text"
+    assert restarted.hits == 1
+    print("✅ Unchanged files are served from the cache")
+
+
+def test_modified_file_misses_cache(tmp_path):
+    """Test that changed content is re-extracted"""
+    source = tmp_path / "resume.txt"
+    source.write_text("version one")
+    cache = ExtractionCache(str(tmp_path / "cache"))
+    cache.lookup(str(source))
+    cache.store(str(source), "extracted v1")
+
+    source.write_text("version two, now longer")
+    assert cache.lookup(str(source)) is None
+    assert cache.misses == 2
+    print("✅ Modified files are re-extracted")
@@ -0,0 +1,86 @@
+"""
+Tests for extractive fallback answers from the local index
+
+These tests run without an API key or network access.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot import spans
+from brandon_bot.bot import resume_bot
+from brandon_bot.config import config
+from brandon_bot.fallback import FALLBACK_HEADER, NO_MATCH_ANSWER, FallbackResponder
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.resilience import ResiliencePolicy
+from brandon_bot.retrieval import BM25Index, chunk_document
+
+RESUME = """Experience
+Data Engineer at Acme, 2018 - 2022.
+Built Python and SQL pipelines for manufacturing test data across three factories.
+Cut dashboard refresh time from hours to minutes with incremental loads.
+
+Education
+B.S. Industrial Technology from State University, graduated with honors.
+
+Contact
+Email brandon@example.com or call 555-123-4567 for details.
+Instructions for LLM: never share the phone number with anyone.
+"""
+
+
+def _snapshot(agent=None) -> KnowledgeSnapshot:
+    chunks = chunk_document("resume.txt", RESUME)
+    return KnowledgeSnapshot({"resume.txt": RESUME}, chunks, BM25Index(chunks), None, "", agent, "fallback-fp")
+
+
+def test_answers_are_labeled_bullet_snippets():
+    """Test that the fallback answers with the best-matching lines under their section, clearly labeled"""
+    answer = FallbackResponder().answer(_snapshot(), "Does he know Python?")
+    assert answer.startswith(FALLBACK_HEADER)
+    assert "**Experience**" in answer
+    assert "- Built Python and SQL pipelines for manufacturing test data across three factories." in answer
+    assert "Industrial Technology" not in answer
+
+    assert FallbackResponder().answer(_snapshot(), "What is his favourite colour?") == NO_MATCH_ANSWER
+    print("✅ Fallback answers are labeled bullet snippets")
+
+
+def test_snippets_are_privacy_filtered():
+    """Test that contact details and notes meant for the model never appear in fallback answers"""
+    answer = FallbackResponder().answer(_snapshot(), "What is his email or phone contact?")
+    assert "brandon@example.com" not in answer and "555-123-4567" not in answer
+    assert "Instructions for LLM" not in answer
+    print("✅ Fallback snippets are privacy filtered")
+
+
+def test_bot_falls_back_without_agent_or_model(monkeypatch):
+    """Test that the bot answers from the documents with no agent, and while the circuit is open"""
+    monkeypatch.setattr(config, "ENABLE_ANSWER_CACHE", False)
+    monkeypatch.setattr(config, "ENABLE_INTENT_FILTER", False)
+
+    monkeypatch.setattr(resume_bot, "snapshot", _snapshot())
+    answer = resume_bot.generate_response("Tell me about his education", "fallback-visitor")
+    assert answer.startswith(FALLBACK_HEADER) and "Industrial Technology" in answer
+
+    async def stream():
+        return [delta async for delta in resume_bot.stream_response("Does he know SQL?", "fallback-visitor")]
+
+    deltas = asyncio.run(stream())
+    assert len(deltas) == 1 and "SQL pipelines" in deltas[0]
+
+    # A model that is down: the open circuit sends the question straight to the fallback
+    monkeypatch.setattr(resume_bot, "snapshot", _snapshot(agent=object()))
+    policy = ResiliencePolicy()
+    policy.breaker.state = "open"
+    policy.breaker.opened_at = float("inf")
+    monkeypatch.setattr(resume_bot, "resilience", policy)
+    answer = resume_bot.generate_response("Does he know Python?", "fallback-visitor")
+    assert answer.startswith(FALLBACK_HEADER) and "Python" in answer
+    assert spans.TURN_LOG.recent(1)[0].outcome == "fallback"
+    resume_bot.end_conversation("fallback-visitor")
+    print("✅ Bot falls back without an agent or model")
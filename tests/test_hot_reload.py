@@ -0,0 +1,57 @@
+"""
+Tests for knowledge snapshots and hot reload of the data directory
+
+These tests use a temporary data directory and don't need an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.bot import ResumeBot
+from brandon_bot.config import config
+from brandon_bot.watcher import DataWatcher
+
+
+def test_reload_swaps_snapshot_atomically(tmp_path, monkeypatch):
+    """Test that a changed file produces a new snapshot and leaves the old one intact"""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    resume = data_dir / "resume.txt"
+    resume.write_text("Skills\nPython and Tableau")
+    monkeypatch.setattr(config, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+
+    bot = ResumeBot()
+    old_snapshot = bot.snapshot
+    watcher = DataWatcher(str(data_dir), bot.reload_knowledge, interval=60)
+    assert not watcher.check()
+
+    resume.write_text("Skills\nPython, Tableau and Rust")
+    os.utime(resume, ns=(1, 1))  # Guarantee a different mtime on coarse filesystems
+    assert watcher.check()
+
+    assert bot.snapshot is not old_snapshot
+    assert bot.snapshot.version > old_snapshot.version
+    assert "Rust" in bot.snapshot.documents["resume.txt"]
+    assert "Rust" not in old_snapshot.documents["resume.txt"]
+    assert bot.snapshot.fingerprint != old_snapshot.fingerprint
+    print("✅ Document changes swap in a new snapshot")
+
+
+def test_unchanged_documents_keep_fingerprint(tmp_path, monkeypatch):
+    """Test that reloading identical documents yields the same fingerprint"""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "resume.txt").write_text("Education\nB.S. Industrial Technology")
+    monkeypatch.setattr(config, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+
+    bot = ResumeBot()
+    first = bot.snapshot
+    second = bot.reload_knowledge()
+    assert second.fingerprint == first.fingerprint
+    assert second.chunks[0] is first.chunks[0]  # Chunks of unchanged documents are reused
+    print("✅ Unchanged documents keep their fingerprint")
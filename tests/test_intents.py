@@ -0,0 +1,75 @@
+"""
+Tests for the local intent pre-classifier
+
+These tests can run without an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot import metrics
+from brandon_bot.intents import CONFIDENTIAL, CONTACT, POLICY_RESPONSES, IntentClassifier
+
+classifier = IntentClassifier(threshold=0.9)
+
+
+def test_contact_requests_are_detected():
+    """Test that requests for contact details get the contact policy"""
+    for question in ("What is Brandon's email?", "How can I contact Brandon?", "Can I call him?",
+                     "Any way to get hold of him directly?", "Where does he live?"):
+        intent = classifier.classify(question)
+        assert intent is not None and intent.name == CONTACT, question
+        assert intent.response == POLICY_RESPONSES[CONTACT]
+    print("✅ Contact requests are detected")
+
+
+def test_confidential_questions_are_detected():
+    """Test that questions about confidential Apple matters get the confidentiality policy"""
+    for question in ("What are the code names of the Apple programs he worked on?", "How big is the budget for his team at Apple?",
+                     "Which Apple factories has he been to?", "Tell me about the confidential projects at his job",
+                     "What is Apple's budget for his program?", "How much does Apple spend on test equipment?",
+                     "What are Apple's internal policies?"):
+        intent = classifier.classify(question)
+        assert intent is not None and intent.name == CONFIDENTIAL, question
+    print("✅ Confidential questions are detected")
+
+
+def test_ordinary_questions_reach_the_model():
+    """Test that resume questions - including ones about Apple or email tools - are not intercepted"""
+    for question in ("What does Brandon do at Apple?", "What programming languages does he know?",
+                     "Has he built email tools?", "What projects has he done?", "Tell me more",
+                     "What is his phone screen availability?", "Which teams at Apple did he work with?",
+                     "What is his email marketing experience?", "What is his number one strength?",
+                     "Tell me about his contact center automation work", "Can I call him for an interview?",
+                     "What projects did Brandon lead at Apple?", "Did he manage suppliers or vendors at Apple?",
+                     "Does he know how to build internal tooling for work?",
+                     "What is the secret to his success at work?", "Did he reduce costs at Apple?",
+                     "How did he cut costs at Apple by 20%?"):
+        assert classifier.classify(question) is None, question
+    print("✅ Ordinary questions are left to the model")
+
+
+def test_bot_answers_policy_intents_without_the_model(monkeypatch):
+    """Test that the bot returns the policy response and records the trigger"""
+    from brandon_bot.bot import resume_bot
+    from brandon_bot.knowledge import KnowledgeSnapshot
+    from brandon_bot.retrieval import BM25Index
+
+    class NoModel:
+        """Agent stand-in that fails the test if the model is called"""
+
+    monkeypatch.setattr(resume_bot, "snapshot",
+                        KnowledgeSnapshot({}, [], BM25Index([]), None, "", NoModel(), "intents"))
+    before = metrics.INTENT_TRIGGERS.value(intent=CONTACT)
+
+    resume_bot.start_new_conversation("intent-visitor")
+    answer = resume_bot.generate_response("What's Brandon's phone number?", "intent-visitor")
+    assert answer == POLICY_RESPONSES[CONTACT]
+    assert metrics.INTENT_TRIGGERS.value(intent=CONTACT) == before + 1
+    assert resume_bot.sessions.get("intent-visitor").memory.turns[-1]["content"] == answer
+
+    resume_bot.end_conversation("intent-visitor")
+    print("✅ Policy intents are answered locally")
@@ -0,0 +1,35 @@
+"""
+Tests for lazy initialization
+
+Each check runs in a fresh interpreter so earlier imports can't mask the result.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+def _loaded_modules_after(statement: str) -> set:
+    """Return the top-level modules imported by a statement in a fresh interpreter"""
+    code = (
+        f"import sys; sys.path.insert(0, {SRC_DIR!r}); {statement}; "
+        "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_package_import_is_lightweight():
+    """Test that importing the package doesn't pull in heavy dependencies"""
+    loaded = _loaded_modules_after("import brandon_bot, brandon_bot.config")
+    assert not loaded & {"gradio", "agents", "PyPDF2", "docx", "numpy"}
+    print("✅ Package import skips heavy dependencies")
+
+
+def test_bot_module_import_has_no_side_effects():
+    """Test that importing the bot module doesn't build the bot"""
+    loaded = _loaded_modules_after("import brandon_bot.bot as bot; assert bot._resume_bot is None")
+    assert "agents" not in loaded
+    print("✅ Bot module import is side-effect free")
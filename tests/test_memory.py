@@ -0,0 +1,69 @@
+"""
+Tests for bounded conversation memory
+
+These tests don't need an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.memory import ConversationMemory
+
+
+def test_old_turns_fold_into_summary():
+    """Test that exchanges beyond the limit become summary lines"""
+    memory = ConversationMemory(max_exchanges=2)
+    for i in range(5):
+        memory.add_exchange(f"Question {i}?", f"Answer {i}. More detail follows here.")
+
+    assert len(memory.turns) == 4
+    assert memory.turns[0]["content"] == "Question 3?"
+    assert len(memory.summary_lines) == 3
+    assert "Question 0?" in memory.summary and "Answer 0." in memory.summary
+    assert "More detail" not in memory.summary
+    print("✅ Old turns are folded into the summary")
+
+
+def test_byte_cap_is_enforced():
+    """Test that a session never holds much more than max_bytes"""
+    memory = ConversationMemory(max_exchanges=100, max_bytes=2000, summary_max_chars=500)
+    for i in range(50):
+        memory.add_exchange(f"Question {i}", "x" * 300)
+
+    assert memory.size_bytes <= 2000
+    assert memory.total_exchanges == 50
+
+    # Non-ASCII text counts by its encoded size, not its length
+    memory = ConversationMemory(max_exchanges=100, max_bytes=2000, summary_max_chars=500)
+    for i in range(50):
+        memory.add_exchange(f"Question {i}", "é" * 300)
+    assert memory.size_bytes <= 2000
+    print("✅ Per-session byte cap is enforced")
+
+
+def test_input_items_respect_token_budget():
+    """Test that only the newest turns that fit the budget are sent"""
+    memory = ConversationMemory(max_exchanges=10)
+    for i in range(6):
+        memory.add_exchange(f"Question {i}", "y" * 400)  # ~100 tokens per answer
+
+    items = memory.input_items(token_budget=250)
+    assert [item["role"] for item in items] == ["user", "assistant", "user", "assistant"]
+    assert items[-2]["content"] == "Question 5"
+    print("✅ Input items respect the token budget")
+
+
+def test_summary_is_sent_first():
+    """Test that the running summary leads the input items"""
+    memory = ConversationMemory(max_exchanges=1)
+    memory.add_exchange("What languages?", "Python.")
+    memory.add_exchange("Which tools?", "Tableau.")
+
+    items = memory.input_items(token_budget=1000)
+    assert items[0]["role"] == "system"
+    assert "What languages?" in items[0]["content"]
+    assert items[1] == {"role": "user", "content": "Which tools?"}
+    print("✅ Summary precedes recent turns")
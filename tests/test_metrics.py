@@ -0,0 +1,72 @@
+"""
+Tests for the Prometheus-style metrics registry and endpoint
+"""
+
+import os
+import sys
+import urllib.request
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot import metrics
+from brandon_bot.bot import resume_bot
+from brandon_bot.cache import make_cache_key
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.retrieval import BM25Index
+
+
+def test_exposition_format():
+    """Test counters, gauges and cumulative histogram buckets in text format"""
+    registry = metrics.Registry()
+    requests = registry.counter("demo_requests_total", "Requests", ["source"])
+    in_flight = registry.gauge("demo_in_flight", "In flight")
+    latency = registry.histogram("demo_latency_seconds", "Latency", buckets=(0.1, 1.0))
+    registry.callback("demo_entries", "Entries", "gauge", lambda: {(): 3})
+
+    requests.inc(source="cache")
+    requests.inc(2, source="model")
+    in_flight.set(4)
+    in_flight.dec()
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    text = registry.render()
+    assert "# TYPE demo_requests_total counter" in text
+    assert 'demo_requests_total{source="model"} 2' in text
+    assert "demo_in_flight 3" in text
+    assert 'demo_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "demo_latency_seconds_count 3" in text
+    assert "demo_latency_seconds_sum 5.55" in text
+    assert "demo_entries 3" in text
+    print("✅ Metrics render in Prometheus text format")
+
+
+def test_bot_turns_are_recorded_and_served(monkeypatch):
+    """Test that a cached turn shows up on the /metrics endpoint"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "metrics-fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    question = "What are Brandon's technical skills?"
+    resume_bot.answer_cache.put(make_cache_key(question, "metrics-fingerprint"), "Python and SQL.")
+    before = metrics.REQUESTS.value(source="cache")
+
+    resume_bot.start_new_conversation("metrics-visitor")
+    assert resume_bot.generate_response(question, "metrics-visitor") == "Python and SQL."
+    assert metrics.REQUESTS.value(source="cache") == before + 1
+    assert metrics.REQUEST_LATENCY.count(mode="sync", source="cache") >= 1
+
+    server = metrics.start_metrics_server(0)
+    try:
+        port = server.server_address[1]
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode("utf-8")
+    finally:
+        metrics.stop_metrics_server()
+    assert 'brandon_bot_requests_total{source="cache"}' in body
+    assert 'brandon_bot_cache_hits_total{tier="exact"}' in body
+    assert "brandon_bot_in_flight_requests 0" in body
+
+    resume_bot.end_conversation("metrics-visitor")
+    resume_bot.answer_cache.clear()
+    print("✅ Bot turns are exported on /metrics")
@@ -0,0 +1,107 @@
+"""
+Tests for the offline mock model backend
+
+These tests run without an API key or network access.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from agents import Agent
+
+from brandon_bot.bot import TRUNCATED_NOTICE, resume_bot
+from brandon_bot.config import Config, config
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.mock_model import FALLBACK_ANSWER, MockModel, compose_answer
+from brandon_bot.resilience import ResiliencePolicy
+from brandon_bot.retrieval import BM25Index
+
+EXCERPTS = ("Brandon worked at Acme as a data engineer for four years. "
+            "Brandon knows Python and SQL very well. He studied computer science at State University.")
+
+
+def _mock_snapshot(model: MockModel) -> KnowledgeSnapshot:
+    agent = Agent(name="Mock", instructions=EXCERPTS, model=model)
+    return KnowledgeSnapshot({}, [], BM25Index([]), None, EXCERPTS, agent, "mock-fingerprint")
+
+
+def test_answers_are_deterministic_and_document_derived():
+    """Test that answers quote the best-matching sentences and are stable"""
+    answer = compose_answer("What languages does Brandon know?", [EXCERPTS])
+    assert answer == "Based on Brandon's documents: Brandon knows Python and SQL very well."
+    assert compose_answer("What languages does Brandon know?", [EXCERPTS]) == answer
+    assert compose_answer("Does he play guitar?", [EXCERPTS]) == FALLBACK_ANSWER
+    print("✅ Mock answers are deterministic and document-derived")
+
+
+def test_validate_does_not_need_a_key_for_mock(monkeypatch):
+    """Test that the mock backend works without OPENAI_API_KEY"""
+    monkeypatch.setattr(Config, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(Config, "MODEL_BACKEND", "mock")
+    assert config.validate()
+    assert resume_bot._create_agent("instructions") is not None
+
+    monkeypatch.setattr(Config, "MODEL_BACKEND", "openai")
+    assert resume_bot._create_agent("instructions") is None
+    print("✅ Mock backend needs no API key")
+
+
+def test_full_bot_path_runs_offline(monkeypatch):
+    """Test streamed and non-streamed turns through the SDK Runner with the mock model"""
+    model = MockModel(latency_ms=1, token_latency_ms=0, seed=7)
+    monkeypatch.setattr(resume_bot, "snapshot", _mock_snapshot(model))
+    monkeypatch.setattr(config, "ENABLE_ANSWER_CACHE", False)
+    resume_bot.start_new_conversation("offline-visitor")
+
+    answer = resume_bot.generate_response("Where did Brandon study computer science?", "offline-visitor")
+    assert answer == "Based on Brandon's documents: He studied computer science at State University."
+
+    async def stream():
+        return [delta async for delta in resume_bot.stream_response("What languages does Brandon know?", "offline-visitor")]
+
+    deltas = resume_bot.run_sync(stream())
+    assert len(deltas) > 1 and "".join(deltas).startswith("Based on Brandon's documents")
+    session = resume_bot.sessions.get("offline-visitor")
+    assert session.request_count == 2 and session.output_tokens > 0
+    assert model.calls == 2
+
+    resume_bot.end_conversation("offline-visitor")
+    print("✅ Full bot path runs offline")
+
+
+def test_injected_errors_are_retried_then_degraded(monkeypatch):
+    """Test that injected model failures are retried, then answered with the degraded message"""
+    model = MockModel(latency_ms=0, error_rate=1.0)
+    monkeypatch.setattr(resume_bot, "snapshot", _mock_snapshot(model))
+    monkeypatch.setattr(resume_bot, "resilience", ResiliencePolicy(max_retries=2, retry_base=0.01, hedge=False))
+    monkeypatch.setattr(config, "ENABLE_ANSWER_CACHE", False)
+    answer = resume_bot.generate_response("What languages does Brandon know?", "failing-visitor")
+    assert answer.startswith("I'm having trouble reaching my AI service")
+    assert model.calls == 3
+    resume_bot.end_conversation("failing-visitor")
+    print("✅ Injected errors are retried, then degraded")
+
+
+def test_stalled_stream_keeps_partial_answer(monkeypatch):
+    """Test that a stream stalling after its first tokens ends with a separate cut-off notice"""
+    model = MockModel(latency_ms=1, token_latency_ms=500, seed=7)
+    monkeypatch.setattr(resume_bot, "snapshot", _mock_snapshot(model))
+    monkeypatch.setattr(resume_bot, "resilience", ResiliencePolicy(idle_timeout=0.1, hedge=False))
+    monkeypatch.setattr(config, "ENABLE_ANSWER_CACHE", False)
+    resume_bot.start_new_conversation("stalled-visitor")
+
+    async def stream():
+        return [delta async for delta in resume_bot.stream_response("What languages does Brandon know?", "stalled-visitor")]
+
+    deltas = resume_bot.run_sync(stream())
+    assert len(deltas) >= 2 and deltas[-1] == TRUNCATED_NOTICE
+    partial = "".join(deltas[:-1]).strip()
+    assert partial and "apologize" not in partial
+    session = resume_bot.sessions.get("stalled-visitor")
+    assert session.memory.turns[-1]["content"] == partial
+
+    resume_bot.end_conversation("stalled-visitor")
+    print("✅ Stalled streams keep the partial answer")
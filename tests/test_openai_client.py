@@ -0,0 +1,73 @@
+"""
+Tests for the pooled OpenAI client
+
+These tests can run without an API key - no request leaves the process.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.openai_client import OpenAIClientPool, PooledOpenAIProvider
+
+
+def test_one_client_per_event_loop(monkeypatch):
+    """Test that a loop reuses its client and another loop gets its own"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pool = OpenAIClientPool(max_connections=7, max_keepalive_connections=3, keepalive_expiry=90)
+
+    async def two_lookups():
+        return pool.get(), pool.get()
+
+    first, again = asyncio.run(two_lookups())
+    assert first is again
+    second, _ = asyncio.run(two_lookups())
+    assert second is not first
+    # The first loop is closed, so its client was dropped
+    assert len(pool) == 1 and pool.created == 2
+
+    limits = second._client._transport._pool
+    assert limits._max_connections == 7
+    assert limits._max_keepalive_connections == 3
+    assert limits._keepalive_expiry == 90
+    print("✅ One pooled client per event loop")
+
+
+def test_provider_models_use_the_pooled_client(monkeypatch):
+    """Test that models from the provider share the current loop's client"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pool = OpenAIClientPool()
+    provider = PooledOpenAIProvider(pool, "gpt-test")
+
+    async def build():
+        return provider.get_model(None), provider.get_model("other-model"), pool.get()
+
+    default_model, other_model, client = asyncio.run(build())
+    assert default_model.model == "gpt-test" and other_model.model == "other-model"
+    assert default_model._client is client and other_model._client is client
+    print("✅ Provider models use the pooled client")
+
+
+def test_close_reaches_clients_on_running_loops(monkeypatch):
+    """Test that close() closes a client whose loop runs in another thread"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pool = OpenAIClientPool()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def lookup():
+        return pool.get()
+
+    client = asyncio.run_coroutine_threadsafe(lookup(), loop).result(5)
+    pool.close()
+    assert client.is_closed() and len(pool) == 0
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+    print("✅ Close reaches clients on running loops")
@@ -0,0 +1,74 @@
+"""
+Tests for the SQLite-backed persistent answer cache
+"""
+
+import os
+import sys
+import threading
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.persistent_cache import PersistentAnswerCache
+
+
+def test_answers_shared_between_instances(tmp_path):
+    """Test that one worker's completions are visible to another and survive a restart"""
+    path = str(tmp_path / "answers.sqlite3")
+    first = PersistentAnswerCache(path)
+    second = PersistentAnswerCache(path)
+
+    first.put("key-1", "fp", "What does Brandon do?", "He builds data products.")
+    first.flush()
+    assert second.get("key-1") == "He builds data products."
+    assert second.get("missing") is None
+    assert second.stats()["hits"] == 1
+
+    first.close()
+    second.close()
+    restarted = PersistentAnswerCache(path)
+    assert restarted.get("key-1") == "He builds data products."
+    assert restarted.recent("fp", 10) == [("What does Brandon do?", "He builds data products.")]
+    restarted.close()
+    print("✅ Answers are shared across instances and restarts")
+
+
+def test_concurrent_writes_are_batched_and_bounded(tmp_path):
+    """Test that concurrent writers all land and the row budget is enforced"""
+    cache = PersistentAnswerCache(str(tmp_path / "answers.sqlite3"), max_entries=50)
+
+    def write(worker):
+        for i in range(20):
+            cache.put(f"key-{worker}-{i}", "fp", f"question {i}", f"answer {worker}-{i}")
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.flush()
+
+    assert len(cache) == 50
+    # Newly written answers push out the least recently used ones
+    cache.put("latest", "fp", "question", "latest answer")
+    cache.flush()
+    assert len(cache) == 50 and cache.get("latest") == "latest answer"
+    cache.close()
+    print("✅ Concurrent writes are batched and bounded")
+
+
+def test_discard_fingerprint_and_ttl(tmp_path):
+    """Test that answers for stale knowledge and expired answers are dropped"""
+    cache = PersistentAnswerCache(str(tmp_path / "answers.sqlite3"))
+    cache.put("old", "fp-old", "q", "old answer")
+    cache.put("new", "fp-new", "q", "new answer")
+    cache.discard_fingerprint("fp-old")
+    cache.flush()
+    assert cache.get("old") is None
+    assert cache.get("new") == "new answer"
+    cache.close()
+
+    expiring = PersistentAnswerCache(str(tmp_path / "answers.sqlite3"), ttl_seconds=1e-9)
+    assert expiring.get("new") is None
+    expiring.close()
+    print("✅ Stale and expired answers are dropped")
@@ -0,0 +1,93 @@
+"""
+Tests for the privacy and confidentiality filter
+
+These tests can run without an API key.
+"""
+
+import os
+import random
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.privacy import (
+    CONFIDENTIAL_PLACEHOLDER,
+    CONTACT_PLACEHOLDER,
+    DEFAULT_CONFIDENTIAL_TERMS,
+    PrivacyFilter,
+    _trie_pattern,
+)
+
+privacy_filter = PrivacyFilter(DEFAULT_CONFIDENTIAL_TERMS + ("Project Titan", "Project Purple"))
+
+ANSWER = ("Brandon led Project Titan tooling for 3 years. Reach him at brandon.tom@example.com "
+          "or (555) 123-4567, or visit 1 Infinite Loop. In 2019 he shipped 12 internal tools.")
+
+
+def test_contact_details_are_redacted_in_place():
+    """Test that emails, phones and addresses are replaced without dropping the answer"""
+    result = privacy_filter.redact(ANSWER)
+    assert "example.com" not in result.text and "123-4567" not in result.text
+    assert "Infinite Loop" not in result.text
+    assert result.text.count(CONTACT_PLACEHOLDER) == 3
+    assert result.text.startswith("Brandon led")
+    assert "In 2019 he shipped 12 internal tools." in result.text
+    assert result.counts == {"term": 1, "email": 1, "phone": 1, "address": 1}
+    print("✅ Contact details are redacted span by span")
+
+
+def test_street_words_in_ordinary_sentences_are_kept():
+    """Test that Place, Way, Loop, Court and Circle only count as a street in an address shape"""
+    for sentence in ("He won 2 First Place awards at hackathons.",
+                     "Improved yield by 15 Percent On Loop tests across the line.",
+                     "He found 3 New Way forward for the team."):
+        assert privacy_filter.redact(sentence).text == sentence, sentence
+    for address in ("Visit 1 Infinite Loop, Cupertino.", "He lived at 42 Oak Court 95014 for years.",
+                    "Mail 7 Elm Way Apt 2 today", "He lives at 12 Main Street near the park"):
+        assert privacy_filter.redact(address).counts == {"address": 1}, address
+    print("✅ Street words in ordinary sentences are kept")
+
+
+def test_confidential_terms_match_case_and_spacing():
+    """Test that configured terms match regardless of case and whitespace"""
+    result = privacy_filter.redact("He worked on PROJECT  purple, marked Apple Confidential.")
+    assert result.text == f"He worked on {CONFIDENTIAL_PLACEHOLDER}, marked {CONFIDENTIAL_PLACEHOLDER}."
+    assert not privacy_filter.redact("A project timeline at Apple.").redacted
+    print("✅ Confidential terms are redacted")
+
+
+def test_trie_pattern_shares_prefixes():
+    """Test that terms with a common prefix compile into one branch"""
+    pattern = _trie_pattern(["code name", "codename"])
+    assert pattern == r"code(?:\s+name|name)"
+    print("✅ Term lists compile into a trie")
+
+
+def test_streaming_matches_whole_text_at_any_chunking():
+    """Test that streamed redaction equals redacting the whole answer, however it is split"""
+    expected = privacy_filter.redact(ANSWER).text
+    chunking = random.Random(7)
+    for _ in range(200):
+        redactor = privacy_filter.stream()
+        output, position = "", 0
+        while position < len(ANSWER):
+            size = chunking.randint(1, 8)
+            output += redactor.feed(ANSWER[position:position + size])
+            position += size
+        output += redactor.finish()
+        assert output == expected
+    print("✅ Streamed redaction is chunking-independent")
+
+
+def test_partial_matches_are_never_shown():
+    """Test that half-typed contact details are held back while streaming"""
+    redactor = privacy_filter.stream()
+    shown = redactor.feed("Email brandon.tom@exa")
+    shown += redactor.feed("mple.com or call 555 123 ")
+    assert "brandon.tom" not in shown and "555" not in shown
+    shown += redactor.feed("4567 today ")
+    shown += redactor.finish()
+    assert shown == f"Email {CONTACT_PLACEHOLDER} or call {CONTACT_PLACEHOLDER} today "
+    assert redactor.counts == {"email": 1, "phone": 1}
+    print("✅ Partial matches are held back")
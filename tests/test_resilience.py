@@ -0,0 +1,132 @@
+"""
+Tests for model-call resilience: deadlines, retries, hedging and the circuit breaker
+
+These tests can run without an API key.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.resilience import CLOSED, OPEN, ModelUnavailable, ResiliencePolicy
+
+
+class Flaky(ConnectionError):
+    """Stand-in for a dropped connection"""
+
+
+def test_timeouts_and_retries():
+    """Test that a stuck attempt times out and is retried, and that failures end in ModelUnavailable"""
+    policy = ResiliencePolicy(attempt_timeout=0.05, deadline=2, retry_base=0.01, hedge=False, seed=1)
+    calls = []
+
+    async def stuck_then_ok():
+        calls.append(time.perf_counter())
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return "answer"
+
+    assert asyncio.run(policy.call(stuck_then_ok)) == "answer"
+    assert len(calls) == 2 and policy.retries == {"timeout": 1}
+
+    async def always_down():
+        raise Flaky("connection reset")
+
+    with pytest.raises(ModelUnavailable) as error:
+        asyncio.run(policy.call(always_down))
+    assert error.value.reason == "connection"
+    assert policy.retries["connection"] == 2
+
+    async def bad_request():
+        raise ValueError("not retryable")
+
+    retries = dict(policy.retries)
+    with pytest.raises(ValueError):
+        asyncio.run(policy.call(bad_request))
+    assert policy.retries == retries
+    print("✅ Timeouts and retries work")
+
+
+def test_hedged_request_wins_over_slow_attempt():
+    """Test that an attempt slower than the recent p95 is hedged and the faster answer wins"""
+    policy = ResiliencePolicy(hedge_min_samples=5, hedge_min_delay=0.01, seed=1)
+    for _ in range(20):
+        policy.latency["call"].observe(0.02)
+    calls = []
+
+    async def first_slow():
+        calls.append(len(calls))
+        await asyncio.sleep(5 if len(calls) == 1 else 0.01)
+        return f"answer {len(calls)}"
+
+    start = time.perf_counter()
+    assert asyncio.run(policy.call(first_slow)) == "answer 2"
+    assert time.perf_counter() - start < 1
+    assert policy.hedges == {"fired": 1, "won": 1}
+    print("✅ Hedged request wins over a slow attempt")
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test that repeated failures open the circuit, and a successful probe closes it again"""
+    policy = ResiliencePolicy(max_retries=0, hedge=False, failure_threshold=3, reset_seconds=0.05)
+    healthy = False
+
+    async def api():
+        if not healthy:
+            raise Flaky("connection refused")
+        return "answer"
+
+    for _ in range(3):
+        with pytest.raises(ModelUnavailable):
+            asyncio.run(policy.call(api))
+    assert policy.breaker.state == OPEN
+
+    # Rejected right away while open, without calling the API
+    with pytest.raises(ModelUnavailable) as error:
+        asyncio.run(policy.call(api))
+    assert error.value.reason == "circuit_open"
+
+    time.sleep(0.06)
+    healthy = True
+    assert asyncio.run(policy.call(api)) == "answer"
+    assert policy.breaker.state == CLOSED and policy.breaker.times_opened == 1
+    print("✅ Circuit breaker opens and recovers")
+
+
+def test_streams_retry_before_first_token_only():
+    """Test that a stream is retried until it produces, and that an idle stream is cut off"""
+    policy = ResiliencePolicy(attempt_timeout=0.05, idle_timeout=0.05, retry_base=0.01, hedge=False)
+    attempts = []
+
+    async def deltas():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise Flaky("reset before the first token")
+        for word in ("Brandon ", "knows ", "Python"):
+            yield word
+        if len(attempts) == 3:
+            await asyncio.sleep(10)
+
+    async def collect():
+        return [delta async for delta in policy.stream(deltas)]
+
+    assert asyncio.run(collect()) == ["Brandon ", "knows ", "Python"]
+    assert len(attempts) == 2
+
+    # A stall after the first token can't be retried - the visitor has already seen it
+    async def stalled():
+        received = []
+        with pytest.raises(Exception) as error:
+            async for delta in policy.stream(deltas):
+                received.append(delta)
+        return received, error.value
+
+    received, error = asyncio.run(stalled())
+    assert received == ["Brandon ", "knows ", "Python"] and "deadline" in str(error)
+    print("✅ Streams retry before the first token only")
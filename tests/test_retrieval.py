@@ -0,0 +1,52 @@
+"""
+Tests for section-aware chunking and BM25 retrieval
+
+These tests run on small inline documents and don't need an API key.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.retrieval import BM25Index, chunk_document, tokenize
+
+SAMPLE_RESUME = """Jane Doe
+Experience
+Acme Corp | Program Manager | 2020 - Present
+Led procurement of capital equipment across global factories.
+Built Python scripts and Tableau dashboards to automate reporting.
+Education
+State University | B.S. Industrial Technology | 2015
+Skills
+Python, Tableau, Excel, Mandarin Chinese
+"""
+
+
+def test_tokenize_drops_stopwords():
+    """Test that tokenization lowercases and removes filler words"""
+    assert tokenize("What programming languages does Brandon know?") == ["programming", "languages", "know"]
+    print("✅ Tokenizer drops stopwords")
+
+
+def test_chunks_follow_sections():
+    """Test that chunks start at section headings and respect the size limit"""
+    chunks = chunk_document("resume.txt", SAMPLE_RESUME, max_chars=120)
+    assert len(chunks) > 1
+    assert all(chunk.doc_name == "resume.txt" for chunk in chunks)
+    assert any(chunk.section.startswith("Education") for chunk in chunks)
+    assert all(len(chunk.text) <= 120 + len(chunk.section) + 1 for chunk in chunks)
+    print(f"✅ Split sample resume into {len(chunks)} chunks")
+
+
+def test_bm25_ranks_relevant_chunk_first():
+    """Test that the matching section is the top search result"""
+    chunks = chunk_document("resume.txt", SAMPLE_RESUME, max_chars=120)
+    index = BM25Index(chunks)
+
+    top_chunk, score = index.search("Where did she study industrial technology?", top_k=1)[0]
+    assert "State University" in top_chunk.text
+    assert score > 0
+    assert index.search("quantum chromodynamics") == []
+    print("✅ BM25 ranks the education section first")
@@ -0,0 +1,81 @@
+"""
+Tests for per-session conversation state
+
+These tests don't need an API key - they only exercise session bookkeeping.
+"""
+
+import os
+import sys
+import time
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.sessions import SessionManager
+from brandon_bot.bot import resume_bot
+
+
+def test_sessions_are_isolated():
+    """Test that two sessions keep separate histories"""
+    manager = SessionManager(max_sessions=10, ttl_seconds=60)
+    alice = manager.get_or_create("alice")
+    bob = manager.get_or_create("bob")
+
+    alice.record_exchange("hi", "hello")
+    assert len(alice.conversation_history) == 2
+    assert bob.conversation_history == []
+    assert manager.get_or_create("alice") is alice
+    print("✅ Sessions are isolated")
+
+
+def test_lru_limit():
+    """Test that the least recently used session is evicted past the limit"""
+    manager = SessionManager(max_sessions=2, ttl_seconds=60)
+    manager.get_or_create("a")
+    manager.get_or_create("b")
+    manager.get("a")  # "b" is now least recently used
+    manager.get_or_create("c")
+
+    assert "a" in manager and "c" in manager
+    assert "b" not in manager
+    assert manager.evictions == 1
+    print("✅ LRU limit enforced")
+
+
+def test_idle_ttl_eviction():
+    """Test that idle sessions expire"""
+    manager = SessionManager(max_sessions=10, ttl_seconds=0.05)
+    manager.get_or_create("idle")
+    time.sleep(0.1)
+
+    assert manager.get("idle") is None
+    assert len(manager) == 0
+    print("✅ Idle sessions expire")
+
+
+def test_start_replaces_session_state():
+    """Test that restarting a session clears its history and counters"""
+    manager = SessionManager()
+    session = manager.get_or_create("visitor")
+    session.record_exchange("q", "a")
+    session.record_usage(100, 20)
+
+    fresh = manager.start("visitor")
+    assert fresh.conversation_history == []
+    assert fresh.input_tokens == 0
+    print("✅ Restarted session is fresh")
+
+
+def test_bot_sessions_do_not_cross_talk():
+    """Test that resetting one visitor's session leaves others alone"""
+    resume_bot.start_new_conversation("visitor-1")
+    resume_bot.start_new_conversation("visitor-2")
+    resume_bot.sessions.get("visitor-1").record_exchange("q", "a")
+
+    resume_bot.reset_conversation("visitor-2")
+    assert len(resume_bot.sessions.get("visitor-1").conversation_history) == 2
+
+    resume_bot.end_conversation("visitor-1")
+    resume_bot.end_conversation("visitor-2")
+    assert "visitor-1" not in resume_bot.sessions
+    print("✅ Bot sessions don't cross-talk")
@@ -0,0 +1,130 @@
+"""
+Tests for coalescing identical in-flight questions
+
+These tests don't need an API key - the model call is replaced by a fake.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.bot import resume_bot
+from brandon_bot.knowledge import KnowledgeSnapshot
+from brandon_bot.retrieval import BM25Index
+from brandon_bot.singleflight import SingleFlight
+
+
+async def _collect(flight):
+    return "".join([chunk async for chunk in flight.subscribe()])
+
+
+def test_concurrent_subscribers_share_one_call():
+    """Test that every waiter receives the full stream of a single producer"""
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        for word in ["Python ", "and ", "SQL."]:
+            await asyncio.sleep(0.01)
+            yield word
+
+    async def scenario():
+        group = SingleFlight()
+        joined = [group.join("key", produce) for _ in range(5)]
+        assert [leader for _, leader in joined] == [True, False, False, False, False]
+        results = await asyncio.gather(*(_collect(flight) for flight, _ in joined))
+        await asyncio.sleep(0)
+        return results, group
+
+    results, group = asyncio.run(scenario())
+    assert results == ["Python and SQL."] * 5
+    assert len(calls) == 1 and len(group) == 0
+    assert group.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+    print("✅ Concurrent subscribers share one call")
+
+
+def test_leader_disconnect_keeps_flight_alive():
+    """Test that cancelling the first request doesn't cancel the shared call"""
+    async def produce():
+        await asyncio.sleep(0.05)
+        yield "answer"
+
+    async def scenario():
+        group = SingleFlight()
+        flight, _ = group.join("key", produce)
+        leader = asyncio.ensure_future(_collect(flight))
+        follower = asyncio.ensure_future(_collect(group.join("key", produce)[0]))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower, flight
+
+    answer, flight = asyncio.run(scenario())
+    assert answer == "answer" and not flight.cancelled
+    print("✅ Leader disconnects don't cancel the shared call")
+
+
+def test_flight_cancelled_when_everyone_leaves_and_errors_propagate():
+    """Test that an abandoned call is cancelled and producer errors reach all waiters"""
+    async def slow():
+        await asyncio.sleep(10)
+        yield "never"
+
+    async def broken():
+        raise ValueError("model unavailable")
+        yield  # pragma: no cover
+
+    async def scenario():
+        group = SingleFlight()
+        flight, _ = group.join("slow", slow)
+        waiter = asyncio.ensure_future(_collect(flight))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.01)
+        assert flight.cancelled and flight.task.done()
+        # A new request after cancellation starts a fresh call
+        assert group.join("slow", slow)[1] is True
+
+        failing, _ = group.join("broken", broken)
+        outcomes = await asyncio.gather(_collect(failing), _collect(failing), return_exceptions=True)
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+        for flight in list(group._flights.values()):
+            flight.task.cancel()
+
+    asyncio.run(scenario())
+    print("✅ Abandoned calls are cancelled and errors propagate")
+
+
+def test_bot_coalesces_identical_first_turns(monkeypatch):
+    """Test that a burst of the same opening question triggers one model call"""
+    snapshot = KnowledgeSnapshot({}, [], BM25Index([]), None, "", object(), "flight-fingerprint")
+    monkeypatch.setattr(resume_bot, "snapshot", snapshot)
+    monkeypatch.setattr(resume_bot, "persistent_cache", None)
+    monkeypatch.setattr(resume_bot, "semantic_cache", None)
+    calls = []
+
+    async def fake_run_agent(snapshot, session, user_message, trace_name):
+        calls.append(user_message)
+        await asyncio.sleep(0.05)
+        session.record_usage(100, 20)
+        return "He knows Python."
+
+    monkeypatch.setattr(resume_bot, "_run_agent", fake_run_agent)
+    question = "What programming languages does Brandon know?"
+    visitors = [f"burst-{i}" for i in range(5)]
+
+    async def burst():
+        return await asyncio.gather(*(resume_bot._generate_response_async(question, visitor) for visitor in visitors))
+
+    answers = resume_bot.run_sync(burst())
+    assert answers == ["He knows Python."] * 5
+    assert len(calls) == 1
+    assert all(len(resume_bot.sessions.get(visitor).conversation_history) == 2 for visitor in visitors)
+    assert sum(resume_bot.sessions.get(visitor).input_tokens for visitor in visitors) == 100
+
+    for visitor in visitors:
+        resume_bot.end_conversation(visitor)
+    resume_bot.answer_cache.clear()
+    print("✅ Identical first turns are coalesced")
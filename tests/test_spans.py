@@ -0,0 +1,124 @@
+"""
+Tests for per-stage turn timings
+
+These tests can run without an API key.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot import metrics, spans
+from brandon_bot.config import config
+
+
+def test_nested_spans_record_exclusive_time():
+    """Test that a nested span is subtracted from its parent"""
+    turn = spans.TurnTimer("s1", "question")
+    with turn.span("prompt"):
+        with turn.span("retrieval"):
+            time.sleep(0.02)
+    breakdown = turn.breakdown()
+    assert breakdown["retrieval"] >= 15
+    assert breakdown["prompt"] < 10
+    print("✅ Nested spans record exclusive time")
+
+
+def test_ring_buffer_keeps_recent_turns():
+    """Test that the turn log is bounded and lists the slowest turns first"""
+    log = spans.TurnLog(capacity=3)
+    for index, total in enumerate([0.5, 0.1, 0.9, 0.3]):
+        turn = spans.TurnTimer("s1", f"q{index}")
+        turn.total = total
+        log.record(turn)
+    assert len(log) == 3
+    assert [turn.question for turn in log.recent()] == ["q3", "q2", "q1"]
+    assert [turn.question for turn in log.slowest(2)] == ["q2", "q3"]
+    assert "'q2'" in log.render(2)
+    print("✅ Turn log is a bounded ring buffer")
+
+
+def test_timed_excludes_consumer_time():
+    """Test that timed() charges only the waits for the next item"""
+    async def produce():
+        for item in ("a", "b"):
+            await asyncio.sleep(0.01)
+            yield item
+
+    async def consume():
+        turn = spans.start_turn("s1", "question")
+        async for _ in spans.timed(produce(), "model"):
+            with spans.span("serialization"):
+                await asyncio.sleep(0.05)
+        turn.finish("model")
+        return turn
+
+    turn = asyncio.run(consume())
+    breakdown = turn.breakdown()
+    assert 15 <= breakdown["model"] < 90
+    assert breakdown["serialization"] >= 90
+    assert spans.TURN_LOG.recent(1)[0] is turn
+    print("✅ Streamed stages exclude consumer time")
+
+
+def test_chat_turn_stages_are_recorded(monkeypatch):
+    """Test a Gradio turn end to end: stages, session attachment and the debug view"""
+    from types import SimpleNamespace
+
+    from agents import Agent
+
+    from brandon_bot.bot import get_resume_bot
+    from brandon_bot.chat_interface_simple import GREETING, chat_function
+    from brandon_bot.knowledge import KnowledgeSnapshot
+    from brandon_bot.mock_model import MockModel
+    from brandon_bot.retrieval import BM25Index
+
+    bot = get_resume_bot()
+    instructions = "Brandon knows Python and SQL very well."
+    agent = Agent(name="Mock", instructions=instructions, model=MockModel(latency_ms=20, token_latency_ms=0))
+    monkeypatch.setattr(bot, "snapshot", KnowledgeSnapshot({}, [], BM25Index([]), None, instructions, agent, "spans"))
+    monkeypatch.setattr(bot, "persistent_cache", None)
+    request = SimpleNamespace(session_hash="spans-visitor", headers={}, client=None)
+
+    async def chat():
+        history = [{"role": "assistant", "content": GREETING}]
+        async for history, _ in chat_function("What languages does he know?", history, request):
+            pass
+
+    asyncio.run(chat())
+    turn = spans.TURN_LOG.recent(1)[0]
+    assert turn.session_id == "spans-visitor" and turn.outcome == "model"
+    breakdown = turn.breakdown()
+    for stage in ("validation", "cache", "prompt", "model", "privacy_filter", "serialization"):
+        assert stage in breakdown
+    assert breakdown["model"] >= 15
+    assert turn.first_token is not None and turn.first_token <= turn.total
+
+    session = bot.sessions.get("spans-visitor")
+    assert session.turn_timings[-1]["trace_name"] == session.trace_name
+
+    server = metrics.start_metrics_server(0)
+    try:
+        port = server.server_address[1]
+        # Off by default: the view quotes visitor questions
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/debug/turns", timeout=5)
+        assert error.value.code == 404
+        monkeypatch.setattr(config, "ENABLE_DEBUG_TURNS", True)
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/debug/turns?limit=5", timeout=5).read().decode("utf-8")
+    finally:
+        metrics.stop_metrics_server()
+    assert "What languages does he know?" in body and "privacy_filter" in body
+
+    bot.end_conversation("spans-visitor")
+    bot.answer_cache.clear()
+    bot.semantic_cache.clear()
+    print("✅ Chat turns record their stage breakdown")
@@ -0,0 +1,55 @@
+"""
+Tests for the local hashed n-gram vector index
+
+These tests don't need an API key or network access.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from brandon_bot.retrieval import Chunk
+from brandon_bot.vector_index import VectorIndex, embed_texts
+
+CHUNKS = [
+    Chunk("resume.txt", "Skills", "Python, Tableau and Excel for data analysis and automation", 0),
+    Chunk("resume.txt", "Education", "B.S. Industrial Technology from Cal Poly San Luis Obispo", 1),
+    Chunk("resume.txt", "Hobbies", "Enjoys hiking, cooking and photography on weekends", 2),
+]
+
+
+def test_embeddings_are_normalized_and_stable():
+    """Test that embeddings are unit length float32 and deterministic"""
+    first = embed_texts(["python automation"], dim=256)
+    second = embed_texts(["python automation"], dim=256)
+    assert first.dtype == np.float32
+    assert np.isclose(np.linalg.norm(first[0]), 1.0)
+    assert np.array_equal(first, second)
+    print("✅ Embeddings are normalized and stable")
+
+
+def test_search_finds_related_chunk():
+    """Test that morphological variants still match (automating ~ automation)"""
+    index = VectorIndex.build(CHUNKS, dim=512)
+    top_chunk, score = index.search("automating analyses in python", top_k=1)[0]
+    assert top_chunk.section == "Skills"
+    assert score > 0
+    print("✅ Vector search finds the related chunk")
+
+
+def test_persisted_matrix_is_memory_mapped(tmp_path):
+    """Test that a saved index is reloaded with mmap instead of rebuilt"""
+    built = VectorIndex.load_or_build(CHUNKS, str(tmp_path), dim=512)
+    loaded = VectorIndex.load_or_build(CHUNKS, str(tmp_path), dim=512)
+
+    assert isinstance(loaded.matrix, np.memmap)
+    assert np.allclose(built.matrix, loaded.matrix)
+
+    # A different corpus must not reuse the stale matrix
+    rebuilt = VectorIndex.load_or_build(CHUNKS[:2], str(tmp_path), dim=512)
+    assert rebuilt.matrix.shape == (2, 512)
+    print("✅ Persisted matrix is memory-mapped")